@@ -1,10 +1,13 @@
-from flask import Flask
+from flask import Flask, Response
 from flask_cors import CORS, cross_origin
-from flask_sqlalchemy import SQLAlchemy
+from flask_migrate import Migrate
+from prometheus_client import CONTENT_TYPE_LATEST
 
+from app.db_routing import RoutingSQLAlchemy
 from config import Config
 
-db = SQLAlchemy()
+db = RoutingSQLAlchemy()
+migrate = Migrate()
 app = Flask(__name__)
 cors = CORS(app)
 
@@ -17,27 +20,55 @@ def create_app():
     app.config.from_object(get_environment_config())
     app.config["CORS_HEADERS"] = "Content-Type"
 
-    # Initialize database connection
-    db.init_app(app)
-
+    from app import db_pool, db_routing
+    from app.async_executor import async_executor
     from app.custom_graphql_view import CustomGraphQLView
+    from app.data_version import data_version_cache
+    from app.events.services.event_service import event_cache
+    from app.metrics import render as render_metrics
     from app.schema import schema
+    from app.startup import readiness
+    from app.tickets.export import export_tickets
+    from app.tickets.services.hold_sweeper import hold_sweeper
+    from app.tickets.services.inventory_allocator import inventory_allocator
+    from app.tickets.services.rollup_compactor import rollup_compactor
+
+    # Initialize database connection; the schema is managed by migrations
+    db_pool.init_app(app)
+    db.init_app(app)
+    db_routing.init_app(app)
+    migrate.init_app(app, db)
+
+    async_executor.init_app(app)
+    data_version_cache.init_app(app)
+    event_cache.init_app(app)
+    hold_sweeper.init_app(app)
+    inventory_allocator.init_app(app)
+    rollup_compactor.init_app(app)
 
     app.add_url_rule(
         "/graphql/v1",
         view_func=CustomGraphQLView.as_view("graphql", schema=schema, graphiql=True),
     )
 
-    @app.before_first_request
-    def initialize_database():
-        """Creates database tables on first request."""
-        db.create_all()
-
     @app.teardown_appcontext
     def shutdown_session(exception=None):
         """Removes the database session at the end of the request."""
         db.session.remove()
 
+    @app.route("/metrics")
+    def metrics():
+        """Exposes the metrics of every worker, or of this one, in the Prometheus text format."""
+        return Response(render_metrics(), content_type=CONTENT_TYPE_LATEST)
+
+    # Streams the attendee list of an event as NDJSON or CSV
+    app.add_url_rule(
+        "/events/<int:event_id>/tickets/export", view_func=export_tickets
+    )
+
+    # Reports whether this worker finished its warm-up and accepts traffic
+    app.add_url_rule("/ready", view_func=readiness)
+
     @app.route("/")
     @cross_origin()
     def test():
@@ -0,0 +1,217 @@
+"""
+ASGI entry point serving the Flask application from an asyncio event loop.
+
+Usage: uvicorn --factory app.asgi:create_asgi_app --host 0.0.0.0 --port 5000
+"""
+import asyncio
+import io
+import sys
+import threading
+
+from app.async_executor import async_executor
+from app.startup import start_background_tasks, startup
+
+# Response chunks buffered between the worker thread and the event loop
+RESPONSE_QUEUE_SIZE = 8
+
+
+class _RequestBody(io.RawIOBase):
+    """
+    wsgi.input pulling the rest of a request body from the ASGI receive channel
+    as the application reads it, instead of buffering it whole beforehand.
+    """
+
+    def __init__(self, first_message, receive, loop):
+        self._receive = receive
+        self._loop = loop
+        self._buffer = b""
+        self._more = True
+        self._consume(first_message)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._buffer and self._more:
+            # Runs on a pool thread: wait for the next chunk on the event loop
+            self._consume(
+                asyncio.run_coroutine_threadsafe(self._receive(), self._loop).result()
+            )
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def _consume(self, message):
+        if message["type"] == "http.disconnect":
+            self._more = False
+            return
+        self._buffer = message.get("body", b"")
+        self._more = message.get("more_body", False)
+
+
+class ASGIApplication:
+    """
+    Serves the WSGI Flask application, and through it the GraphQL schema, over ASGI.
+
+    Connections are handled on the event loop, so idle clients no longer pin an
+    OS thread. Request and response bodies are passed through in chunks rather
+    than buffered, which keeps streamed exports in constant memory. Each request is then run
+    through the unchanged Flask pipeline (persisted queries, document cache, cost
+    limits, error handling) in the bounded AsyncExecutor pool, because the
+    database layer only does blocking I/O. The pool size caps concurrent
+    database sessions; requests beyond it queue without holding a thread.
+    """
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")
+
+        # The first chunk is awaited on the loop, so idle clients hold no thread
+        loop = asyncio.get_running_loop()
+        body = io.BufferedReader(_RequestBody(await receive(), receive, loop))
+        environ = self._build_environ(scope, body)
+
+        queue = asyncio.Queue(maxsize=RESPONSE_QUEUE_SIZE)
+        stopped = threading.Event()
+        worker = asyncio.ensure_future(
+            async_executor.run(self._run_wsgi, environ, loop, queue, stopped)
+        )
+        finished = False
+        try:
+            while not finished:
+                message = await queue.get()
+                finished = message is None
+                if not finished:
+                    await send(message)
+        finally:
+            if not finished:
+                # The client went away: stop the worker and unblock its pending put
+                stopped.set()
+                while not queue.empty():
+                    queue.get_nowait()
+        await worker
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                # Warm up before the server starts accepting connections
+                await async_executor.run(startup.start, self.flask_app)
+                start_background_tasks(self.flask_app)
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                async_executor.shutdown(wait=True)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    def _build_environ(scope, body):
+        """
+        Translates an ASGI HTTP scope into a PEP 3333 WSGI environ.
+        """
+        server_name, server_port = scope.get("server") or ("localhost", 80)
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+            "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+            "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+            "SERVER_NAME": server_name,
+            "SERVER_PORT": str(server_port),
+            "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": body,
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": True,
+            "wsgi.run_once": False,
+        }
+        if scope.get("client"):
+            environ["REMOTE_ADDR"] = scope["client"][0]
+
+        for raw_name, raw_value in scope.get("headers", []):
+            name = raw_name.decode("latin-1").upper().replace("-", "_")
+            value = raw_value.decode("latin-1")
+            if name not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+                name = f"HTTP_{name}"
+            if name in environ:
+                value = f"{environ[name]},{value}"
+            environ[name] = value
+
+        if "CONTENT_LENGTH" not in environ:
+            # Chunked bodies end when the receive channel says so
+            environ["wsgi.input_terminated"] = True
+        return environ
+
+    def _run_wsgi(self, environ, loop, queue, stopped):
+        """
+        Runs the WSGI application on a pool thread and hands its response to the
+        event loop chunk by chunk, so streamed bodies are never held whole.
+
+        The whole response is iterated on this one thread, which keeps the
+        request context and database session of streaming generators valid.
+        The bounded queue blocks the thread while the client lags behind.
+        """
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            response["status"] = int(status.split(" ", 1)[0])
+            response["headers"] = [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in headers
+            ]
+
+        def put(message):
+            if stopped.is_set():
+                return False
+            asyncio.run_coroutine_threadsafe(queue.put(message), loop).result()
+            return True
+
+        def start():
+            return put(
+                {
+                    "type": "http.response.start",
+                    "status": response["status"],
+                    "headers": response["headers"],
+                }
+            )
+
+        try:
+            iterable = self.flask_app.wsgi_app(environ, start_response)
+            try:
+                started = False
+                for chunk in iterable:
+                    if not chunk:
+                        continue
+                    if not started:
+                        started = True
+                        if not start():
+                            return
+                    if not put(
+                        {"type": "http.response.body", "body": chunk, "more_body": True}
+                    ):
+                        return
+                if not started and not start():
+                    return
+                put({"type": "http.response.body", "body": b"", "more_body": False})
+            finally:
+                if hasattr(iterable, "close"):
+                    iterable.close()
+        finally:
+            put(None)
+
+
+def create_asgi_app():
+    """
+    Creates the Flask application and wraps it for ASGI servers.
+    """
+    from app import create_app
+
+    return ASGIApplication(create_app())
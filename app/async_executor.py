@@ -0,0 +1,59 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AsyncExecutor:
+    """
+    Bounded thread pool that runs blocking work for asyncio callers.
+
+    SQLAlchemy 1.3 and PyMySQL only do blocking I/O, so database work cannot run on
+    the event loop itself. Coroutines hand it to this pool instead and the loop
+    keeps serving other clients; calls beyond the pool size wait in its queue,
+    which caps the number of concurrent database sessions.
+    """
+
+    def __init__(self, max_workers=32):
+        self.max_workers = max_workers
+        self._app = None
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """
+        Configures the pool size from the application settings.
+        """
+        self.max_workers = app.config.get("ASYNC_THREAD_POOL_SIZE", 32)
+        self._app = app
+
+    @property
+    def pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="async-executor"
+                )
+            return self._pool
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Runs a blocking callable in the pool and awaits its result.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.pool, functools.partial(func, *args, **kwargs)
+        )
+
+    def shutdown(self, wait=True):
+        """
+        Stops the pool; a new one is created on the next call.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+
+# Shared by the ASGI entry point and its lifespan hooks
+async_executor = AsyncExecutor()
@@ -0,0 +1,44 @@
+import pytest
+from flask import Flask
+
+from app import db
+from app.data_version import data_version_cache
+from app.events.models.event_model import Event  # noqa: F401
+from app.events.services.event_service import event_cache
+from app.tickets.models.ticket_hold_model import TicketHold  # noqa: F401
+from app.tickets.models.ticket_model import Ticket  # noqa: F401
+from app.tickets.services.rollup_buffer import rollup_buffer
+
+
+# Aplicación aislada sobre un SQLite en archivo para pruebas de servicios reales
+@pytest.fixture
+def sqlite_app(tmp_path):
+    test_app = Flask(__name__)
+    test_app.config.from_object("config.Config")
+    test_app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    db.init_app(test_app)
+    event_cache.init_app(test_app)
+    data_version_cache.init_app(test_app)
+    # Never flush rollups buffered by a previous test into this database
+    rollup_buffer.drain()
+
+    with test_app.app_context():
+        db.create_all()
+        yield test_app
+        db.session.remove()
+        db.drop_all()
+        db.get_engine().dispose()
+
+
+# Cliente HTTP con la vista GraphQL registrada sobre la aplicación SQLite
+@pytest.fixture
+def graphql_client(sqlite_app):
+    from app.custom_graphql_view import CustomGraphQLView, document_cache
+    from app.schema import schema
+
+    sqlite_app.add_url_rule(
+        "/graphql/v1",
+        view_func=CustomGraphQLView.as_view("graphql", schema=schema),
+    )
+    document_cache.clear()
+    return sqlite_app.test_client()
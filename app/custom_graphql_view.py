@@ -1,6 +1,33 @@
-from flask import jsonify
+import json
+import time
+from contextlib import nullcontext
+
+from flask import Response, current_app, request
 from flask_graphql import GraphQLView
 from graphql import GraphQLError
+from graphql.execution import ExecutionResult
+from graphql.execution.middleware import MiddlewareManager
+from graphql_server import HttpQueryError, format_execution_result, get_graphql_params
+
+from app.db_routing import read_replica, use_primary
+from app.document_cache import DocumentCache, hash_query
+from app.graphql_metrics import (
+    SKIP_METRICS_KEY,
+    ResolverMetricsMiddleware,
+    operation_name,
+    record_operation,
+)
+from app.events.graphql.event_loader import EventLoader
+from app.events.services.event_service import EventService
+from app.http_cache import cache_control, compute_etag, is_cacheable
+from app.query_cost import QueryCostAnalyzer
+from app.response_encoding import compress, encode, negotiate
+from app.sql_profiler import profile
+from app.tickets.graphql.ticket_loader import TicketsByEventLoader
+from config import Config
+
+# Parsed and validated documents shared by every request handled by this process
+document_cache = DocumentCache(max_size=Config.GRAPHQL_DOCUMENT_CACHE_SIZE)
 
 
 class BadRequestException(GraphQLError):
@@ -11,19 +38,309 @@ class BadRequestException(GraphQLError):
     pass
 
 
+class NotModified(Exception):
+    """
+    Raised when a cacheable operation's ETag matches the request's If-None-Match.
+    """
+
+    def __init__(self, headers):
+        super().__init__("Not Modified")
+        self.headers = headers
+
+
 class CustomGraphQLView(GraphQLView):
     """
     Custom GraphQL view to handle exceptions and return a JSON response with status code 400
     when a BadRequestException is raised.
     """
 
-    def execute_graphql_request(self, *args, **kwargs):
+    backend = document_cache
+    # ETag and Cache-Control of the response, set for cacheable GET operations
+    cache_headers = None
+
+    def get_context(self):
+        """
+        Builds the per-request GraphQL context. DataLoaders are created fresh for
+        every request so their batching and caching never leak between requests.
+        """
+        return {
+            "request": request,
+            "event_loader": EventLoader(),
+            "tickets_by_event_loader": TicketsByEventLoader(),
+        }
+
+    def get_middleware(self):
+        """
+        Adds the resolver metrics middleware to any middleware given to the view,
+        except for synthetic requests flagged with SKIP_METRICS_KEY.
+
+        Resolver results are not wrapped in promises: graphql-core would otherwise
+        turn every synchronous field into a Promise and triple the execution time.
+        """
+        middleware = list(self.middleware or [])
+        if not request.environ.get(SKIP_METRICS_KEY):
+            sample_rate = current_app.config["GRAPHQL_METRICS_SCALAR_SAMPLE_RATE"]
+            middleware.insert(0, ResolverMetricsMiddleware(sample_rate))
+        return MiddlewareManager(*middleware, wrap_in_promise=False)
+
+    def parse_body(self):
+        """
+        Parses the request parameters, resolving automatic persisted queries.
+
+        A client may send only extensions.persistedQuery.sha256Hash; the query text
+        is then looked up in the document cache. Sending the query together with
+        its hash registers it.
+        """
+        data = super().parse_body()
+        if not isinstance(data, dict):
+            return data
+
+        extensions = data.get("extensions") or request.args.get("extensions")
+        if isinstance(extensions, str):
+            try:
+                extensions = json.loads(extensions)
+            except ValueError:
+                raise BadRequestException("Extensions are invalid JSON.")
+        persisted_query = (extensions or {}).get("persistedQuery")
+        if not persisted_query:
+            return data
+
+        query_hash = persisted_query.get("sha256Hash")
+        query = data.get("query") or request.args.get("query")
+        if query:
+            if hash_query(query) != query_hash:
+                raise BadRequestException("provided sha does not match query")
+            return data
+
+        query = self.backend.get_query(self.schema, query_hash)
+        if query is None:
+            raise BadRequestException("PersistedQueryNotFound")
+        return dict(data, query=query)
+
+    def dispatch_request(self):
         try:
-            # Attempt to execute the GraphQL request
-            result = super().execute_graphql_request(*args, **kwargs)
-            return result
+            # GraphiQL is rendered as a plain HTML string
+            response = current_app.make_response(self.execute_graphql_request())
+        except NotModified as e:
+            response = Response(status=304, headers=e.headers)
+        except HttpQueryError as e:
+            response = Response(
+                self.encode({"errors": [self.format_error(e)]}),
+                status=e.status_code,
+                headers=e.headers,
+                content_type="application/json",
+            )
         except BadRequestException as e:
             # Capture BadRequestException and return a 400 error
-            response = jsonify({"errors": [{"message": str(e)}], "data": None})
-            response.status_code = 400
+            response = Response(
+                self.encode({"errors": [{"message": str(e)}], "data": None}),
+                status=400,
+                content_type="application/json",
+            )
+        return self.compress_response(response)
+
+    def encode(self, data, pretty=False):
+        """
+        Serializes a response with the encoder selected by GRAPHQL_JSON_ENCODER.
+        """
+        return encode(data, current_app.config["GRAPHQL_JSON_ENCODER"], pretty)
+
+    def compress_response(self, response):
+        """
+        Compresses bodies of at least GRAPHQL_COMPRESSION_MIN_SIZE bytes with the
+        best coding the client accepts. A compressed response gets its own ETag,
+        since a strong validator identifies the exact bytes sent.
+        """
+        min_size = current_app.config["GRAPHQL_COMPRESSION_MIN_SIZE"]
+        if min_size <= 0:
+            return response
+        response.vary.add("Accept-Encoding")
+        if response.direct_passthrough or response.status_code == 304:
+            return response
+
+        body = response.get_data()
+        if len(body) < min_size:
             return response
+        coding = negotiate(request.accept_encodings)
+        if coding is None:
+            return response
+
+        response.set_data(compress(body, coding))
+        response.headers["Content-Encoding"] = coding
+        etag, weak = response.get_etag()
+        if etag:
+            response.set_etag(f"{etag}-{coding}", weak)
+        return response
+
+    def execute_graphql_request(self):
+        """
+        Executes a single GraphQL operation and builds the HTTP response.
+        """
+        request_method = request.method.lower()
+        if request_method not in ("get", "post"):
+            raise HttpQueryError(
+                405,
+                "GraphQL only supports GET and POST requests.",
+                headers={"Allow": "GET, POST"},
+            )
+
+        data = self.parse_body()
+        if not isinstance(data, dict):
+            raise HttpQueryError(400, "Batch GraphQL requests are not enabled.")
+
+        show_graphiql = request_method == "get" and self.should_display_graphiql()
+        params = get_graphql_params(data, request.args)
+        if not params.query:
+            if show_graphiql:
+                return self.render_graphiql(params=params, result=None)
+            raise HttpQueryError(400, "Must provide query string.")
+
+        config = current_app.config
+        conditional = (
+            request_method == "get"
+            and not show_graphiql
+            and config["GRAPHQL_HTTP_CACHE"]
+            # Profiled responses report timings, so equal data is not an equal body
+            and not config["GRAPHQL_SQL_PROFILING"]
+        )
+        result = self.execute_operation(params, request_method, conditional)
+
+        response, status_code = format_execution_result(result, self.format_error)
+        if result.extensions:
+            response["extensions"] = result.extensions
+        pretty = self.pretty or show_graphiql or request.args.get("pretty")
+        body = self.encode(response, pretty=pretty)
+
+        if show_graphiql:
+            return self.render_graphiql(params=params, result=body)
+        headers = self.cache_headers if not result.errors else None
+        return Response(
+            body, status=status_code, headers=headers, content_type="application/json"
+        )
+
+    def execute_operation(self, params, request_method, conditional=False):
+        """
+        Resolves the cached document, enforces the cost budget and executes it.
+
+        When conditional, a query that only reads events and tickets is tagged
+        with an ETag derived from the data version, and NotModified is raised
+        instead of executing it if the client already holds that version.
+
+        With GRAPHQL_SQL_PROFILING on, the statements, database time and rows of
+        the execution are reported in extensions.sql, along with statement shapes
+        repeated often enough to suggest an N+1 query.
+        """
+        try:
+            document = self.get_backend().document_from_string(
+                self.schema, params.query
+            )
+        except Exception as e:
+            return ExecutionResult(errors=[e], invalid=True)
+
+        operation_type = document.get_operation_type(params.operation_name)
+        if request_method == "get":
+            if operation_type and operation_type != "query":
+                raise HttpQueryError(
+                    405,
+                    f"Can only perform a {operation_type} operation from a POST request.",
+                    headers={"Allow": "POST"},
+                )
+
+        cost = self.check_query_cost(document, params)
+
+        # Queries may read from a replica; mutations read and write on the primary
+        if operation_type == "query":
+            route = read_replica()
+        else:
+            use_primary()
+            route = nullcontext()
+
+        config = current_app.config
+        if conditional and is_cacheable(document.document_ast, params.operation_name):
+            # Read the version from the copy the query will be served from
+            with read_replica():
+                self.check_not_modified(document, params)
+
+        profiling = profile() if config["GRAPHQL_SQL_PROFILING"] else nullcontext()
+        started = time.perf_counter()
+        try:
+            with route, profiling as sql:
+                result = document.execute(
+                    operation_name=params.operation_name,
+                    variable_values=params.variables,
+                    root_value=self.get_root_value(),
+                    context_value=self.get_context(),
+                    middleware=self.get_middleware(),
+                )
+        except Exception as e:
+            result = ExecutionResult(errors=[e], invalid=True)
+        if not request.environ.get(SKIP_METRICS_KEY):
+            record_operation(
+                operation_name(document, params.operation_name),
+                operation_type,
+                time.perf_counter() - started,
+                bool(result.errors),
+            )
+        if result.invalid:
+            return result
+
+        result.extensions["cost"] = cost
+        if sql is not None:
+            result.extensions["sql"] = sql.as_dict(
+                config["GRAPHQL_SQL_REPEAT_THRESHOLD"]
+            )
+        return result
+
+    def check_not_modified(self, document, params):
+        """
+        Sets the validators of a cacheable operation and raises NotModified when
+        the If-None-Match of the request matches them.
+        """
+        etag = compute_etag(
+            params.query,
+            params.operation_name,
+            params.variables,
+            EventService.get_data_version(),
+            pretty=self.pretty or request.args.get("pretty"),
+        )
+        self.cache_headers = {
+            "ETag": f'"{etag}"',
+            "Cache-Control": cache_control(
+                operation_name(document, params.operation_name), current_app.config
+            ),
+        }
+        # Compressed copies of the body carry the coding in their ETag
+        for tag in (etag, f"{etag}-gzip", f"{etag}-br"):
+            if request.if_none_match.contains(tag):
+                raise NotModified(dict(self.cache_headers, ETag=f'"{tag}"'))
+
+    def check_query_cost(self, document, params):
+        """
+        Rejects operations over the depth or cost budget before any resolver runs.
+        """
+        config = current_app.config
+        analyzer = QueryCostAnalyzer(
+            self.schema,
+            default_page_size=config["GRAPHQL_DEFAULT_PAGE_SIZE"],
+            max_page_size=config["GRAPHQL_MAX_PAGE_SIZE"],
+            default_list_size=config["GRAPHQL_DEFAULT_LIST_SIZE"],
+        )
+        cost = analyzer.analyze(
+            document.document_ast, params.operation_name, params.variables
+        )
+
+        if cost.depth > config["GRAPHQL_MAX_QUERY_DEPTH"]:
+            raise BadRequestException(
+                f"Query depth {cost.depth} exceeds the maximum of "
+                f"{config['GRAPHQL_MAX_QUERY_DEPTH']}."
+            )
+        if cost.cost > config["GRAPHQL_MAX_QUERY_COST"]:
+            raise BadRequestException(
+                f"Query cost {cost.cost} exceeds the maximum of "
+                f"{config['GRAPHQL_MAX_QUERY_COST']}."
+            )
+        return {
+            "requested": cost.cost,
+            "maximum": config["GRAPHQL_MAX_QUERY_COST"],
+            "depth": cost.depth,
+        }
@@ -0,0 +1,69 @@
+"""
+Per-worker cache of the data version that validates cached HTTP responses.
+"""
+import threading
+import time
+
+from sqlalchemy import event
+
+from app.db_routing import RoutingSession, written_tables
+
+# Tables whose changes alter the responses of cacheable queries
+TRACKED_TABLES = frozenset(["events", "tickets"])
+
+
+class DataVersionCache:
+    """
+    Keeps the data version for GRAPHQL_DATA_VERSION_TTL seconds, so conditional
+    GETs and their 304s do not aggregate the events table on every request.
+
+    Commits of this worker that write events or tickets drop the cached value
+    at once; writes made through other workers show up within the TTL. Nothing
+    is added to the write path beyond that in-memory invalidation.
+    """
+
+    def __init__(self, ttl=1):
+        self.ttl = ttl
+        self._value = None
+        self._expires_at = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """
+        Configures the TTL from the application settings.
+        """
+        self.ttl = app.config.get("GRAPHQL_DATA_VERSION_TTL", 1)
+        self.clear()
+
+    def get_or_load(self, loader):
+        """
+        Returns the cached version, calling loader() when it is missing or expired.
+        """
+        with self._lock:
+            if self._value is not None and self._expires_at > time.monotonic():
+                return self._value
+            generation = self._generation
+
+        value = loader()
+        with self._lock:
+            # A commit while loading may have changed the data again: keep it uncached
+            if generation == self._generation:
+                self._value = value
+                self._expires_at = time.monotonic() + self.ttl
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._value = None
+            self._generation += 1
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _invalidate_version(session):
+    if written_tables(session) & TRACKED_TABLES:
+        data_version_cache.clear()
+
+
+# Per-worker cache, configured by create_app
+data_version_cache = DataVersionCache()
@@ -0,0 +1,84 @@
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from app.metrics import LATENCY_BUCKETS
+
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled database connection, including connecting.",
+    ["pool"],
+    buckets=LATENCY_BUCKETS,
+)
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after waiting pool_timeout seconds.",
+    ["pool"],
+)
+# Pool gauges describe one worker, so each live worker is reported under a pid label
+POOL_IN_USE = Gauge(
+    "db_pool_connections_in_use",
+    "Connections currently checked out.",
+    ["pool"],
+    multiprocess_mode="liveall",
+)
+POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections open beyond pool_size, up to max_overflow.",
+    ["pool"],
+    multiprocess_mode="liveall",
+)
+POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured number of persistent connections.",
+    ["pool"],
+    multiprocess_mode="liveall",
+)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that publishes checkout wait time, in-use and overflow counts.
+
+    The pool is labelled with the engine's pool_logging_name, "default" if unset.
+    """
+
+    def __init__(self, creator, *args, **kwargs):
+        super().__init__(creator, *args, **kwargs)
+        self.metric_name = self._orig_logging_name or "default"
+        POOL_SIZE.labels(self.metric_name).set(self.size())
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.labels(self.metric_name).inc()
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.labels(self.metric_name).observe(
+                time.perf_counter() - started
+            )
+            self._publish_usage()
+
+    def _do_return_conn(self, conn):
+        super()._do_return_conn(conn)
+        self._publish_usage()
+
+    def _publish_usage(self):
+        POOL_IN_USE.labels(self.metric_name).set(self.checkedout())
+        POOL_OVERFLOW.labels(self.metric_name).set(max(self.overflow(), 0))
+
+
+def init_app(app):
+    """
+    Uses the instrumented pool for engines configured with a pool size.
+    """
+    options = app.config.get("SQLALCHEMY_ENGINE_OPTIONS") or {}
+    if "pool_size" in options and "poolclass" not in options:
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            **options,
+            "poolclass": InstrumentedQueuePool,
+        }
@@ -0,0 +1,187 @@
+"""
+Routing of read-only work to replica binds, with read-your-writes stickiness.
+
+Everything goes to the primary unless it runs inside read_replica() during a
+request. Even then it stays on the primary when the request already wrote,
+when it is executing a mutation, or when the client wrote within the last
+DB_PRIMARY_STICKY_SECONDS (tracked with a cookie), so a buyer always reads the
+ticket they just bought.
+"""
+import functools
+import random
+import time
+from contextlib import contextmanager
+
+from flask import current_app, has_request_context, request
+from flask_sqlalchemy import SignallingSession, SQLAlchemy, get_state
+from sqlalchemy import event, inspect, orm
+from sqlalchemy.sql.dml import UpdateBase
+
+# Cookie holding the time until which the client reads from the primary
+STICKY_COOKIE = "db_primary_until"
+# Session.info key of the tables written by the current transaction
+WRITTEN_TABLES_KEY = "written_tables"
+
+
+def _routing_state():
+    """
+    Routing flags of the current request, or None outside of a request.
+
+    Kept in the WSGI environ rather than flask.g, which in Flask 1.x lives on
+    the app context and may outlive a single request.
+    """
+    if not has_request_context():
+        return None
+    return request.environ.setdefault("app.db_routing", {})
+
+
+class RoutingSession(SignallingSession):
+    """
+    Session that sends reads to the replica bind chosen by read_replica().
+    """
+
+    def get_bind(self, mapper=None, clause=None):
+        state = _routing_state()
+        if not self._flushing and state and not state.get("primary_only"):
+            bind_key = state.get("replica_bind")
+            if bind_key is not None:
+                return get_state(self.app).db.get_engine(self.app, bind=bind_key)
+        return super().get_bind(mapper, clause)
+
+    def execute(self, clause, *args, **kwargs):
+        if isinstance(clause, UpdateBase):
+            mark_write()
+            written_tables(self).add(clause.table.name)
+        return super().execute(clause, *args, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_flush_as_write(session, flush_context):
+    mark_write()
+    tables = written_tables(session)
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        tables.add(inspect(instance).mapper.local_table.name)
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _forget_written_tables(session, transaction):
+    if transaction.parent is None:
+        session.info.pop(WRITTEN_TABLES_KEY, None)
+
+
+class RoutingSQLAlchemy(SQLAlchemy):
+    """
+    Flask-SQLAlchemy extension using RoutingSession.
+    """
+
+    def create_session(self, options):
+        return orm.sessionmaker(class_=RoutingSession, db=self, **options)
+
+    def create_engine(self, sa_url, engine_opts):
+        # Tell the pools of the primary and each replica apart in the pool metrics
+        engine_opts = dict(engine_opts)
+        engine_opts.setdefault(
+            "pool_logging_name", f"{sa_url.host or 'local'}/{sa_url.database}"
+        )
+        return super().create_engine(sa_url, engine_opts)
+
+
+def init_app(app):
+    """
+    Registers the hooks that keep clients on the primary right after they write.
+    """
+
+    @app.before_request
+    def load_primary_stickiness():
+        try:
+            primary_until = float(request.cookies.get(STICKY_COOKIE, 0))
+        except ValueError:
+            primary_until = 0
+        if primary_until > time.time():
+            use_primary()
+
+    @app.after_request
+    def store_primary_stickiness(response):
+        if _routing_state().get("wrote"):
+            seconds = current_app.config["DB_PRIMARY_STICKY_SECONDS"]
+            response.set_cookie(
+                STICKY_COOKIE,
+                str(int(time.time() + seconds)),
+                max_age=seconds,
+                httponly=True,
+            )
+        return response
+
+
+def mark_write():
+    """
+    Pins the rest of the request, and the client for a short window, to the primary.
+    """
+    state = _routing_state()
+    if state is not None:
+        state["wrote"] = True
+        state["primary_only"] = True
+
+
+def pinned_to_primary():
+    """
+    Tells whether the current request must read from the primary, because it
+    wrote or the client wrote within the last DB_PRIMARY_STICKY_SECONDS.
+    """
+    state = _routing_state()
+    return bool(state and state.get("primary_only"))
+
+
+def written_tables(session):
+    """
+    Names of the tables the current transaction of a session inserted into,
+    updated or deleted from, so far.
+    """
+    return session.info.setdefault(WRITTEN_TABLES_KEY, set())
+
+
+def use_primary():
+    """
+    Keeps the rest of the request on the primary, e.g. while executing a mutation.
+    """
+    state = _routing_state()
+    if state is not None:
+        state["primary_only"] = True
+
+
+@contextmanager
+def read_replica():
+    """
+    Routes the queries inside the block to a replica when it is safe to do so.
+    """
+    replicas = current_app.config.get("DATABASE_REPLICA_BINDS") or []
+    state = _routing_state()
+    if (
+        not replicas
+        or state is None
+        or state.get("primary_only")
+        or state.get("replica_bind")
+    ):
+        yield
+        return
+
+    # One replica per request, so its reads see a single consistent copy
+    state.setdefault("replica", random.choice(replicas))
+    state["replica_bind"] = state["replica"]
+    try:
+        yield
+    finally:
+        state["replica_bind"] = None
+
+
+def reads_from_replica(func):
+    """
+    Decorates a read-only service method so it runs inside read_replica().
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with read_replica():
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,105 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import partial
+
+from graphql import parse, validate
+from graphql.backend.base import GraphQLBackend, GraphQLDocument
+from graphql.execution import ExecutionResult, execute
+
+
+def hash_query(query):
+    """
+    Returns the SHA-256 hex digest used to identify a query document.
+    """
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def _execute_validated(schema, document_ast, validation_errors, *args, **kwargs):
+    """
+    Executes a document whose validation result was computed when it was cached.
+    """
+    if validation_errors:
+        return ExecutionResult(errors=validation_errors, invalid=True)
+    return execute(schema, document_ast, *args, **kwargs)
+
+
+class DocumentCache(GraphQLBackend):
+    """
+    GraphQL backend that keeps parsed and validated documents in a bounded LRU cache.
+
+    Documents are keyed by the SHA-256 of the query text, so the same hash also
+    serves automatic persisted queries: clients can send only the hash once the
+    full query has been registered.
+    """
+
+    def __init__(self, max_size=1000):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._documents = OrderedDict()
+        self._lock = threading.Lock()
+
+    def document_from_string(self, schema, request_string):
+        """
+        Returns the cached document for the query, parsing and validating it on a miss.
+        """
+        key = (schema, hash_query(request_string))
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+                self.hits += 1
+                return document
+            self.misses += 1
+
+        # Syntax errors propagate and are never cached
+        document_ast = parse(request_string)
+        validation_errors = validate(schema, document_ast)
+        document = GraphQLDocument(
+            schema=schema,
+            document_string=request_string,
+            document_ast=document_ast,
+            execute=partial(
+                _execute_validated, schema, document_ast, validation_errors
+            ),
+        )
+
+        with self._lock:
+            self._documents[key] = document
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_size:
+                self._documents.popitem(last=False)
+        return document
+
+    def get_query(self, schema, query_hash):
+        """
+        Returns the query text registered under a persisted query hash, if cached.
+        """
+        with self._lock:
+            document = self._documents.get((schema, query_hash))
+            if document is None:
+                return None
+            self._documents.move_to_end((schema, query_hash))
+            return document.document_string
+
+    def clear(self):
+        """
+        Drops every cached document and resets the counters.
+        """
+        with self._lock:
+            self._documents.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Returns the current size and hit/miss counters of the cache.
+        """
+        with self._lock:
+            return {
+                "size": len(self._documents),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,152 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+
+class InProcessCacheBackend:
+    """
+    Thread-safe LRU cache with per-entry expiry, local to the current process.
+    """
+
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCacheBackend:
+    """
+    Cache shared by every worker, stored in Redis (or any client exposing the
+    get/setex/delete subset of the redis-py API). Expiry is delegated to the server.
+    """
+
+    def __init__(self, client, prefix="cache:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url, prefix="cache:"):
+        # Optional dependency, only required when a shared cache is configured
+        import redis
+
+        return cls(redis.Redis.from_url(url), prefix)
+
+    def get(self, key):
+        payload = self.client.get(f"{self.prefix}{key}")
+        return pickle.loads(payload) if payload is not None else None
+
+    def set(self, key, value, ttl):
+        self.client.setex(f"{self.prefix}{key}", max(int(ttl), 1), pickle.dumps(value))
+
+    def delete(self, key):
+        self.client.delete(f"{self.prefix}{key}")
+
+    def clear(self):
+        # Shared entries expire on their own; never flush a shared server
+        pass
+
+
+class EntityCache:
+    """
+    Read-through cache of entity snapshots with explicit invalidation on writes.
+
+    The backend defaults to an in-process LRU and can be replaced by a shared
+    one through init_app, using the <NAME>_CACHE_* settings of the application.
+    """
+
+    def __init__(self, name, ttl=60, max_size=1024):
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+        self.backend = InProcessCacheBackend(max_size)
+        self.hits = 0
+        self.misses = 0
+
+    def init_app(self, app):
+        """
+        Configures the TTL and backend from the application settings.
+        """
+        prefix = self.name.upper()
+        self.ttl = app.config.get(f"{prefix}_CACHE_TTL", self.ttl)
+        self.max_size = app.config.get(f"{prefix}_CACHE_MAX_SIZE", self.max_size)
+        redis_url = app.config.get(f"{prefix}_CACHE_REDIS_URL")
+        if redis_url:
+            self.backend = RedisCacheBackend.from_url(redis_url, f"{self.name}:")
+        else:
+            self.backend = InProcessCacheBackend(self.max_size)
+
+    def get_or_load(self, key, loader):
+        """
+        Returns the cached value for key, calling loader on a miss.
+        Missing entities (loader returning None) are not cached.
+        """
+        value = self.backend.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = loader(key)
+        if value is not None:
+            self.backend.set(key, value, self.ttl)
+        return value
+
+    def get_many_or_load(self, keys, loader):
+        """
+        Returns a dict of cached values for keys, loading all misses with a single
+        call to loader, which receives the missing keys and returns a dict.
+        """
+        found, missing = {}, []
+        for key in keys:
+            value = self.backend.get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                found[key] = value
+        self.hits += len(found)
+        self.misses += len(missing)
+
+        if missing:
+            for key, value in loader(missing).items():
+                self.backend.set(key, value, self.ttl)
+                found[key] = value
+        return found
+
+    def invalidate(self, key):
+        """
+        Drops the cached value for key after the entity changed.
+        """
+        self.backend.delete(key)
+
+    def clear(self):
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
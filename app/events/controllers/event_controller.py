@@ -14,11 +14,18 @@ class EventController:
         return EventService.create_event(name, start_date, end_date, total_tickets)
 
     @staticmethod
-    def get_all_events(name=None):
+    def create_events(events, chunk_size=500):
         """
-        Retrieves all events, optionally filtering by name.
+        Creates a batch of events, reporting the rows that fail validation.
         """
-        return EventService.get_all_events(name)
+        return EventService.create_events(events, chunk_size)
+
+    @staticmethod
+    def get_all_events(name=None, after_id=None, limit=None):
+        """
+        Retrieves events, optionally filtering by name and paginating by cursor.
+        """
+        return EventService.get_all_events(name, after_id, limit)
 
     @staticmethod
     def get_event_by_id(event_id):
@@ -27,6 +34,13 @@ class EventController:
         """
         return EventService.get_event_by_id(event_id)
 
+    @staticmethod
+    def get_event_stats(event_ids):
+        """
+        Retrieves the sales summary of several events in a single query.
+        """
+        return EventService.get_event_stats(event_ids)
+
     @staticmethod
     def update_event(
         event_id,
@@ -0,0 +1,93 @@
+"""
+Bulk import of events from CSV or JSON files (`manage.py import-events <file>`).
+"""
+import csv
+import json
+import os
+from datetime import date
+
+from flask_script import Command, Option
+
+from app.events.controllers.event_controller import EventController
+from app.events.services.event_service import EVENT_IMPORT_FIELDS, EventImportError
+
+
+def parse_event_row(row):
+    """
+    Converts the text values of a file row into the types expected by create_event.
+    """
+    event = {field: row.get(field) for field in EVENT_IMPORT_FIELDS}
+    for field in ("start_date", "end_date"):
+        if event[field]:
+            try:
+                event[field] = date.fromisoformat(str(event[field]).strip())
+            except ValueError:
+                raise ValueError(f"Invalid {field}: {event[field]!r} (expected YYYY-MM-DD).")
+    if event["total_tickets"] not in (None, ""):
+        try:
+            event["total_tickets"] = int(event["total_tickets"])
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid total_tickets: {event['total_tickets']!r}.")
+    return event
+
+
+def read_event_file(path):
+    """
+    Reads the events of a CSV (with a header row) or JSON (list of objects) file.
+
+    Returns the parsed events and the EventImportError of the rows that could
+    not be parsed, both indexed by their position in the file.
+    """
+    with open(path, newline="") as source:
+        if os.path.splitext(path)[1].lower() == ".json":
+            rows = json.load(source)
+        else:
+            rows = list(csv.DictReader(source))
+
+    events, errors = [], []
+    for index, row in enumerate(rows):
+        try:
+            events.append((index, parse_event_row(row)))
+        except ValueError as e:
+            errors.append(EventImportError(index, e.args[0]))
+    return events, errors
+
+
+class ImportEvents(Command):
+    """
+    Creates the events listed in a CSV or JSON file with a bulk insert.
+
+    CSV files need a header with name, start_date, end_date and total_tickets.
+    Rows that fail validation are reported and skipped; the rest are created.
+    """
+
+    help = description = "Imports events from a CSV or JSON file"
+
+    def get_options(self):
+        return (
+            Option("path", help="CSV or JSON file with the events"),
+            Option("--chunk-size", dest="chunk_size", type=int, default=None),
+        )
+
+    def __call__(self, app, path, chunk_size):
+        events, errors = read_event_file(path)
+        total = len(events) + len(errors)
+        with app.app_context():
+            result = EventController.create_events(
+                [event for _, event in events],
+                chunk_size=chunk_size or app.config["EVENT_IMPORT_CHUNK_SIZE"],
+            )
+        # Map the indexes of the validated batch back to rows of the file
+        errors += [
+            EventImportError(events[error.index][0], error.message)
+            for error in result.errors
+        ]
+
+        for error in sorted(errors):
+            print(f"row {error.index + 1}: {error.message}")
+        rate = result.created / result.elapsed if result.elapsed else 0
+        print(
+            f"Created {result.created} of {total} events in {result.elapsed:.2f}s "
+            f"({rate:.0f} events/s), {len(errors)} rejected."
+        )
+        return 1 if errors else 0
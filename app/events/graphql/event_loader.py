@@ -0,0 +1,15 @@
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from app.events.models.event_model import Event as EventModel
+
+
+class EventLoader(DataLoader):
+    """
+    Batches event lookups by ID into a single IN query per execution level.
+    """
+
+    def batch_load_fn(self, event_ids):
+        events = EventModel.query.filter(EventModel.id.in_(event_ids)).all()
+        events_by_id = {event.id: event for event in events}
+        return Promise.resolve([events_by_id.get(event_id) for event_id in event_ids])
@@ -1,8 +1,10 @@
 import graphene
+from graphene import relay
 from graphene_sqlalchemy import SQLAlchemyObjectType
 
 from app.events.models.event_model import Event as EventModel
-from app.tickets.graphql.ticket_object import TicketObject
+from app.pagination import build_connection, connection_args, decode_cursor, page_size
+from app.tickets.graphql.ticket_object import TicketConnection
 
 
 class EventObject(SQLAlchemyObjectType):
@@ -12,11 +14,29 @@ class EventObject(SQLAlchemyObjectType):
 
     class Meta:
         model = EventModel
+        # Holds, sales rollups and the row version are internal state
+        exclude_fields = ("holds", "sales_rollups", "version")
 
-    tickets = graphene.List(TicketObject)
+    tickets = graphene.Field(TicketConnection, **connection_args())
 
-    def resolve_tickets(self, info):
+    def resolve_tickets(self, info, first=None, after=None):
         """
-        Resolver for the tickets field, retrieving associated tickets for the event.
+        Resolver for the tickets field, retrieving a page of associated tickets for the event.
+        Pages of every event in the response are fetched with one batched query.
         """
-        return self.tickets.all()
+        limit = page_size(first)
+        after_id = decode_cursor(after) if after else None
+        return (
+            info.context["tickets_by_event_loader"]
+            .load((self.id, after_id, limit))
+            .then(lambda rows: build_connection(TicketConnection, rows, limit, after_id))
+        )
+
+
+class EventConnection(relay.Connection):
+    """
+    Cursor-paginated list of events.
+    """
+
+    class Meta:
+        node = EventObject
@@ -1,19 +1,26 @@
 import graphene
 
-from app.events.graphql.event_object import EventObject
+from app.events.controllers.event_controller import EventController
+from app.events.graphql.event_object import EventConnection, EventObject
+from app.events.graphql.event_stats_object import EventStatsObject
 from app.events.models.event_model import Event as EventModel
+from app.pagination import build_connection, connection_args, paginate_query
 
 
 class EventQuery(graphene.ObjectType):
     """
-    GraphQL query to retrieve a list of events, optionally filtered by name.
+    GraphQL query to retrieve a page of events, optionally filtered by name,
+    and the sales summary of a set of events.
     """
 
-    events = graphene.List(EventObject, name=graphene.String())
+    events = graphene.Field(EventConnection, name=graphene.String(), **connection_args())
+    event_stats = graphene.List(
+        EventStatsObject, ids=graphene.List(graphene.Int, required=True)
+    )
 
-    def resolve_events(self, info, name=None):
+    def resolve_events(self, info, name=None, first=None, after=None):
         """
-        Resolver for events query. Retrieves all events, optionally filtering by name.
+        Resolver for events query. Retrieves a page of events, optionally filtering by name.
         """
         # Use the get_query method to obtain the SQLAlchemy query
         query = EventObject.get_query(info)
@@ -23,4 +30,11 @@ class EventQuery(graphene.ObjectType):
                 EventModel.name.ilike(f"%{name}%")
             )  # Case-insensitive filter
 
-        return query.all()
+        rows, limit, after_id = paginate_query(query, EventModel.id, first, after)
+        return build_connection(EventConnection, rows, limit, after_id)
+
+    def resolve_event_stats(self, info, ids):
+        """
+        Resolver for eventStats. Every requested event is summarized by one grouped query.
+        """
+        return EventController.get_event_stats(ids)
@@ -0,0 +1,15 @@
+import graphene
+
+
+class EventStatsObject(graphene.ObjectType):
+    """
+    Sales summary of an event, computed without loading its tickets.
+    """
+
+    event_id = graphene.Int()
+    name = graphene.String()
+    total_tickets = graphene.Int()
+    sold_tickets = graphene.Int()
+    redeemed_tickets = graphene.Int()
+    held_tickets = graphene.Int()
+    remaining_tickets = graphene.Int()
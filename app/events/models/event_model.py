@@ -3,15 +3,33 @@ from app import db
 
 class Event(db.Model):
     __tablename__ = "events"
+    __table_args__ = (
+        # Serve event listings by date range
+        db.Index("ix_events_start_date_end_date", "start_date", "end_date"),
+    )
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(256), nullable=False)
     start_date = db.Column(db.Date, nullable=False)
     end_date = db.Column(db.Date, nullable=False)
     total_tickets = db.Column(db.Integer, nullable=False)
     sold_tickets = db.Column(db.Integer, default=0)
+    held_tickets = db.Column(db.Integer, nullable=False, default=0, server_default="0")
     redeemed_tickets = db.Column(db.Integer, default=0)
+    # Bumped by every UPDATE of the row, including the counter updates, to tag
+    # HTTP responses with the version of the data they were built from
+    version = db.Column(
+        db.Integer,
+        nullable=False,
+        default=1,
+        server_default="1",
+        onupdate=db.text("version + 1"),
+    )
 
     # Relación solo definida en Event, evitando la dependencia circular
     tickets = db.relationship(
         "Ticket", backref="event", cascade="all, delete-orphan", lazy="dynamic"
     )
+    holds = db.relationship("TicketHold", cascade="all, delete-orphan", lazy="dynamic")
+    sales_rollups = db.relationship(
+        "SalesRollup", cascade="all, delete-orphan", lazy="dynamic"
+    )
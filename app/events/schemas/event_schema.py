@@ -1,4 +1,5 @@
 import graphene
+from flask import current_app
 from graphene import relay
 from graphql import GraphQLError
 
@@ -48,6 +49,41 @@ class CreateEventMutation(graphene.Mutation):
             raise BadRequestException(str(e))
 
 
+class EventImportErrorObject(graphene.ObjectType):
+    """
+    A row of a batch that could not be created.
+    """
+
+    index = graphene.Int()
+    message = graphene.String()
+
+
+class CreateEventsMutation(graphene.Mutation):
+    """
+    Mutation to create a batch of events, validated in one pass and inserted in bulk.
+    """
+
+    class Arguments:
+        input = graphene.List(graphene.NonNull(EventInput), required=True)
+
+    created = graphene.Int()
+    errors = graphene.List(EventImportErrorObject)
+    elapsed_seconds = graphene.Float()
+    events_per_second = graphene.Float()
+
+    def mutate(self, info, input):
+        result = EventController.create_events(
+            [dict(event) for event in input],
+            chunk_size=current_app.config["EVENT_IMPORT_CHUNK_SIZE"],
+        )
+        return CreateEventsMutation(
+            created=result.created,
+            errors=result.errors,
+            elapsed_seconds=result.elapsed,
+            events_per_second=result.created / result.elapsed if result.elapsed else None,
+        )
+
+
 class UpdateEventInput(graphene.InputObjectType):
     """
     Defines input fields for updating an event.
@@ -122,5 +158,6 @@ class EventMutation(graphene.ObjectType):
     """
 
     create_event = CreateEventMutation.Field()
+    create_events = CreateEventsMutation.Field()
     update_event = UpdateEventMutation.Field()
     delete_event = DeleteEventMutation.Field()
@@ -1,7 +1,47 @@
+import time
+from collections import namedtuple
 from datetime import datetime
 
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+
 from app import db
+from app.data_version import data_version_cache
+from app.db_routing import pinned_to_primary, reads_from_replica, use_primary
+from app.entity_cache import EntityCache
 from app.events.models.event_model import Event as EventModel
+from app.tickets.models.ticket_model import Ticket as TicketModel
+
+# Immutable view of the event metadata that rarely changes. Live counters such
+# as sold_tickets are deliberately left out so they are never served stale.
+EventSnapshot = namedtuple(
+    "EventSnapshot", ["id", "name", "start_date", "end_date", "total_tickets"]
+)
+
+# Sales summary of an event. sold_tickets counts issued tickets; remaining_tickets
+# is what is still on sale once sold and held seats are taken out.
+EventStats = namedtuple(
+    "EventStats",
+    [
+        "event_id",
+        "name",
+        "total_tickets",
+        "sold_tickets",
+        "redeemed_tickets",
+        "held_tickets",
+        "remaining_tickets",
+    ],
+)
+
+# Outcome of a bulk import: how many events were created, the rows rejected
+# (as EventImportError) and the seconds it took
+EventImportResult = namedtuple("EventImportResult", ["created", "errors", "elapsed"])
+EventImportError = namedtuple("EventImportError", ["index", "message"])
+
+EVENT_IMPORT_FIELDS = ("name", "start_date", "end_date", "total_tickets")
+
+# Read-through cache of event snapshots, configured by create_app
+event_cache = EntityCache("event")
 
 
 class EventService:
@@ -29,22 +69,153 @@ class EventService:
         return event
 
     @staticmethod
-    def get_all_events(name=None):
+    def create_events(events, chunk_size=500):
+        """
+        Creates a batch of events, given as dicts with the create_event arguments.
+
+        Every row is validated first with the same rules as create_event and
+        the valid ones are inserted with a multi-row INSERT, committing every
+        chunk_size rows. Invalid rows are reported by their index in the batch
+        and never stop the rest; a chunk the database rejects is reported row
+        by row.
+        """
+        started = time.perf_counter()
+        errors = []
+        valid = []
+        for index, event in enumerate(events):
+            try:
+                EventService._validate_import_row(event)
+            except ValueError as e:
+                errors.append(EventImportError(index, e.args[0]))
+                continue
+            valid.append((index, {field: event[field] for field in EVENT_IMPORT_FIELDS}))
+
+        created = 0
+        for offset in range(0, len(valid), chunk_size):
+            chunk = valid[offset : offset + chunk_size]
+            try:
+                # A Core executemany rather than bulk_insert_mappings, which
+                # bypasses the session hooks that track writes for read-your-writes
+                # stickiness and the data version
+                db.session.execute(
+                    EventModel.__table__.insert(),
+                    [dict(mapping, sold_tickets=0) for _, mapping in chunk],
+                )
+                db.session.commit()
+            except SQLAlchemyError as e:
+                db.session.rollback()
+                message = f"Could not insert the event: {e.__class__.__name__}"
+                errors.extend(EventImportError(index, message) for index, _ in chunk)
+                continue
+            created += len(chunk)
+
+        errors.sort(key=lambda error: error.index)
+        return EventImportResult(created, errors, time.perf_counter() - started)
+
+    @staticmethod
+    @reads_from_replica
+    def get_all_events(name=None, after_id=None, limit=None):
         """
-        Retrieves all events, optionally filtered by name.
+        Retrieves events ordered by ID, optionally filtered by name and one keyset page at a time.
         """
-        query = EventModel.query
+        query = EventModel.query.order_by(EventModel.id)
         if name:
             query = query.filter(EventModel.name == name)
+        if after_id is not None:
+            query = query.filter(EventModel.id > after_id)
+        if limit is not None:
+            query = query.limit(limit)
         return query.all()
 
     @staticmethod
+    @reads_from_replica
     def get_event_by_id(event_id):
         """
         Retrieves an event by its ID.
         """
         return EventModel.query.get(event_id)
 
+    @staticmethod
+    @reads_from_replica
+    def get_event_stats(event_ids):
+        """
+        Returns the sales summary of each existing event, in the order requested.
+
+        Tickets are counted with one LEFT JOIN ... GROUP BY over the
+        (event_id, redeemed_at) index, so no ticket row is loaded.
+        """
+        event_ids = list(dict.fromkeys(event_ids))
+        if not event_ids:
+            return []
+
+        events = EventModel.__table__
+        tickets = TicketModel.__table__
+        rows = (
+            db.session.query(
+                events.c.id,
+                events.c.name,
+                events.c.total_tickets,
+                events.c.sold_tickets,
+                events.c.held_tickets,
+                func.count(tickets.c.id).label("issued"),
+                func.count(tickets.c.redeemed_at).label("redeemed"),
+            )
+            .select_from(events.outerjoin(tickets, tickets.c.event_id == events.c.id))
+            .filter(events.c.id.in_(event_ids))
+            .group_by(
+                events.c.id,
+                events.c.name,
+                events.c.total_tickets,
+                events.c.sold_tickets,
+                events.c.held_tickets,
+            )
+        )
+        stats = {
+            row.id: EventStats(
+                event_id=row.id,
+                name=row.name,
+                total_tickets=row.total_tickets,
+                sold_tickets=row.issued,
+                redeemed_tickets=row.redeemed,
+                held_tickets=row.held_tickets,
+                remaining_tickets=max(
+                    row.total_tickets - (row.sold_tickets or 0) - row.held_tickets, 0
+                ),
+            )
+            for row in rows
+        }
+        return [stats[event_id] for event_id in event_ids if event_id in stats]
+
+    @staticmethod
+    def get_data_version():
+        """
+        Returns a token that changes whenever an event or ticket is created, changed or deleted.
+
+        The token is cached per worker for GRAPHQL_DATA_VERSION_TTL seconds and
+        dropped by this worker's own writes. Clients pinned to the primary
+        because they just wrote always get a fresh one, so they never receive a
+        304 for data older than their own write.
+        """
+        if pinned_to_primary():
+            return EventService._load_data_version()
+        return data_version_cache.get_or_load(EventService._load_data_version)
+
+    @staticmethod
+    def get_event_snapshot(event_id):
+        """
+        Retrieves the cached metadata of an event, loading it on a cache miss.
+        """
+        return event_cache.get_or_load(event_id, EventService._load_snapshot)
+
+    @staticmethod
+    def get_event_snapshots(event_ids):
+        """
+        Retrieves the cached metadata of several events, loading all misses in one query.
+        """
+        return event_cache.get_many_or_load(
+            set(event_ids), EventService._load_snapshots
+        )
+
     @staticmethod
     def update_event(
         event_id, name=None, start_date=None, end_date=None, total_tickets=None
@@ -52,12 +223,16 @@ class EventService:
         """
         Updates an existing event after validating dates and total tickets.
         """
+        # Validate against the primary copy, never a lagging replica
+        use_primary()
         event = EventService.get_event_by_id(event_id)
         if not event:
             raise Exception("Event not found")
 
         EventService._validate_dates_update(start_date, end_date, event)
-        EventService._validate_total_tickets_update(total_tickets, event.sold_tickets)
+        EventService._validate_total_tickets_update(
+            total_tickets, event.sold_tickets + event.held_tickets
+        )
 
         if name:
             event.name = name
@@ -69,6 +244,7 @@ class EventService:
             event.total_tickets = total_tickets
 
         db.session.commit()
+        event_cache.invalidate(event_id)
         return event
 
     @staticmethod
@@ -76,6 +252,7 @@ class EventService:
         """
         Deletes an event if the end date has passed or if no tickets have been sold.
         """
+        use_primary()
         event = EventService.get_event_by_id(event_id)
 
         if not event:
@@ -85,8 +262,62 @@ class EventService:
 
         db.session.delete(event)
         db.session.commit()
+        event_cache.invalidate(event_id)
         return True
 
+    @staticmethod
+    @reads_from_replica
+    def _load_data_version():
+        """
+        Aggregates the data version from the per-event row versions.
+
+        Every write to tickets also updates the event row (sale, hold and
+        redemption counters), which bumps its version; the highest ticket ID
+        covers tickets sold from leased blocks. The sum reads every event row,
+        which is why get_data_version caches the result.
+        """
+        events = EventModel.__table__
+        tickets = TicketModel.__table__
+        row = db.session.query(
+            func.count(events.c.id),
+            func.max(events.c.id),
+            func.sum(events.c.version),
+            select([func.max(tickets.c.id)]).as_scalar(),
+        ).one()
+        return "-".join(str(value or 0) for value in row)
+
+    @staticmethod
+    def _load_snapshot(event_id):
+        """
+        Loads the snapshot of a single event from the database.
+        """
+        return EventService._load_snapshots([event_id]).get(event_id)
+
+    @staticmethod
+    def _load_snapshots(event_ids):
+        """
+        Loads the snapshots of several events from the database with one IN query.
+        """
+        rows = db.session.query(
+            EventModel.id,
+            EventModel.name,
+            EventModel.start_date,
+            EventModel.end_date,
+            EventModel.total_tickets,
+        ).filter(EventModel.id.in_(event_ids))
+        return {row.id: EventSnapshot(*row) for row in rows}
+
+    @staticmethod
+    def _validate_import_row(event):
+        """
+        Validates one row of a bulk import with the rules of create_event.
+        """
+        for field in EVENT_IMPORT_FIELDS:
+            if event.get(field) in (None, ""):
+                raise ValueError(f"Missing field: {field}.")
+        EventService._validate_dates_create(event["start_date"], event["end_date"])
+        EventService._validate_total_tickets_create(event["total_tickets"])
+
     @staticmethod
     def _validate_dates_create(start_date, end_date):
         """
@@ -125,11 +356,12 @@ class EventService:
     def _validate_total_tickets_update(total_tickets, sold_tickets):
         """
         Validates the total number of tickets when updating an event.
+        Tickets on hold count as sold, since they may still be confirmed.
         """
         if total_tickets is not None:
             if total_tickets < sold_tickets:
                 raise ValueError(
-                    f"Cannot set total tickets to {total_tickets} as {sold_tickets} tickets are already sold."
+                    f"Cannot set total tickets to {total_tickets} as {sold_tickets} tickets are already sold or on hold."
                 )
             if total_tickets < 1:
                 raise ValueError("Total tickets must be at least 1.")
@@ -142,6 +374,9 @@ class EventService:
         if event.sold_tickets > 0:
             raise Exception("Cannot delete the event because tickets have been sold.")
 
+        if event.held_tickets > 0:
+            raise Exception("Cannot delete the event because tickets are on hold.")
+
         today = datetime.now().date()
         if event.end_date > today:
             raise Exception("Cannot delete the event because it has not yet ended.")
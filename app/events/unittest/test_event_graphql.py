@@ -0,0 +1,145 @@
+from datetime import date, timedelta
+
+from app import db
+from app.custom_graphql_view import CustomGraphQLView
+from app.events.models.event_model import Event
+from app.schema import schema
+from app.sql_profiler import query_budget
+from app.tickets.services.ticket_service import TicketService
+
+
+def create_events(count, tickets_per_event):
+    for index in range(count):
+        event = Event(
+            name=f"Evento {index}",
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=1),
+            total_tickets=tickets_per_event,
+            sold_tickets=0,
+        )
+        db.session.add(event)
+        db.session.commit()
+        TicketService.sell_tickets(event.id, tickets_per_event)
+
+
+def execute(query, sqlite_app):
+    with sqlite_app.test_request_context():
+        context = CustomGraphQLView(schema=schema).get_context()
+        return schema.execute(query, context_value=context)
+
+
+# Pruebas de resolución por lotes (DataLoaders) en consultas anidadas
+class TestNestedEventQueries:
+    def test_nested_tickets_use_one_query_per_level(self, sqlite_app):
+        create_events(count=5, tickets_per_event=3)
+        with query_budget(3):
+            result = execute(
+                """
+                {
+                  events {
+                    edges { node { id tickets { edges { node { id event { name } } } } } }
+                  }
+                }
+                """,
+                sqlite_app,
+            )
+
+        assert result.errors is None
+        events = [edge["node"] for edge in result.data["events"]["edges"]]
+        assert len(events) == 5
+        assert all(len(event["tickets"]["edges"]) == 3 for event in events)
+
+
+# Pruebas de paginación por cursor (keyset) en events, tickets y Event.tickets
+class TestCursorPagination:
+    def test_events_pages_follow_cursor(self, sqlite_app):
+        create_events(count=5, tickets_per_event=1)
+        query = """
+            query ($after: String) {
+              events(first: 2, after: $after) {
+                edges { cursor node { name } }
+                pageInfo { hasNextPage endCursor }
+              }
+            }
+        """
+        names, after = [], None
+        while True:
+            with sqlite_app.test_request_context():
+                context = CustomGraphQLView(schema=schema).get_context()
+                result = schema.execute(
+                    query, context_value=context, variable_values={"after": after}
+                )
+            page = result.data["events"]
+            names.extend(edge["node"]["name"] for edge in page["edges"])
+            if not page["pageInfo"]["hasNextPage"]:
+                break
+            after = page["pageInfo"]["endCursor"]
+
+        assert names == [f"Evento {index}" for index in range(5)]
+
+    def test_page_size_is_capped(self, sqlite_app):
+        create_events(count=1, tickets_per_event=5)
+        sqlite_app.config["GRAPHQL_MAX_PAGE_SIZE"] = 2
+
+        result = execute(
+            "{ tickets(first: 50) { edges { node { id } } pageInfo { hasNextPage } } }",
+            sqlite_app,
+        )
+
+        assert len(result.data["tickets"]["edges"]) == 2
+        assert result.data["tickets"]["pageInfo"]["hasNextPage"] is True
+
+    def test_event_tickets_are_paginated_per_event(self, sqlite_app):
+        create_events(count=3, tickets_per_event=4)
+
+        result = execute(
+            """
+            {
+              events {
+                edges { node { tickets(first: 3) { pageInfo { hasNextPage } edges { node { eventId } } } } }
+              }
+            }
+            """,
+            sqlite_app,
+        )
+
+        for edge in result.data["events"]["edges"]:
+            tickets = edge["node"]["tickets"]
+            assert len(tickets["edges"]) == 3
+            assert tickets["pageInfo"]["hasNextPage"] is True
+
+    def test_invalid_cursor(self, sqlite_app):
+        result = execute('{ events(after: "bogus") { edges { cursor } } }', sqlite_app)
+
+        assert result.errors[0].message == "Invalid cursor."
+
+
+# Pruebas del resumen de ventas por evento (eventStats)
+class TestEventStats:
+    def test_stats_are_served_by_one_query(self, sqlite_app):
+        create_events(count=3, tickets_per_event=4)
+        redeemed = TicketService.get_all_tickets(limit=2)
+        TicketService.redeem_tickets([ticket.id for ticket in redeemed])
+        empty = Event(
+            name="Sin ventas",
+            start_date=date.today(),
+            end_date=date.today(),
+            total_tickets=10,
+            sold_tickets=0,
+        )
+        db.session.add(empty)
+        db.session.commit()
+        empty_id = empty.id
+
+        with query_budget(1):
+            result = execute(
+                f"{{ eventStats(ids: [{empty_id}, 1, 999]) {{ eventId soldTickets "
+                "redeemedTickets remainingTickets } }",
+                sqlite_app,
+            )
+
+        assert result.errors is None
+        assert result.data["eventStats"] == [
+            {"eventId": empty_id, "soldTickets": 0, "redeemedTickets": 0, "remainingTickets": 10},
+            {"eventId": 1, "soldTickets": 4, "redeemedTickets": 2, "remainingTickets": 0},
+        ]
@@ -0,0 +1,122 @@
+import json
+from datetime import date, timedelta
+
+from flask_script import Manager
+
+from app.events.event_import import ImportEvents, read_event_file
+from app.events.models.event_model import Event
+from app.events.services.event_service import EventService
+from app.sql_profiler import profile
+
+TODAY = date.today()
+
+
+def event_row(name, days=1, total_tickets=100):
+    start_date = TODAY + timedelta(days=days)
+    return {
+        "name": name,
+        "start_date": start_date,
+        "end_date": start_date + timedelta(days=1),
+        "total_tickets": total_tickets,
+    }
+
+
+# Pruebas de la creación masiva de eventos
+class TestCreateEvents:
+    def test_valid_rows_are_inserted_in_chunks(self, sqlite_app):
+        events = [event_row(f"Evento {index}") for index in range(7)]
+        events[2] = event_row("En el pasado", days=-3)
+        events[5] = event_row("Demasiados boletos", total_tickets=500)
+
+        with profile() as sql:
+            result = EventService.create_events(events, chunk_size=2)
+
+        assert result.created == 5
+        assert [(error.index, error.message) for error in result.errors] == [
+            (2, "Start date must be today or a future date."),
+            (5, "Total tickets must be between 1 and 300."),
+        ]
+        assert Event.query.count() == 5
+        inserts = [statement for statement in sql.statements if "INSERT" in statement]
+        assert len(inserts) == 3
+
+    def test_create_events_mutation(self, graphql_client):
+        start = (TODAY + timedelta(days=1)).isoformat()
+        response = graphql_client.post(
+            "/graphql/v1",
+            json={
+                "query": "mutation ($input: [EventInput!]!) { createEvents(input: $input) "
+                "{ created errors { index message } eventsPerSecond } }",
+                "variables": {
+                    "input": [
+                        {"name": "A", "startDate": start, "endDate": start, "totalTickets": 10},
+                        {"name": "B", "startDate": start, "endDate": start, "totalTickets": 0},
+                    ]
+                },
+            },
+        )
+
+        data = response.get_json()["data"]["createEvents"]
+        assert data["created"] == 1
+        assert data["errors"] == [
+            {"index": 1, "message": "Total tickets must be between 1 and 300."}
+        ]
+        assert data["eventsPerSecond"] > 0
+
+
+# Pruebas del comando `manage.py import-events`
+class TestImportEventsCommand:
+    def test_reads_csv_and_json(self, tmp_path):
+        start = (TODAY + timedelta(days=1)).isoformat()
+        csv_file = tmp_path / "events.csv"
+        csv_file.write_text(
+            "name,start_date,end_date,total_tickets\n"
+            f"Feria,{start},{start},50\n"
+            f"Teatro,mañana,{start},50\n"
+        )
+        json_file = tmp_path / "events.json"
+        json_file.write_text(
+            json.dumps(
+                [{"name": "Expo", "start_date": start, "end_date": start, "total_tickets": "x"}]
+            )
+        )
+
+        events, errors = read_event_file(str(csv_file))
+        tomorrow = TODAY + timedelta(days=1)
+        assert events == [
+            (
+                0,
+                {
+                    "name": "Feria",
+                    "start_date": tomorrow,
+                    "end_date": tomorrow,
+                    "total_tickets": 50,
+                },
+            )
+        ]
+        assert errors[0].index == 1 and "start_date" in errors[0].message
+
+        events, errors = read_event_file(str(json_file))
+        assert events == [] and "total_tickets" in errors[0].message
+
+    def test_command_reports_rows_of_the_file(self, sqlite_app, tmp_path, capsys):
+        start = (TODAY + timedelta(days=1)).isoformat()
+        path = tmp_path / "events.csv"
+        path.write_text(
+            "name,start_date,end_date,total_tickets\n"
+            f"Feria,{start},{start},50\n"
+            f"Teatro,no-date,{start},50\n"
+            f"Circo,{start},{start},400\n"
+            f"Opera,{start},{start},20\n"
+        )
+        manager = Manager(sqlite_app)
+        manager.add_command("import-events", ImportEvents())
+
+        status = manager.handle("manage.py", ["import-events", str(path)])
+
+        output = capsys.readouterr().out
+        assert status == 1
+        assert "row 2: Invalid start_date" in output
+        assert "row 3: Total tickets must be between 1 and 300." in output
+        assert "Created 2 of 4 events" in output
+        assert Event.query.count() == 2
@@ -0,0 +1,112 @@
+from datetime import date, timedelta
+
+from app import db
+from app.entity_cache import EntityCache, InProcessCacheBackend, RedisCacheBackend
+from app.events.models.event_model import Event
+from app.events.services.event_service import EventService
+from app.sql_profiler import profile
+
+
+def create_event(start_date=None, total_tickets=100):
+    start_date = start_date or date.today() + timedelta(days=1)
+    event = Event(
+        name="Concierto de Rock",
+        start_date=start_date,
+        end_date=start_date + timedelta(days=1),
+        total_tickets=total_tickets,
+        sold_tickets=0,
+    )
+    db.session.add(event)
+    db.session.commit()
+    return event.id
+
+
+# Stand-in local del cliente Redis con el subconjunto de API que usa la caché
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+# Pruebas de la caché de lectura de eventos
+class TestEventSnapshotCache:
+    def test_snapshot_is_served_from_cache(self, sqlite_app):
+        event_id = create_event()
+        EventService.get_event_snapshot(event_id)
+
+        with profile() as statements:
+            snapshot = EventService.get_event_snapshot(event_id)
+
+        assert len(statements) == 0
+        assert snapshot.name == "Concierto de Rock"
+        assert not hasattr(snapshot, "sold_tickets")
+
+    def test_update_event_invalidates_snapshot(self, sqlite_app):
+        event_id = create_event()
+        EventService.get_event_snapshot(event_id)
+
+        EventService.update_event(event_id, name="Concierto de Jazz", total_tickets=50)
+
+        snapshot = EventService.get_event_snapshot(event_id)
+        assert snapshot.name == "Concierto de Jazz"
+        assert snapshot.total_tickets == 50
+
+    def test_delete_event_invalidates_snapshot(self, sqlite_app):
+        event_id = create_event(start_date=date.today() - timedelta(days=5))
+        EventService.get_event_snapshot(event_id)
+
+        EventService.delete_event(event_id)
+
+        assert EventService.get_event_snapshot(event_id) is None
+
+    def test_snapshots_load_misses_in_one_query(self, sqlite_app):
+        event_ids = [create_event() for _ in range(3)]
+        EventService.get_event_snapshot(event_ids[0])
+
+        with profile() as statements:
+            snapshots = EventService.get_event_snapshots(event_ids + [999])
+
+        assert len(statements) == 1
+        assert sorted(snapshots) == event_ids
+
+
+# Pruebas de los backends de caché (TTL, LRU y backend compartido)
+class TestCacheBackends:
+    def test_entries_expire(self):
+        backend = InProcessCacheBackend(max_size=10)
+        backend.set("a", 1, ttl=0)
+
+        assert backend.get("a") is None
+
+    def test_least_recently_used_is_evicted(self):
+        backend = InProcessCacheBackend(max_size=2)
+        backend.set("a", 1, ttl=60)
+        backend.set("b", 2, ttl=60)
+        backend.get("a")
+        backend.set("c", 3, ttl=60)
+
+        assert backend.get("a") == 1
+        assert backend.get("b") is None
+
+    def test_shared_backend_invalidation_reaches_every_worker(self):
+        client = FakeRedis()
+        worker_a, worker_b = EntityCache("event"), EntityCache("event")
+        worker_a.backend = RedisCacheBackend(client, "event:")
+        worker_b.backend = RedisCacheBackend(client, "event:")
+
+        worker_a.get_or_load(1, lambda key: {"id": key, "name": "v1"})
+        assert worker_b.get_or_load(1, lambda key: None) == {"id": 1, "name": "v1"}
+
+        worker_b.invalidate(1)
+        assert worker_a.get_or_load(1, lambda key: {"id": key, "name": "v2"}) == {
+            "id": 1,
+            "name": "v2",
+        }
@@ -0,0 +1,129 @@
+"""
+Latency and error metrics for GraphQL operations and resolvers.
+"""
+import random
+import threading
+import time
+
+from graphql import GraphQLEnumType, GraphQLScalarType
+from graphql.type.definition import get_named_type
+from graphql.utils.get_operation_ast import get_operation_ast
+from prometheus_client import Counter, Histogram
+from promise import Promise
+
+from app.metrics import LATENCY_BUCKETS
+
+OPERATION_DURATION = Histogram(
+    "graphql_operation_duration_seconds",
+    "Time to execute a GraphQL operation, by operation name and type.",
+    ["operation", "type"],
+    buckets=LATENCY_BUCKETS,
+)
+OPERATION_ERRORS = Counter(
+    "graphql_operation_errors_total",
+    "GraphQL operations whose result contained errors.",
+    ["operation", "type"],
+)
+RESOLVER_DURATION = Histogram(
+    "graphql_resolver_duration_seconds",
+    "Time spent in a resolver, until its promise settles for batched fields.",
+    ["field"],
+    buckets=LATENCY_BUCKETS,
+)
+RESOLVER_ERRORS = Counter(
+    "graphql_resolver_errors_total", "Resolvers that raised or rejected.", ["field"]
+)
+
+# WSGI environ flag of synthetic requests, such as the warm-up queries, which
+# are left out of the operation and resolver metrics
+SKIP_METRICS_KEY = "app.skip_metrics"
+
+# Distinct operation names tracked before the rest are reported as "other",
+# since names are chosen by clients and would otherwise grow without bound
+MAX_OPERATION_NAMES = 200
+
+_operation_names = set()
+_operation_names_lock = threading.Lock()
+
+
+def operation_label(operation_name):
+    """
+    Returns the metric label for a client-provided operation name.
+    """
+    if not operation_name:
+        return "anonymous"
+    with _operation_names_lock:
+        if operation_name in _operation_names:
+            return operation_name
+        if len(_operation_names) < MAX_OPERATION_NAMES:
+            _operation_names.add(operation_name)
+            return operation_name
+    return "other"
+
+
+def operation_name(document, requested_name=None):
+    """
+    Returns the name of the operation a request executes, as written in the document.
+    """
+    operation = get_operation_ast(document.document_ast, requested_name)
+    if operation is not None and operation.name is not None:
+        return operation.name.value
+    return requested_name
+
+
+def record_operation(operation_name, operation_type, duration, failed):
+    labels = (operation_label(operation_name), operation_type or "unknown")
+    OPERATION_DURATION.labels(*labels).observe(duration)
+    if failed:
+        OPERATION_ERRORS.labels(*labels).inc()
+
+
+class ResolverMetricsMiddleware:
+    """
+    Graphene middleware timing each resolver, labelled as ParentType.field.
+
+    Fields returning scalars or enums are mostly plain attribute reads, so only
+    a sample of them is timed to keep the overhead low enough for always-on
+    use; object and list fields, where the queries happen, are always timed.
+    """
+
+    # Whether each (parent type, field) returns a scalar, shared by all requests
+    _trivial_fields = {}
+
+    def __init__(self, scalar_sample_rate=0.01):
+        self.scalar_sample_rate = scalar_sample_rate
+
+    def resolve(self, next, root, info, **args):
+        if self._is_trivial(info) and random.random() >= self.scalar_sample_rate:
+            return next(root, info, **args)
+
+        field = f"{info.parent_type.name}.{info.field_name}"
+        started = time.perf_counter()
+        try:
+            result = next(root, info, **args)
+        except Exception:
+            RESOLVER_ERRORS.labels(field).inc()
+            raise
+
+        if not Promise.is_thenable(result):
+            RESOLVER_DURATION.labels(field).observe(time.perf_counter() - started)
+            return result
+
+        def resolved(value):
+            RESOLVER_DURATION.labels(field).observe(time.perf_counter() - started)
+            return value
+
+        def rejected(error):
+            RESOLVER_ERRORS.labels(field).inc()
+            raise error
+
+        return Promise.resolve(result).then(resolved, rejected)
+
+    def _is_trivial(self, info):
+        key = (info.parent_type.name, info.field_name)
+        trivial = self._trivial_fields.get(key)
+        if trivial is None:
+            named_type = get_named_type(info.return_type)
+            trivial = isinstance(named_type, (GraphQLScalarType, GraphQLEnumType))
+            self._trivial_fields[key] = trivial
+        return trivial
@@ -0,0 +1,47 @@
+"""
+HTTP validators and cache headers for read-only GraphQL operations served over GET.
+"""
+import hashlib
+import json
+
+from graphql.language import ast
+from graphql.utils.get_operation_ast import get_operation_ast
+
+# Root query fields whose results only depend on the events and tickets tables,
+# which is what EventService.get_data_version tracks
+CACHEABLE_ROOT_FIELDS = frozenset(["events", "tickets", "eventStats", "__typename"])
+
+
+def is_cacheable(document_ast, operation_name=None):
+    """
+    Tells whether an operation is a query selecting only cacheable root fields.
+    """
+    operation = get_operation_ast(document_ast, operation_name)
+    if operation is None or operation.operation != "query":
+        return False
+    return all(
+        isinstance(selection, ast.Field)
+        and selection.name.value in CACHEABLE_ROOT_FIELDS
+        for selection in operation.selection_set.selections
+    )
+
+
+def compute_etag(query, operation_name, variables, data_version, pretty=False):
+    """
+    Builds a strong ETag for the response of an operation at a data version.
+    Pretty-printed and compact bodies differ byte for byte, so they get different ETags.
+    """
+    key = json.dumps(
+        [query, operation_name, variables, data_version, bool(pretty)],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
+def cache_control(operation_name, config):
+    """
+    Returns the Cache-Control configured for an operation name, or the default.
+    """
+    per_operation = config["GRAPHQL_CACHE_CONTROL"]
+    return per_operation.get(operation_name, config["GRAPHQL_DEFAULT_CACHE_CONTROL"])
@@ -0,0 +1,56 @@
+"""
+Prometheus metrics of the application, kept with prometheus_client.
+
+Under `manage.py serve`, set PROMETHEUS_MULTIPROC_DIR to a directory shared by
+the workers before the server starts. prometheus_client then keeps the values
+of every worker in memory-mapped files in that directory and /metrics merges
+them, whichever worker serves the scrape. Without it, /metrics reports the
+values of the worker serving the scrape.
+"""
+import os
+
+from prometheus_client import REGISTRY, CollectorRegistry, generate_latest
+from prometheus_client import multiprocess
+
+# Latency buckets in seconds, from sub-millisecond cache hits to slow requests
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10
+)
+
+
+def multiprocess_dir():
+    """
+    Returns the directory shared by the workers, or "" outside multiprocess mode.
+    """
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR", "")
+
+
+def render():
+    """
+    Renders the metrics of every worker, or of this one, in the Prometheus text format.
+    """
+    if not multiprocess_dir():
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+def mark_process_dead(pid):
+    """
+    Drops the live gauges of an exited worker; its counters stay in the totals.
+    """
+    if multiprocess_dir():
+        multiprocess.mark_process_dead(pid)
+
+
+def clear():
+    """
+    Removes the metric files of a previous server run, before its workers start.
+    """
+    directory = multiprocess_dir()
+    if not directory or not os.path.isdir(directory):
+        return
+    for filename in os.listdir(directory):
+        if filename.endswith(".db"):
+            os.remove(os.path.join(directory, filename))
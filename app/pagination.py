@@ -0,0 +1,81 @@
+import base64
+
+import graphene
+from flask import current_app
+from graphene import relay
+
+CURSOR_PREFIX = "cursor:"
+
+
+def encode_cursor(row_id):
+    """
+    Encodes a row ID as an opaque Relay cursor.
+    """
+    return base64.b64encode(f"{CURSOR_PREFIX}{row_id}".encode()).decode()
+
+
+def decode_cursor(cursor):
+    """
+    Decodes a Relay cursor back into the row ID it points at.
+    """
+    try:
+        value = base64.b64decode(cursor.encode()).decode()
+        if not value.startswith(CURSOR_PREFIX):
+            raise ValueError
+        return int(value[len(CURSOR_PREFIX) :])
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor.")
+
+
+def page_size(first):
+    """
+    Resolves the requested page size, capped by the server-side maximum.
+    """
+    if first is None:
+        return current_app.config["GRAPHQL_DEFAULT_PAGE_SIZE"]
+    if first < 1:
+        raise ValueError("first must be a positive integer.")
+    return min(first, current_app.config["GRAPHQL_MAX_PAGE_SIZE"])
+
+
+def connection_args():
+    """
+    Arguments shared by every cursor-paginated field.
+    """
+    return {"first": graphene.Int(), "after": graphene.String()}
+
+
+def paginate_query(query, id_column, first=None, after=None):
+    """
+    Applies keyset pagination to a query.
+
+    Rows are ordered by their ID and the page starts strictly after the cursor,
+    so deep pages are served from the primary key index instead of an OFFSET
+    scan. One extra row is fetched to know whether another page exists.
+    Returns the page rows, the page size and the decoded cursor.
+    """
+    limit = page_size(first)
+    after_id = decode_cursor(after) if after else None
+    if after_id is not None:
+        query = query.filter(id_column > after_id)
+    rows = query.order_by(id_column).limit(limit + 1).all()
+    return rows, limit, after_id
+
+
+def build_connection(connection_type, rows, limit, after_id=None):
+    """
+    Builds a Relay connection from a page fetched with one extra row.
+    """
+    edges = [
+        connection_type.Edge(node=row, cursor=encode_cursor(row.id))
+        for row in rows[:limit]
+    ]
+    return connection_type(
+        edges=edges,
+        page_info=relay.PageInfo(
+            has_next_page=len(rows) > limit,
+            has_previous_page=after_id is not None,
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+        ),
+    )
@@ -0,0 +1,164 @@
+from collections import namedtuple
+
+from graphql.language import ast
+from graphql.type import GraphQLList, GraphQLNonNull
+from graphql.utils.get_operation_ast import get_operation_ast
+
+QueryCost = namedtuple("QueryCost", ["cost", "depth"])
+
+# Relay wrappers are structural: their cost is carried by the connection field
+CONNECTION_WRAPPER_FIELDS = ("edges", "node", "pageInfo")
+
+
+class QueryCostAnalyzer:
+    """
+    Static cost and depth analysis of a GraphQL operation, run before execution.
+
+    The cost approximates the rows an operation loads. Every list or connection
+    field costs one unit for its query plus one per item it may return: the
+    requested page size for connections, the length of its list argument (as in
+    eventStats(ids)) or a default list size otherwise. What is selected on each
+    item is multiplied by that number of items. Singular object fields nested
+    in a result are free, since they come from their parent or from a batched
+    DataLoader, and scalars are free. Root fields cost at least one unit, and
+    list arguments such as redeemTickets(ticketIds) add one unit per element.
+
+    Relay wrappers (edges, node, pageInfo) count neither for the cost nor for
+    the depth, so the depth is the number of logical levels of the query.
+    Introspection fields are ignored.
+    """
+
+    def __init__(self, schema, default_page_size, max_page_size, default_list_size):
+        self.schema = schema
+        self.default_page_size = default_page_size
+        self.max_page_size = max_page_size
+        self.default_list_size = default_list_size
+
+    def analyze(self, document_ast, operation_name=None, variables=None):
+        """
+        Returns the estimated cost and the depth of the selected operation.
+        """
+        operation = get_operation_ast(document_ast, operation_name)
+        if operation is None:
+            return QueryCost(0, 0)
+
+        root_type = {
+            "query": self.schema.get_query_type(),
+            "mutation": self.schema.get_mutation_type(),
+            "subscription": self.schema.get_subscription_type(),
+        }.get(operation.operation)
+        if root_type is None:
+            return QueryCost(0, 0)
+
+        fragments = {
+            definition.name.value: definition
+            for definition in document_ast.definitions
+            if isinstance(definition, ast.FragmentDefinition)
+        }
+        return self._selection_set_cost(
+            operation.selection_set, root_type, fragments, variables or {}, ()
+        )
+
+    def _selection_set_cost(self, selection_set, parent_type, fragments, variables, seen):
+        cost = depth = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.Field):
+                field_cost = self._field_cost(
+                    selection, parent_type, fragments, variables, seen
+                )
+            elif isinstance(selection, ast.InlineFragment):
+                fragment_type = parent_type
+                if selection.type_condition:
+                    fragment_type = self.schema.get_type(
+                        selection.type_condition.name.value
+                    )
+                field_cost = self._selection_set_cost(
+                    selection.selection_set, fragment_type, fragments, variables, seen
+                )
+            else:
+                name = selection.name.value
+                fragment = fragments.get(name)
+                if fragment is None or name in seen:
+                    continue
+                field_cost = self._selection_set_cost(
+                    fragment.selection_set,
+                    self.schema.get_type(fragment.type_condition.name.value),
+                    fragments,
+                    variables,
+                    seen + (name,),
+                )
+            cost += field_cost.cost
+            depth = max(depth, field_cost.depth)
+        return QueryCost(cost, depth)
+
+    def _field_cost(self, field, parent_type, fragments, variables, seen):
+        name = field.name.value
+        fields = getattr(parent_type, "fields", None) or {}
+        field_def = fields.get(name)
+        if name.startswith("__") or field_def is None:
+            return QueryCost(0, 0)
+
+        list_items = self._list_argument_items(field, variables)
+        is_root = parent_type in self._root_types()
+        if not field.selection_set:
+            own_cost = max(list_items, 1) if is_root else list_items
+            return QueryCost(own_cost, 1)
+
+        field_type, is_list = field_def.type, False
+        while isinstance(field_type, (GraphQLNonNull, GraphQLList)):
+            is_list = is_list or isinstance(field_type, GraphQLList)
+            field_type = field_type.of_type
+
+        children = self._selection_set_cost(
+            field.selection_set, field_type, fragments, variables, seen
+        )
+        if name in CONNECTION_WRAPPER_FIELDS and (
+            "pageInfo" in fields or "cursor" in fields
+        ):
+            return children
+
+        if "first" in field_def.args:
+            items = self._page_size(field, variables)
+        elif is_list:
+            items = list_items or self.default_list_size
+        else:
+            own_cost = max(list_items, 1) if is_root else list_items
+            return QueryCost(own_cost + children.cost, children.depth + 1)
+
+        return QueryCost(1 + items * (1 + children.cost), children.depth + 1)
+
+    def _root_types(self):
+        return (
+            self.schema.get_query_type(),
+            self.schema.get_mutation_type(),
+            self.schema.get_subscription_type(),
+        )
+
+    def _list_argument_items(self, field, variables):
+        """
+        Returns the total number of elements passed in the list arguments of a field.
+        """
+        items = 0
+        for argument in field.arguments:
+            value = argument.value
+            if isinstance(value, ast.Variable):
+                value = variables.get(value.name.value)
+                if isinstance(value, (list, tuple)):
+                    items += len(value)
+            elif isinstance(value, ast.ListValue):
+                items += len(value.values)
+        return items
+
+    def _page_size(self, field, variables):
+        requested = None
+        for argument in field.arguments:
+            if argument.name.value != "first":
+                continue
+            if isinstance(argument.value, ast.Variable):
+                requested = variables.get(argument.value.name.value)
+            elif isinstance(argument.value, ast.IntValue):
+                requested = int(argument.value.value)
+
+        if not isinstance(requested, int) or requested < 1:
+            return self.default_page_size
+        return min(requested, self.max_page_size)
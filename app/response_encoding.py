@@ -0,0 +1,76 @@
+"""
+JSON encoding and content-encoding negotiation for GraphQL responses.
+"""
+import gzip
+import json
+
+try:
+    # Optional dependency, looked up once rather than on every response
+    import brotli
+except ImportError:
+    brotli = None
+
+# Compression settings tuned for per-request, dynamic bodies rather than ratio
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+# Content codings this process can produce, most preferred first
+AVAILABLE_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def _stdlib_encode(data):
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _pretty_encode(data):
+    return json.dumps(data, indent=2, separators=(",", ": "))
+
+
+def json_encoder(name):
+    """
+    Returns the function serializing compact JSON responses for GRAPHQL_JSON_ENCODER.
+
+    "orjson" requires the optional orjson package, "auto" uses it when it is
+    installed and "json" always uses the standard library.
+    """
+    if name == "json":
+        return _stdlib_encode
+    try:
+        # Optional dependency, several times faster on large results
+        import orjson
+    except ImportError:
+        if name == "orjson":
+            raise
+        return _stdlib_encode
+    return orjson.dumps
+
+
+def encode(data, encoder_name, pretty=False):
+    """
+    Serializes a response body; pretty output (GraphiQL, ?pretty) always uses the standard library.
+    """
+    if pretty:
+        return _pretty_encode(data)
+    return json_encoder(encoder_name)(data)
+
+
+def available_encodings():
+    """
+    Returns the content codings this process can produce, most preferred first.
+    """
+    return list(AVAILABLE_ENCODINGS)
+
+
+def compress(body, coding):
+    """
+    Compresses a response body with the given content coding.
+    """
+    if coding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+def negotiate(accept_encodings):
+    """
+    Picks the content coding for a request's Accept-Encoding, or None to send the body as is.
+    """
+    return accept_encodings.best_match(AVAILABLE_ENCODINGS)
@@ -0,0 +1,119 @@
+"""
+Production server for the Flask application: a pre-forking Gunicorn master.
+"""
+from flask_script import Command, Option, Server
+
+from app import db, metrics
+from app.startup import start_background_tasks, startup
+
+
+def gunicorn_options(config, host, port, workers=None, threads=None):
+    """
+    Builds the Gunicorn settings from the application configuration.
+    """
+    return {
+        "bind": f"{host}:{port}",
+        "workers": workers or config["SERVER_WORKERS"],
+        "threads": threads or config["SERVER_THREADS"],
+        "timeout": config["SERVER_TIMEOUT"],
+        "graceful_timeout": config["SERVER_GRACEFUL_TIMEOUT"],
+        "max_requests": config["SERVER_MAX_REQUESTS"],
+        "max_requests_jitter": config["SERVER_MAX_REQUESTS"] // 10,
+        # Import the application, its schema and its caches once in the master.
+        # Workers are then forked from that code, so a deploy needs a new master
+        "preload_app": True,
+        # Lets a USR2 upgrade be followed: the old master's file becomes <pidfile>.oldbin
+        "pidfile": config["SERVER_PIDFILE"] or None,
+    }
+
+
+def build_gunicorn_app(flask_app, options):
+    """
+    Wraps the Flask application in a Gunicorn application with the given settings.
+    """
+    from gunicorn.app.base import BaseApplication
+
+    def pre_fork(server, worker):
+        # Never let a worker inherit sockets the master opened while preloading
+        with flask_app.app_context():
+            db.get_engine().dispose()
+
+    def post_fork(server, worker):
+        # Every worker builds its own connection pool, then warms up before
+        # it starts accepting connections, for at most half of SERVER_TIMEOUT
+        with flask_app.app_context():
+            db.get_engine().dispose()
+        startup.start(flask_app)
+        start_background_tasks(flask_app)
+
+    def worker_exit(server, worker):
+        from app.tickets.services.inventory_allocator import inventory_allocator
+        from app.tickets.services.rollup_compactor import rollup_compactor
+
+        with flask_app.app_context():
+            inventory_allocator.release_all()
+            rollup_compactor.flush()
+
+    def child_exit(server, worker):
+        # Runs in the master: stop reporting the gauges of the exited worker
+        metrics.mark_process_dead(worker.pid)
+
+    class FlaskApplication(BaseApplication):
+        def load_config(self):
+            hooks = {
+                "pre_fork": pre_fork,
+                "post_fork": post_fork,
+                "worker_exit": worker_exit,
+                "child_exit": child_exit,
+            }
+            for key, value in {**options, **hooks}.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return flask_app
+
+    return FlaskApplication()
+
+
+class Serve(Command):
+    """
+    Runs the application with Gunicorn, preloading it before forking the workers.
+
+    Because the code is loaded by the master, SIGHUP only replaces the workers
+    with new forks of the same code; it does not pick up a deploy. To upgrade
+    the code without dropping requests, send USR2 to the master, which starts a
+    new master running the new code next to the old one, then WINCH to the old
+    master to stop its workers gracefully and QUIT once the new workers are
+    ready (or HUP then QUIT on the new master to roll back).
+    """
+
+    help = description = "Runs the application with a multi-process Gunicorn server"
+
+    def __init__(self, host="0.0.0.0", port=5000):
+        self.host = host
+        self.port = port
+
+    def get_options(self):
+        return (
+            Option("-h", "--host", dest="host", default=self.host),
+            Option("-p", "--port", dest="port", type=int, default=self.port),
+            Option("-w", "--workers", dest="workers", type=int, default=None),
+            Option("-t", "--threads", dest="threads", type=int, default=None),
+        )
+
+    def __call__(self, app, host, port, workers, threads):
+        options = gunicorn_options(app.config, host, port, workers, threads)
+        # Start the shared metrics from zero rather than from a previous run
+        metrics.clear()
+        build_gunicorn_app(app, options).run()
+
+
+class DevelopmentServer(Server):
+    """
+    Flask development server that warms the application up before serving.
+    """
+
+    def __call__(self, app, *args, **kwargs):
+        startup.start(app)
+        start_background_tasks(app)
+        return super().__call__(app, *args, **kwargs)
@@ -0,0 +1,165 @@
+"""
+Per-request accounting of the SQL statements issued while serving a request.
+"""
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.engine import Engine
+
+# Placeholder lists of IN clauses, whose length changes with the batch size
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s)(?:\s*,\s*(?:\?|%s|%\(\w+\)s))+\s*\)")
+_NUMBER = re.compile(r"\b\d+\b")
+_WHITESPACE = re.compile(r"\s+")
+
+_active_profile = ContextVar("sql_profile", default=None)
+_installed = False
+_install_lock = threading.Lock()
+
+
+def statement_shape(statement):
+    """
+    Reduces a SQL statement to its shape, so statements that only differ in
+    their parameters or in the length of an IN list compare equal.
+    """
+    shape = _PLACEHOLDER_LIST.sub("(?)", statement)
+    shape = _NUMBER.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryProfile:
+    """
+    Statements, database time and rows fetched during one profiled block.
+    """
+
+    def __init__(self):
+        self.statements = []
+        self.duration = 0.0
+        self.rows = 0
+
+    def __len__(self):
+        return len(self.statements)
+
+    def repeated(self, threshold):
+        """
+        Returns the statement shapes executed at least threshold times, most frequent first.
+
+        A shape repeated once per parent row is the signature of an N+1 query.
+        """
+        counts = Counter(statement_shape(statement) for statement in self.statements)
+        return [
+            {"statement": shape, "count": count}
+            for shape, count in counts.most_common()
+            if count >= threshold
+        ]
+
+    def as_dict(self, repeat_threshold):
+        """
+        Summarizes the profile for the extensions of a GraphQL response.
+        """
+        return {
+            "statements": len(self.statements),
+            "duration_ms": round(self.duration * 1000, 3),
+            "rows": self.rows,
+            "repeated": self.repeated(repeat_threshold),
+        }
+
+
+class _RowCountingCursor:
+    """
+    DBAPI cursor proxy that adds the rows fetched through it to a profile.
+    """
+
+    def __init__(self, cursor, profile):
+        self._cursor = cursor
+        self._profile = profile
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        for row in self._cursor:
+            self._profile.rows += 1
+            yield row
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._profile.rows += 1
+        return row
+
+    def fetchmany(self, *args):
+        rows = self._cursor.fetchmany(*args)
+        self._profile.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._profile.rows += len(rows)
+        return rows
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _active_profile.get()
+    if profile is not None and context is not None:
+        context._profile_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _active_profile.get()
+    if profile is None or context is None:
+        return
+    started = getattr(context, "_profile_started", None)
+    if started is not None:
+        profile.duration += time.perf_counter() - started
+    profile.statements.append(statement)
+    # The result proxy is built from context.cursor right after this event
+    if context.cursor is cursor:
+        context.cursor = _RowCountingCursor(cursor, profile)
+
+
+def _install():
+    """
+    Listens to every engine the first time a profile is opened, so requests
+    served without profiling never pay for the hooks.
+    """
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        sa_event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        sa_event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        _installed = True
+
+
+@contextmanager
+def profile():
+    """
+    Records the statements issued by the current thread inside the block.
+    """
+    _install()
+    query_profile = QueryProfile()
+    token = _active_profile.set(query_profile)
+    try:
+        yield query_profile
+    finally:
+        _active_profile.reset(token)
+
+
+@contextmanager
+def query_budget(max_statements):
+    """
+    Fails with an AssertionError when the block issues more than max_statements
+    statements, listing them so fan-out regressions are easy to find.
+    """
+    with profile() as query_profile:
+        yield query_profile
+    if len(query_profile) > max_statements:
+        raise AssertionError(
+            f"Expected at most {max_statements} SQL statements, got "
+            f"{len(query_profile)}:\n" + "\n".join(query_profile.statements)
+        )
@@ -0,0 +1,217 @@
+"""
+Explicit warm-up phase run by each worker before it accepts traffic.
+"""
+import logging
+import os
+import threading
+import time
+from datetime import date
+
+from flask import jsonify
+from sqlalchemy.pool import QueuePool
+
+from app import db
+
+logger = logging.getLogger(__name__)
+
+# Seconds before retrying a failed warm-up, doubled after every failure up to the maximum
+RETRY_DELAY = 1
+MAX_RETRY_DELAY = 30
+
+# Read-only operations executed end to end so the first real request finds
+# compiled SQL, configured mappers, loaded resolvers and warm connections
+WARMUP_QUERIES = [
+    "{ events(first: 20) { edges { node { id name startDate endDate totalTickets soldTickets } } pageInfo { hasNextPage endCursor } } }",
+    "{ events(first: 5) { edges { node { id tickets(first: 10) { edges { node { id status event { name } } } } } } } }",
+    "{ tickets(first: 20) { edges { cursor node { id status createdAt redeemedAt } } } }",
+]
+
+# Write operations are only parsed and validated into the document cache
+WARMUP_MUTATIONS = [
+    "mutation Sell($eventId: Int!) { sellTicket(input: { eventId: $eventId }) { ticket { id status } } }",
+    "mutation SellMany($eventId: Int!, $quantity: Int!) { sellTickets(eventId: $eventId, quantity: $quantity) { tickets { id } } }",
+    "mutation Redeem($ticketId: Int!) { redeemTicket(input: { ticketId: $ticketId }) { ticket { id redeemedAt } } }",
+    "mutation RedeemMany($ids: [Int]!) { redeemTickets(ticketIds: $ids) { results { ticketId ok error } } }",
+]
+
+
+class Startup:
+    """
+    Tracks the warm-up of this worker and whether it is ready for traffic.
+    """
+
+    def __init__(self):
+        self.ready = False
+        self.error = None
+        self.steps = {}
+        self._lock = threading.Lock()
+
+    def warm_up(self, app):
+        """
+        Opens the connection pools, compiles the schema, primes the document and
+        event caches and runs the warm-up queries. Returns whether it succeeded.
+        """
+        with self._lock:
+            # The error of a previous attempt is reported until one succeeds
+            self.ready = False
+            self.steps = {}
+            steps = [
+                ("open_pools", open_pools),
+                ("compile_schema", compile_schema),
+                ("prime_document_cache", prime_document_cache),
+                ("run_warmup_queries", run_warmup_queries),
+                ("prime_event_cache", prime_event_cache),
+            ]
+            with app.app_context():
+                for name, step in steps:
+                    started = time.perf_counter()
+                    try:
+                        step(app)
+                    except Exception as e:
+                        logger.exception("Warm-up step %s failed", name)
+                        self.error = f"{name}: {e}"
+                        return False
+                    finally:
+                        db.session.remove()
+                        self.steps[name] = round(time.perf_counter() - started, 4)
+            self.ready = True
+            self.error = None
+            logger.info("Warm-up finished in %.3fs", sum(self.steps.values()))
+            return True
+
+    def start(self, app, wait=None):
+        """
+        Warms the worker up in a background thread, retrying failed attempts with
+        exponential backoff until one succeeds, and waits up to `wait` seconds
+        for it (half of SERVER_TIMEOUT by default). A healthy worker is thus
+        warm before it accepts connections, while a slow or unreachable
+        database can neither get the worker killed for missing the server
+        timeout nor leave it unready for good: /ready answers 503 until an
+        attempt succeeds. Returns whether the worker is ready.
+        """
+        if wait is None:
+            wait = app.config.get("SERVER_TIMEOUT", 30) / 2
+        thread = threading.Thread(
+            target=self._warm_up_until_ready,
+            args=(app,),
+            name="startup-warm-up",
+            daemon=True,
+        )
+        thread.start()
+        thread.join(wait)
+        if not self.ready:
+            logger.warning("Worker accepting connections before its warm-up finished")
+        return self.ready
+
+    def _warm_up_until_ready(self, app):
+        delay = RETRY_DELAY
+        while not self.warm_up(app):
+            logger.warning("Retrying the warm-up in %ss", delay)
+            time.sleep(delay)
+            delay = min(delay * 2, MAX_RETRY_DELAY)
+
+    def status(self):
+        return {"ready": self.ready, "error": self.error, "steps": dict(self.steps)}
+
+
+def open_pools(app):
+    """
+    Opens the persistent connections of the primary and every replica pool.
+    """
+    for bind in [None] + list(app.config.get("DATABASE_REPLICA_BINDS") or []):
+        engine = db.get_engine(app, bind=bind)
+        size = engine.pool.size() if isinstance(engine.pool, QueuePool) else 1
+        connections = [engine.connect() for _ in range(max(size, 1))]
+        try:
+            for connection in connections:
+                connection.execute("SELECT 1")
+        finally:
+            for connection in connections:
+                connection.close()
+
+
+def compile_schema(app):
+    """
+    Builds every lazily computed type and field map of the schema through introspection.
+    """
+    from app.schema import schema
+
+    result = schema.execute("{ __schema { types { name fields { name } } } }")
+    if result.errors:
+        raise result.errors[0]
+
+
+def prime_document_cache(app):
+    from app.custom_graphql_view import document_cache
+    from app.schema import schema
+
+    for operation in WARMUP_QUERIES + WARMUP_MUTATIONS:
+        document_cache.document_from_string(schema, operation)
+
+
+def run_warmup_queries(app):
+    """
+    Executes the read-only warm-up operations through the GraphQL endpoint.
+    """
+    from app.graphql_metrics import SKIP_METRICS_KEY
+
+    # Synthetic traffic stays out of the per-operation and resolver metrics
+    client = app.test_client()
+    for operation in WARMUP_QUERIES:
+        response = client.post(
+            "/graphql/v1",
+            json={"query": operation},
+            environ_base={SKIP_METRICS_KEY: True},
+        )
+        if response.status_code == 404:
+            # The endpoint is not mounted on this application
+            return
+        if response.status_code != 200:
+            raise RuntimeError(f"Warm-up query failed: {response.get_data(as_text=True)}")
+
+
+def prime_event_cache(app):
+    """
+    Loads the snapshots of current and upcoming events into the event cache.
+    """
+    from app.events.models.event_model import Event as EventModel
+    from app.events.services.event_service import EventService
+
+    event_ids = [
+        event_id
+        for event_id, in db.session.query(EventModel.id)
+        .filter(EventModel.end_date >= date.today())
+        .order_by(EventModel.start_date)
+        .limit(app.config["STARTUP_WARMUP_EVENTS"])
+    ]
+    EventService.get_event_snapshots(event_ids)
+
+
+def start_background_tasks(app):
+    """
+    Starts the periodic background threads of this worker.
+
+    Called once the worker process exists (Gunicorn post_fork, ASGI startup or
+    the development server), since threads started in a preloading master do
+    not survive the fork.
+    """
+    from app.tickets.services.hold_sweeper import hold_sweeper
+    from app.tickets.services.inventory_allocator import inventory_allocator
+    from app.tickets.services.rollup_compactor import rollup_compactor
+
+    hold_sweeper.start()
+    inventory_allocator.start()
+    rollup_compactor.start()
+
+
+def readiness():
+    """
+    Reports whether this worker finished its warm-up (200) or not yet (503).
+    """
+    status = startup.status()
+    status["pid"] = os.getpid()
+    return jsonify(status), 200 if startup.ready else 503
+
+
+# Warm-up state of this worker
+startup = Startup()
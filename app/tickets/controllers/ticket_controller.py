@@ -1,3 +1,4 @@
+from app.tickets.services.sales_rollup_service import SalesRollupService
 from app.tickets.services.ticket_service import TicketService
 
 
@@ -9,6 +10,27 @@ class TicketController:
         """
         return TicketService.sell_ticket(event_id)
 
+    @staticmethod
+    def sell_tickets(event_id, quantity):
+        """
+        Vende varios boletos para el evento especificado en una sola transacción.
+        """
+        return TicketService.sell_tickets(event_id, quantity)
+
+    @staticmethod
+    def reserve_tickets(event_id, quantity):
+        """
+        Aparta boletos del evento mientras el comprador completa el pago.
+        """
+        return TicketService.reserve_tickets(event_id, quantity)
+
+    @staticmethod
+    def confirm_reservation(hold_id):
+        """
+        Confirma un apartado vigente y emite sus boletos.
+        """
+        return TicketService.confirm_reservation(hold_id)
+
     @staticmethod
     def redeem_ticket(ticket_id):
         """
@@ -17,11 +39,32 @@ class TicketController:
         return TicketService.redeem_ticket(ticket_id)
 
     @staticmethod
-    def get_all_tickets():
+    def redeem_tickets(ticket_ids):
+        """
+        Canjea un lote de boletos y devuelve el resultado de cada uno.
+        """
+        return TicketService.redeem_tickets(ticket_ids)
+
+    @staticmethod
+    def get_sales_timeseries(event_id, start, end, granularity):
+        """
+        Obtiene los boletos vendidos y canjeados de un evento por minuto u hora.
+        """
+        return SalesRollupService.get_timeseries(event_id, start, end, granularity)
+
+    @staticmethod
+    def iter_event_tickets(event_id, after_id=None, chunk_size=1000):
+        """
+        Recorre los boletos de un evento en orden de ID, opcionalmente después de un ID dado.
+        """
+        return TicketService.iter_event_tickets(event_id, after_id, chunk_size)
+
+    @staticmethod
+    def get_all_tickets(after_id=None, limit=None):
         """
-        Obtiene todos los boletos.
+        Obtiene los boletos ordenados por ID, opcionalmente paginados por cursor.
         """
-        return TicketService.get_all_tickets()
+        return TicketService.get_all_tickets(after_id, limit)
 
     @staticmethod
     def get_ticket_by_id(ticket_id):
@@ -0,0 +1,114 @@
+"""
+Streaming export of the tickets of an event as NDJSON or CSV.
+"""
+import csv
+import io
+import json
+from itertools import islice
+
+from flask import Response, current_app, jsonify, request, stream_with_context
+
+from app.events.services.event_service import EventService
+from app.tickets.controllers.ticket_controller import TicketController
+
+EXPORT_FIELDS = ("id", "event_id", "status", "created_at", "redeemed_at")
+
+
+def _isoformat(value):
+    return value.isoformat() if value is not None else None
+
+
+def ndjson_lines(rows, chunk_size, include_header=True):
+    """
+    Encodes rows as one JSON object per line, chunk_size rows per yielded string.
+    NDJSON has no header, so include_header is ignored.
+    """
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield "".join(
+            json.dumps(
+                {
+                    "id": row.id,
+                    "event_id": row.event_id,
+                    "status": row.status,
+                    "created_at": _isoformat(row.created_at),
+                    "redeemed_at": _isoformat(row.redeemed_at),
+                }
+            )
+            + "\n"
+            for row in chunk
+        )
+
+
+def csv_lines(rows, chunk_size, include_header=True):
+    """
+    Encodes rows as CSV, chunk_size rows per yielded string. The header is left
+    out when resuming, so the output can be appended to a partial download.
+    """
+    rows = iter(rows)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if include_header:
+        writer.writerow(EXPORT_FIELDS)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        writer.writerows(
+            (
+                row.id,
+                row.event_id,
+                row.status,
+                _isoformat(row.created_at),
+                _isoformat(row.redeemed_at) or "",
+            )
+            for row in chunk
+        )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+# Encoder and MIME type of each export format
+FORMATS = {
+    "ndjson": (ndjson_lines, "application/x-ndjson"),
+    "csv": (csv_lines, "text/csv"),
+}
+
+
+def export_tickets(event_id):
+    """
+    Streams every ticket of an event, ordered by ID.
+
+    ?format= selects ndjson (default) or csv. After a dropped connection, pass
+    the last ticket ID received as ?after= to continue from the next ticket.
+    """
+    export_format = request.args.get("format", "ndjson")
+    if export_format not in FORMATS:
+        return jsonify({"error": f"Unknown export format: {export_format}"}), 400
+    after = request.args.get("after")
+    if after is not None and not after.isdigit():
+        return jsonify({"error": "after must be a ticket ID"}), 400
+    after_id = int(after) if after is not None else None
+
+    if EventService.get_event_snapshot(event_id) is None:
+        return jsonify({"error": "Event not found"}), 404
+
+    chunk_size = current_app.config["TICKET_EXPORT_CHUNK_SIZE"]
+    encode, mimetype = FORMATS[export_format]
+    rows = TicketController.iter_event_tickets(event_id, after_id, chunk_size)
+    body = encode(rows, chunk_size, include_header=after_id is None)
+    return Response(
+        stream_with_context(body),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="event-{event_id}-tickets.{export_format}"'
+            )
+        },
+    )
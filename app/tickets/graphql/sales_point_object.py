@@ -0,0 +1,20 @@
+import graphene
+
+
+class SalesGranularity(graphene.Enum):
+    """
+    Width of the buckets of a sales time series.
+    """
+
+    MINUTE = "minute"
+    HOUR = "hour"
+
+
+class SalesPointObject(graphene.ObjectType):
+    """
+    Tickets sold and redeemed for an event within one time bucket.
+    """
+
+    bucket_start = graphene.DateTime()
+    sold = graphene.Int()
+    redeemed = graphene.Int()
@@ -0,0 +1,12 @@
+from graphene_sqlalchemy import SQLAlchemyObjectType
+
+from app.tickets.models.ticket_hold_model import TicketHold as TicketHoldModel
+
+
+class TicketHoldObject(SQLAlchemyObjectType):
+    """
+    GraphQL representation of a TicketHold, mapped to the TicketHoldModel.
+    """
+
+    class Meta:
+        model = TicketHoldModel
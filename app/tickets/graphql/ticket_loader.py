@@ -0,0 +1,43 @@
+from collections import defaultdict
+
+from promise import Promise
+from promise.dataloader import DataLoader
+from sqlalchemy import select, union_all
+
+from app.tickets.models.ticket_model import Ticket as TicketModel
+
+
+class TicketsByEventLoader(DataLoader):
+    """
+    Batches ticket pages of many events into a single query per execution level.
+
+    Keys are (event_id, after_id, limit) tuples. Each event contributes a keyset
+    subquery limited to its page size plus one row, and all of them are combined
+    with UNION ALL so the database never returns more rows than the response needs.
+    """
+
+    def batch_load_fn(self, keys):
+        tickets = TicketModel.__table__
+        pages = []
+        for event_id, after_id, limit in keys:
+            page = tickets.select().where(tickets.c.event_id == event_id)
+            if after_id is not None:
+                page = page.where(tickets.c.id > after_id)
+            page = page.order_by(tickets.c.id).limit(limit + 1).alias()
+            pages.append(select([page]))
+
+        rows = TicketModel.query.from_statement(union_all(*pages)).all()
+        tickets_by_event = defaultdict(list)
+        for ticket in sorted(rows, key=lambda ticket: ticket.id):
+            tickets_by_event[ticket.event_id].append(ticket)
+
+        return Promise.resolve(
+            [
+                [
+                    ticket
+                    for ticket in tickets_by_event[event_id]
+                    if after_id is None or ticket.id > after_id
+                ][: limit + 1]
+                for event_id, after_id, limit in keys
+            ]
+        )
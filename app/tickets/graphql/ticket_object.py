@@ -1,3 +1,4 @@
+from graphene import relay
 from graphene_sqlalchemy import SQLAlchemyObjectType
 
 from app.tickets.models.ticket_model import Ticket as TicketModel
@@ -10,3 +11,18 @@ class TicketObject(SQLAlchemyObjectType):
 
     class Meta:
         model = TicketModel
+
+    def resolve_event(self, info):
+        """
+        Resolver for the event backref, batching lookups across all tickets in the response.
+        """
+        return info.context["event_loader"].load(self.event_id)
+
+
+class TicketConnection(relay.Connection):
+    """
+    Cursor-paginated list of tickets.
+    """
+
+    class Meta:
+        node = TicketObject
@@ -1,17 +1,31 @@
 import graphene
+from graphql import GraphQLError
 
-from app.tickets.graphql.ticket_object import TicketObject
+from app.pagination import build_connection, connection_args, paginate_query
+from app.tickets.controllers.ticket_controller import TicketController
+from app.tickets.graphql.sales_point_object import SalesGranularity, SalesPointObject
+from app.tickets.graphql.ticket_object import TicketConnection, TicketObject
 from app.tickets.models.ticket_model import Ticket as TicketModel
 
 
 class TicketQuery(graphene.ObjectType):
     """
-    GraphQL query to retrieve a list of tickets, optionally filtered by event ID.
+    GraphQL query to retrieve a page of tickets, optionally filtered by event ID,
+    and the sales time series of an event.
     """
 
-    tickets = graphene.List(TicketObject, event_id=graphene.Int())
+    tickets = graphene.Field(
+        TicketConnection, event_id=graphene.Int(), **connection_args()
+    )
+    sales_timeseries = graphene.List(
+        SalesPointObject,
+        event_id=graphene.Int(required=True),
+        start=graphene.Argument(graphene.DateTime, required=True, name="from"),
+        end=graphene.Argument(graphene.DateTime, required=True, name="to"),
+        granularity=SalesGranularity(default_value=SalesGranularity.MINUTE.value),
+    )
 
-    def resolve_tickets(self, info, event_id=None):
+    def resolve_tickets(self, info, event_id=None, first=None, after=None):
         """
         Resolver for the tickets query.
         """
@@ -21,4 +35,16 @@ class TicketQuery(graphene.ObjectType):
         if event_id:
             query = query.filter(TicketModel.event_id == event_id)
 
-        return query.all()
+        rows, limit, after_id = paginate_query(query, TicketModel.id, first, after)
+        return build_connection(TicketConnection, rows, limit, after_id)
+
+    def resolve_sales_timeseries(self, info, event_id, start, end, granularity):
+        """
+        Resolver for salesTimeseries. Reads only the sales rollups, never the tickets.
+        """
+        try:
+            return TicketController.get_sales_timeseries(
+                event_id, start, end, granularity
+            )
+        except ValueError as e:
+            raise GraphQLError(e.args[0])
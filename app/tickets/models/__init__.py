@@ -1 +1,4 @@
-from app.events.models.event_model import Event
+from app.tickets.models.inventory_lease_model import InventoryLease
+from app.tickets.models.sales_rollup_model import SalesRollup
+from app.tickets.models.ticket_hold_model import TicketHold
+from app.tickets.models.ticket_model import Ticket
@@ -0,0 +1,25 @@
+from app import db
+
+
+class InventoryLease(db.Model):
+    """
+    Block of seats a worker reserved on an event counter and has not issued yet.
+
+    The row is decremented in the same transaction as every ticket issued from
+    the block, so it always holds the exact number of unissued seats. Leases
+    expire TICKET_INVENTORY_LEASE_TTL seconds after their last sale and are then
+    reclaimed by any worker, including those of a worker that was killed.
+    """
+
+    __tablename__ = "inventory_leases"
+    __table_args__ = (
+        # Serve the reclaim of expired leases as a range scan
+        db.Index("ix_inventory_leases_expires_at", "expires_at"),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    event_id = db.Column(db.Integer, db.ForeignKey("events.id"), nullable=False)
+    remaining = db.Column(db.Integer, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<InventoryLease {self.id}, Event: {self.event_id}, Remaining: {self.remaining}>"
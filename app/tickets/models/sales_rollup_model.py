@@ -0,0 +1,21 @@
+from app import db
+
+
+class SalesRollup(db.Model):
+    """
+    Tickets sold and redeemed for an event within one minute or one hour.
+
+    Minute buckets are written by the sale and redemption paths and merged into
+    hour buckets once they are older than the retention window.
+    """
+
+    __tablename__ = "sales_rollups"
+    # The primary key serves the time-series reads as a range scan per event
+    event_id = db.Column(db.Integer, db.ForeignKey("events.id"), primary_key=True)
+    granularity = db.Column(db.String(10), primary_key=True)
+    bucket_start = db.Column(db.DateTime, primary_key=True)
+    sold = db.Column(db.Integer, nullable=False, default=0)
+    redeemed = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<SalesRollup {self.event_id} {self.granularity} {self.bucket_start}>"
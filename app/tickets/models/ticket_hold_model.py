@@ -0,0 +1,22 @@
+from app import db
+
+
+class TicketHold(db.Model):
+    """
+    Seats of an event held for a buyer until they confirm the purchase or the hold expires.
+    """
+
+    __tablename__ = "ticket_holds"
+    __table_args__ = (
+        # Serve the expiry sweeper as a range scan over pending holds
+        db.Index("ix_ticket_holds_status_expires_at", "status", "expires_at"),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    event_id = db.Column(db.Integer, db.ForeignKey("events.id"), nullable=False)
+    quantity = db.Column(db.Integer, nullable=False)
+    status = db.Column(db.String(50), nullable=False, default="held")
+    created_at = db.Column(db.DateTime, default=db.func.now())
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<TicketHold {self.id}, Status: {self.status}>"
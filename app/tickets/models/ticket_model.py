@@ -8,6 +8,13 @@ class Ticket(db.Model):
     """
 
     __tablename__ = "tickets"
+    __table_args__ = (
+        # Serve per-event listings filtered by status or redemption state
+        db.Index("ix_tickets_event_id_status", "event_id", "status"),
+        db.Index("ix_tickets_event_id_redeemed_at", "event_id", "redeemed_at"),
+        # Stream an event's tickets in ID order and resume after a given ID
+        db.Index("ix_tickets_event_id_id", "event_id", "id"),
+    )
     id = db.Column(db.Integer, primary_key=True)
     created_at = db.Column(db.DateTime, default=db.func.now())
     redeemed_at = db.Column(db.DateTime, nullable=True)
@@ -1,13 +1,10 @@
-from datetime import datetime
-
 import graphene
 from graphene import relay
 from graphql import GraphQLError
 
-from app import db
 from app.tickets.controllers.ticket_controller import TicketController
+from app.tickets.graphql.ticket_hold_object import TicketHoldObject
 from app.tickets.graphql.ticket_object import TicketObject
-from app.tickets.models.ticket_model import Ticket as TicketModel
 
 
 class BadRequestException(GraphQLError):
@@ -45,6 +42,66 @@ class SellTicketMutation(graphene.Mutation):
             raise BadRequestException(str(e))
 
 
+class SellTicketsMutation(graphene.Mutation):
+    """
+    Mutation to sell several tickets for an event in one request.
+    """
+
+    class Arguments:
+        event_id = graphene.Int(required=True)
+        quantity = graphene.Int(required=True)
+
+    tickets = graphene.List(TicketObject)
+
+    def mutate(self, info, event_id, quantity):
+        try:
+            tickets = TicketController.sell_tickets(
+                event_id=event_id, quantity=quantity
+            )
+            return SellTicketsMutation(tickets=tickets)
+        except Exception as e:
+            raise BadRequestException(str(e))
+
+
+class ReserveTicketsMutation(graphene.Mutation):
+    """
+    Mutation to hold seats of an event while the buyer completes checkout.
+    """
+
+    class Arguments:
+        event_id = graphene.Int(required=True)
+        quantity = graphene.Int(required=True)
+
+    hold = graphene.Field(TicketHoldObject)
+
+    def mutate(self, info, event_id, quantity):
+        try:
+            hold = TicketController.reserve_tickets(
+                event_id=event_id, quantity=quantity
+            )
+            return ReserveTicketsMutation(hold=hold)
+        except Exception as e:
+            raise BadRequestException(str(e))
+
+
+class ConfirmReservationMutation(graphene.Mutation):
+    """
+    Mutation to turn a hold into sold tickets once the buyer has paid.
+    """
+
+    class Arguments:
+        hold_id = graphene.Int(required=True)
+
+    tickets = graphene.List(TicketObject)
+
+    def mutate(self, info, hold_id):
+        try:
+            tickets = TicketController.confirm_reservation(hold_id)
+            return ConfirmReservationMutation(tickets=tickets)
+        except Exception as e:
+            raise BadRequestException(str(e))
+
+
 class RedeemTicketInput(graphene.InputObjectType):
     """
     Input fields for redeeming a ticket.
@@ -64,22 +121,44 @@ class RedeemTicketMutation(graphene.Mutation):
     ticket = graphene.Field(TicketObject)
 
     def mutate(self, info, input):
-        ticket_id = input.ticket_id
+        try:
+            ticket = TicketController.redeem_ticket(ticket_id=input.ticket_id)
+            return RedeemTicketMutation(ticket=ticket)
+        except ValueError as e:
+            # Redemption checks run in the service, which also keeps the event counter
+            raise BadRequestException(e.args[0])
 
-        # Check if the ticket exists
-        ticket = TicketModel.query.get(ticket_id)
-        if not ticket:
-            raise BadRequestException("Ticket not found", 404)
 
-        # Check if the ticket has already been redeemed
-        if ticket.redeemed_at is not None:
-            raise BadRequestException("The ticket has already been redeemed", 409)
+class TicketRedemptionResult(graphene.ObjectType):
+    """
+    Outcome of redeeming a single ticket inside a batch.
+    """
 
-        # Redeem the ticket
-        ticket.redeemed_at = datetime.now()
-        db.session.commit()
+    ticket_id = graphene.Int()
+    ok = graphene.Boolean()
+    error = graphene.String()
+    ticket = graphene.Field(TicketObject)
+
+    def resolve_ok(self, info):
+        return self.error is None
+
+
+class RedeemTicketsMutation(graphene.Mutation):
+    """
+    Mutation to redeem a batch of tickets buffered by a gate scanner.
+    """
 
-        return RedeemTicketMutation(ticket=ticket)
+    class Arguments:
+        ticket_ids = graphene.List(graphene.Int, required=True)
+
+    results = graphene.List(TicketRedemptionResult)
+
+    def mutate(self, info, ticket_ids):
+        try:
+            results = TicketController.redeem_tickets(ticket_ids)
+            return RedeemTicketsMutation(results=results)
+        except Exception as e:
+            raise BadRequestException(str(e))
 
 
 class TicketQuery(graphene.ObjectType):
@@ -103,4 +182,8 @@ class TicketMutation(graphene.ObjectType):
     """
 
     sell_ticket = SellTicketMutation.Field()
+    sell_tickets = SellTicketsMutation.Field()
+    reserve_tickets = ReserveTicketsMutation.Field()
+    confirm_reservation = ConfirmReservationMutation.Field()
     redeem_ticket = RedeemTicketMutation.Field()
+    redeem_tickets = RedeemTicketsMutation.Field()
@@ -0,0 +1,108 @@
+import heapq
+import logging
+import threading
+import time
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class HoldSweeper:
+    """
+    Releases lapsed ticket holds in the background, off the request threads.
+
+    Expiry deadlines of the holds created by this worker are kept in a min-heap,
+    so the sweeper thread sleeps exactly until the next one lapses instead of
+    polling. It also wakes every TICKET_HOLD_SWEEP_INTERVAL seconds to catch
+    holds created by other workers or before a restart; that periodic sweep
+    starts with the worker, not with its first reservation. Every sweep releases the
+    due holds in batches read through the (status, expires_at) index, so it
+    never scans the whole table.
+    """
+
+    def __init__(self, interval=30, batch_size=1000):
+        self.interval = interval
+        self.batch_size = batch_size
+        self._deadlines = []
+        self._condition = threading.Condition()
+        self._app = None
+        self._thread = None
+
+    def init_app(self, app):
+        """
+        Configures the sweep interval and batch size from the application settings.
+        """
+        self.interval = app.config.get("TICKET_HOLD_SWEEP_INTERVAL", 30)
+        self.batch_size = app.config.get("TICKET_HOLD_SWEEP_BATCH_SIZE", 1000)
+        self._app = app
+
+    def schedule(self, expires_at):
+        """
+        Wakes the sweeper when a hold created by this worker expires.
+        """
+        with self._condition:
+            heapq.heappush(self._deadlines, expires_at)
+            if self._deadlines[0] == expires_at:
+                self._condition.notify()
+        self.start()
+
+    def sweep(self, now=None):
+        """
+        Releases every hold expired at the given time and returns how many were released.
+        """
+        from app.tickets.services.ticket_service import TicketService
+
+        now = now or datetime.now()
+        released = 0
+        while True:
+            count = TicketService.release_expired_holds(now, self.batch_size)
+            released += count
+            if count < self.batch_size:
+                return released
+
+    def start(self):
+        """
+        Starts the sweeper thread of this worker if it is not running yet.
+        """
+        if self._thread is not None or self._app is None:
+            return
+        with self._condition:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="ticket-hold-sweeper", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        next_periodic = time.monotonic() + self.interval
+        while True:
+            with self._condition:
+                timeout = next_periodic - time.monotonic()
+                if self._deadlines:
+                    until_due = (self._deadlines[0] - datetime.now()).total_seconds()
+                    timeout = min(timeout, until_due)
+                if timeout > 0:
+                    self._condition.wait(timeout)
+
+                now = datetime.now()
+                due = False
+                while self._deadlines and self._deadlines[0] <= now:
+                    heapq.heappop(self._deadlines)
+                    due = True
+
+            # Woken early by an earlier deadline that has not lapsed yet
+            if not due and time.monotonic() < next_periodic:
+                continue
+            if time.monotonic() >= next_periodic:
+                next_periodic = time.monotonic() + self.interval
+
+            try:
+                with self._app.app_context():
+                    self.sweep(now)
+            except Exception:
+                # Keep sweeping: lapsed holds are picked up again by the next pass
+                logger.exception("Releasing expired ticket holds failed")
+
+
+# Per-worker sweeper, configured by create_app
+hold_sweeper = HoldSweeper()
@@ -0,0 +1,297 @@
+import atexit
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from app import db
+from app.events.models.event_model import Event as EventModel
+from app.tickets.models.inventory_lease_model import InventoryLease as InventoryLeaseModel
+
+logger = logging.getLogger(__name__)
+
+# Attempts to lease a block before giving up when other workers keep winning the race
+MAX_LEASE_ATTEMPTS = 5
+# Expired leases reclaimed per transaction
+RECLAIM_BATCH_SIZE = 500
+
+
+class _Lease:
+    """
+    This worker's view of a lease row: its ID, the seats it believes are left
+    and when the row expires unless another sale extends it.
+    """
+
+    __slots__ = ("lease_id", "remaining", "expires_at")
+
+    def __init__(self, lease_id, remaining, expires_at):
+        self.lease_id = lease_id
+        self.remaining = remaining
+        self.expires_at = expires_at
+
+
+class InventoryAllocator:
+    """
+    Hi-lo style allocation of seats from per-worker blocks.
+
+    Instead of updating events.sold_tickets on every sale, a worker leases a block
+    of seats with one conditional counter update and then hands them out one by
+    one, so concurrent sales of a hot event stop contending on the event row.
+
+    Every lease is persisted in inventory_leases. Each sale decrements its lease
+    row in the sale transaction and pushes its expiry TICKET_INVENTORY_LEASE_TTL
+    seconds ahead, so the row always holds the exact number of unissued seats and
+    only this worker writes it. Leased seats count as sold on the counter until
+    they are issued or returned: once a lease expires, any worker's reaper
+    deletes the row and returns its remaining seats, which also recovers the
+    blocks of workers that were killed without shutting down. All leases of a
+    worker are returned on a clean shutdown.
+    """
+
+    def __init__(self, block_size=0, lease_ttl=30):
+        self.block_size = block_size
+        self.lease_ttl = lease_ttl
+        self._leases = {}
+        self._lock = threading.Lock()
+        self._lease_lock = threading.Lock()
+        self._app = None
+        self._reaper = None
+
+    def init_app(self, app):
+        """
+        Configures the block size and lease TTL from the application settings.
+        """
+        self.block_size = app.config.get("TICKET_INVENTORY_BLOCK_SIZE", 0)
+        self.lease_ttl = app.config.get("TICKET_INVENTORY_LEASE_TTL", 30)
+        self._app = app
+        if self.enabled:
+            atexit.register(self._release_on_exit)
+
+    @property
+    def enabled(self):
+        return self.block_size > 1
+
+    def acquire(self, event_id):
+        """
+        Takes one seat of the event, leasing a new block when the current one is
+        exhausted or has expired. The lease row is decremented in the current
+        transaction, which the caller commits with the ticket or rolls back.
+        Raises a ValueError when the event does not exist or has no seats left.
+        """
+        for _ in range(MAX_LEASE_ATTEMPTS):
+            lease = self._take(event_id)
+            if lease is None:
+                # Only one thread per worker leases at a time so they do not over-lease
+                with self._lease_lock:
+                    lease = self._take(event_id)
+                    if lease is None:
+                        lease = self._lease_block(event_id)
+                        with self._lock:
+                            self._leases[event_id] = lease
+                            lease.remaining -= 1
+                self.start()
+
+            if self._claim_seat(lease):
+                return
+            # The lease expired and may have been reclaimed: forget it and lease again
+            with self._lock:
+                if self._leases.get(event_id) is lease:
+                    del self._leases[event_id]
+
+        raise ValueError("No tickets available", 409)
+
+    def release(self, event_id, count=1):
+        """
+        Puts seats that were acquired but not issued back into the worker's lease,
+        after the transaction that claimed them was rolled back.
+        """
+        with self._lock:
+            lease = self._leases.get(event_id)
+            if lease is not None:
+                lease.remaining += count
+
+    def release_idle(self, now=None):
+        """
+        Returns the unused seats of every expired lease, whichever worker leased it.
+        Returns how many leases were reclaimed.
+        """
+        now = now or datetime.now()
+        with self._lock:
+            for event_id, lease in list(self._leases.items()):
+                if lease.expires_at <= now:
+                    del self._leases[event_id]
+
+        leases = InventoryLeaseModel.__table__
+        reclaimed = 0
+        while True:
+            rows = db.session.execute(
+                select([leases.c.id, leases.c.event_id, leases.c.remaining])
+                .where(leases.c.expires_at <= now)
+                .order_by(leases.c.expires_at)
+                .limit(RECLAIM_BATCH_SIZE)
+            ).fetchall()
+            reclaimed += self._reclaim(rows, expired_at=now)
+            if len(rows) < RECLAIM_BATCH_SIZE:
+                return reclaimed
+
+    def release_all(self):
+        """
+        Returns the unused seats of every lease of this worker, e.g. when it shuts down.
+        """
+        with self._lock:
+            lease_ids = [lease.lease_id for lease in self._leases.values()]
+            self._leases.clear()
+        if not lease_ids:
+            return
+
+        leases = InventoryLeaseModel.__table__
+        rows = db.session.execute(
+            select([leases.c.id, leases.c.event_id, leases.c.remaining]).where(
+                leases.c.id.in_(lease_ids)
+            )
+        ).fetchall()
+        self._reclaim(rows)
+
+    def start(self):
+        """
+        Starts the reaper thread of this worker if it is not running yet.
+        """
+        if self._reaper is not None or self._app is None or not self.enabled:
+            return
+        with self._lock:
+            if self._reaper is None:
+                self._reaper = threading.Thread(
+                    target=self._reap, name="inventory-lease-reaper", daemon=True
+                )
+                self._reaper.start()
+
+    def _take(self, event_id):
+        with self._lock:
+            lease = self._leases.get(event_id)
+            if (
+                lease is None
+                or lease.remaining < 1
+                or lease.expires_at <= datetime.now()
+            ):
+                return None
+            lease.remaining -= 1
+            return lease
+
+    def _claim_seat(self, lease):
+        """
+        Decrements the lease row and extends its expiry, unless it already expired.
+        """
+        leases = InventoryLeaseModel.__table__
+        now = datetime.now()
+        expires_at = now + timedelta(seconds=max(self.lease_ttl, 1))
+        result = db.session.execute(
+            leases.update()
+            .where(leases.c.id == lease.lease_id)
+            .where(leases.c.remaining > 0)
+            .where(leases.c.expires_at > now)
+            .values(remaining=leases.c.remaining - 1, expires_at=expires_at)
+        )
+        if result.rowcount != 1:
+            return False
+        lease.expires_at = expires_at
+        return True
+
+    def _lease_block(self, event_id):
+        """
+        Reserves up to block_size seats on the event counter and records them in a lease row.
+        """
+        events = EventModel.__table__
+        size = self.block_size
+        for _ in range(MAX_LEASE_ATTEMPTS):
+            result = db.session.execute(
+                events.update()
+                .where(events.c.id == event_id)
+                .where(
+                    events.c.sold_tickets + events.c.held_tickets + size
+                    <= events.c.total_tickets
+                )
+                .values(sold_tickets=events.c.sold_tickets + size)
+            )
+            if result.rowcount == 1:
+                expires_at = datetime.now() + timedelta(seconds=max(self.lease_ttl, 1))
+                lease_id = db.session.execute(
+                    InventoryLeaseModel.__table__.insert().values(
+                        event_id=event_id, remaining=size, expires_at=expires_at
+                    )
+                ).inserted_primary_key[0]
+                db.session.commit()
+                return _Lease(lease_id, size, expires_at)
+            db.session.rollback()
+
+            # Not enough capacity for a full block: lease whatever is left
+            remaining = db.session.execute(
+                select(
+                    [
+                        events.c.total_tickets
+                        - events.c.sold_tickets
+                        - events.c.held_tickets
+                    ]
+                ).where(events.c.id == event_id)
+            ).scalar()
+            if remaining is None:
+                raise ValueError("Event not found", 404)
+            if remaining < 1:
+                raise ValueError("No tickets available", 409)
+            size = min(self.block_size, remaining)
+
+        raise ValueError("No tickets available", 409)
+
+    def _reclaim(self, rows, expired_at=None):
+        """
+        Deletes lease rows and returns their unissued seats to the event counters,
+        in one transaction. A row is only deleted while it still holds the seats
+        that were read, so a concurrent sale or reaper makes it skip the lease.
+        Returns how many leases were reclaimed.
+        """
+        if not rows:
+            return 0
+
+        leases = InventoryLeaseModel.__table__
+        returned, reclaimed = {}, 0
+        for lease_id, event_id, remaining in rows:
+            statement = (
+                leases.delete()
+                .where(leases.c.id == lease_id)
+                .where(leases.c.remaining == remaining)
+            )
+            if expired_at is not None:
+                statement = statement.where(leases.c.expires_at <= expired_at)
+            if db.session.execute(statement).rowcount == 1:
+                returned[event_id] = returned.get(event_id, 0) + remaining
+                reclaimed += 1
+
+        events = EventModel.__table__
+        for event_id, count in returned.items():
+            if count > 0:
+                db.session.execute(
+                    events.update()
+                    .where(events.c.id == event_id)
+                    .values(sold_tickets=events.c.sold_tickets - count)
+                )
+        db.session.commit()
+        return reclaimed
+
+    def _release_on_exit(self):
+        with self._app.app_context():
+            self.release_all()
+
+    def _reap(self):
+        while True:
+            time.sleep(max(self.lease_ttl / 2, 1))
+            try:
+                with self._app.app_context():
+                    self.release_idle()
+            except Exception:
+                # Keep reaping: the next pass retries whatever this one left
+                logger.exception("Reclaiming expired inventory leases failed")
+
+
+# Per-worker allocator, configured by create_app
+inventory_allocator = InventoryAllocator()
@@ -0,0 +1,76 @@
+"""
+Per-worker buffer of sales rollup increments, written to the database in batches.
+"""
+import threading
+from collections import defaultdict
+
+from sqlalchemy import event
+
+from app.db_routing import RoutingSession
+
+# Session.info key of the increments staged by the current transaction
+PENDING_KEY = "sales_rollups"
+
+
+def _counts():
+    return defaultdict(lambda: [0, 0])
+
+
+class RollupBuffer:
+    """
+    Sums the rollup increments of committed transactions until they are flushed.
+
+    Sales and redemptions stage their increments on the session. They move to
+    this buffer when that transaction commits and are dropped when it rolls
+    back, so the buffer never counts a sale that did not happen. A flush then
+    writes one upsert per bucket for all the sales since the previous one,
+    instead of one upsert per sale on the same hot row inside every sale.
+    """
+
+    def __init__(self):
+        self._counts = _counts()
+        self._lock = threading.Lock()
+
+    def stage(self, session, event_id, bucket_start, sold=0, redeemed=0):
+        """
+        Adds increments to the current transaction of a session.
+        """
+        bucket = session.info.setdefault(PENDING_KEY, _counts())[(event_id, bucket_start)]
+        bucket[0] += sold
+        bucket[1] += redeemed
+
+    def add(self, counts):
+        """
+        Adds {(event_id, bucket_start): [sold, redeemed]} increments to the buffer.
+        """
+        with self._lock:
+            for key, (sold, redeemed) in counts.items():
+                bucket = self._counts[key]
+                bucket[0] += sold
+                bucket[1] += redeemed
+
+    def drain(self):
+        """
+        Empties the buffer and returns the increments it held.
+        """
+        with self._lock:
+            counts, self._counts = self._counts, _counts()
+        return dict(counts)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _publish_staged(session):
+    pending = session.info.pop(PENDING_KEY, None)
+    if pending:
+        rollup_buffer.add(pending)
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _discard_staged(session, transaction):
+    # Whatever is still staged when the outermost transaction ends was rolled back
+    if transaction.parent is None:
+        session.info.pop(PENDING_KEY, None)
+
+
+# Per-worker buffer, flushed by the rollup compactor thread
+rollup_buffer = RollupBuffer()
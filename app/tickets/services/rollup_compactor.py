@@ -0,0 +1,97 @@
+import atexit
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+
+class RollupCompactor:
+    """
+    Writes buffered sales rollups and merges old per-minute ones into hour buckets
+    in the background.
+
+    Every SALES_ROLLUP_FLUSH_INTERVAL seconds the increments buffered by this
+    worker's sales are written to their minute buckets. Minute resolution
+    matters while an event is on sale; afterwards the minute buckets are folded
+    into hours every SALES_ROLLUP_COMPACT_INTERVAL seconds so the rollup table
+    stays small. The thread starts with the worker, or with its first rollup.
+    """
+
+    def __init__(self, retention=86400, interval=300, batch_size=5000, flush_interval=5):
+        self.retention = retention
+        self.interval = interval
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._app = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """
+        Configures the retention window, intervals and batch size from the application settings.
+        """
+        self.retention = app.config.get("SALES_ROLLUP_MINUTE_RETENTION", 86400)
+        self.interval = app.config.get("SALES_ROLLUP_COMPACT_INTERVAL", 300)
+        self.batch_size = app.config.get("SALES_ROLLUP_COMPACT_BATCH_SIZE", 5000)
+        self.flush_interval = app.config.get("SALES_ROLLUP_FLUSH_INTERVAL", 5)
+        self._app = app
+        atexit.register(self._flush_on_exit)
+
+    def flush(self):
+        """
+        Writes the rollup increments buffered by this worker and returns how many buckets were written.
+        """
+        from app.tickets.services.sales_rollup_service import SalesRollupService
+
+        return SalesRollupService.flush()
+
+    def compact(self, now=None):
+        """
+        Compacts every minute bucket older than the retention window and returns how many were merged.
+        """
+        from app.tickets.services.sales_rollup_service import SalesRollupService
+
+        before = (now or datetime.now()) - timedelta(seconds=self.retention)
+        compacted = 0
+        while True:
+            count = SalesRollupService.compact(before, self.batch_size)
+            compacted += count
+            if count < self.batch_size:
+                return compacted
+
+    def start(self):
+        """
+        Starts the flush and compaction thread of this worker if it is not running yet.
+        """
+        if self._thread is not None or self._app is None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sales-rollup-compactor", daemon=True
+                )
+                self._thread.start()
+
+    def _flush_on_exit(self):
+        with self._app.app_context():
+            self.flush()
+
+    def _run(self):
+        stop = threading.Event()
+        next_compaction = time.monotonic() + self.interval
+        while not stop.wait(self.flush_interval):
+            try:
+                with self._app.app_context():
+                    self.flush()
+                    if time.monotonic() >= next_compaction:
+                        next_compaction = time.monotonic() + self.interval
+                        self.compact()
+            except Exception:
+                # Keep going: unwritten increments and unclaimed minute buckets are retried
+                logger.exception("Flushing or compacting sales rollups failed")
+
+
+# Per-worker compactor, configured by create_app
+rollup_compactor = RollupCompactor()
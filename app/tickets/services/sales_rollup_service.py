@@ -0,0 +1,188 @@
+from collections import defaultdict, namedtuple
+
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+from app import db
+from app.db_routing import reads_from_replica
+from app.tickets.models.sales_rollup_model import SalesRollup as SalesRollupModel
+from app.tickets.services.rollup_buffer import rollup_buffer
+from app.tickets.services.rollup_compactor import rollup_compactor
+
+# One bucket of a sales time series
+SalesPoint = namedtuple("SalesPoint", ["bucket_start", "sold", "redeemed"])
+
+GRANULARITIES = ("minute", "hour")
+
+
+def truncate(moment, granularity):
+    """
+    Returns the start of the minute or hour bucket containing a moment.
+    """
+    if granularity == "hour":
+        return moment.replace(minute=0, second=0, microsecond=0)
+    return moment.replace(second=0, microsecond=0)
+
+
+class SalesRollupService:
+    """
+    Service maintaining and reading the per-event sales rollups.
+    """
+
+    @staticmethod
+    def record(event_id, at, sold=0, redeemed=0):
+        """
+        Adds sold and redeemed tickets to the minute bucket of an event once the
+        current transaction commits.
+
+        No rollup row is written inside the sale or redemption transaction, so
+        sales of a hot event do not serialize on its bucket row. The increments
+        are buffered by the worker and written by flush(), every
+        SALES_ROLLUP_FLUSH_INTERVAL seconds.
+        """
+        rollup_buffer.stage(
+            db.session, event_id, truncate(at, "minute"), sold=sold, redeemed=redeemed
+        )
+        rollup_compactor.start()
+
+    @staticmethod
+    def flush():
+        """
+        Writes the buffered increments of this worker, one upsert per bucket, in one
+        transaction. Returns how many buckets were written.
+
+        On failure the increments go back to the buffer for the next flush.
+        """
+        counts = rollup_buffer.drain()
+        if not counts:
+            return 0
+        try:
+            # A fixed order keeps concurrent flushes of different workers from deadlocking
+            for (event_id, bucket_start), (sold, redeemed) in sorted(counts.items()):
+                SalesRollupService._add(event_id, "minute", bucket_start, sold, redeemed)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            rollup_buffer.add(counts)
+            raise
+        return len(counts)
+
+    @staticmethod
+    @reads_from_replica
+    def get_timeseries(event_id, start, end, granularity="minute"):
+        """
+        Returns the non-empty buckets of an event between start (inclusive) and end (exclusive).
+
+        Only the rollups are read, so the cost depends on the time range and not
+        on the number of tickets. Sales show up once their worker flushes them,
+        within SALES_ROLLUP_FLUSH_INTERVAL seconds. Hour buckets also include minute buckets that
+        have not been compacted yet; minute buckets are only available within
+        the retention window.
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Unknown granularity: {granularity}.", 400)
+        if end <= start:
+            raise ValueError("The end of the range must be after its start.", 400)
+
+        rollups = SalesRollupModel.__table__
+        granularities = ["minute"] if granularity == "minute" else ["minute", "hour"]
+        rows = db.session.execute(
+            rollups.select()
+            .where(rollups.c.event_id == event_id)
+            .where(rollups.c.granularity.in_(granularities))
+            .where(rollups.c.bucket_start >= truncate(start, granularity))
+            .where(rollups.c.bucket_start < end)
+        )
+
+        buckets = defaultdict(lambda: [0, 0])
+        for row in rows:
+            bucket = buckets[truncate(row.bucket_start, granularity)]
+            bucket[0] += row.sold
+            bucket[1] += row.redeemed
+        return [
+            SalesPoint(bucket_start, sold, redeemed)
+            for bucket_start, (sold, redeemed) in sorted(buckets.items())
+        ]
+
+    @staticmethod
+    def compact(before, batch_size):
+        """
+        Merges up to batch_size minute buckets that start before the given time into
+        hour buckets, in one transaction. Returns how many minute buckets were read.
+
+        Every worker compacts, so each minute row is claimed by deleting it with
+        the counts that were read: only rows this transaction actually deleted
+        are added to their hour, and a row taken by another worker, or changed
+        since it was read, is left for a later pass.
+        """
+        rollups = SalesRollupModel.__table__
+        rows = db.session.execute(
+            rollups.select()
+            .where(rollups.c.granularity == "minute")
+            .where(rollups.c.bucket_start < truncate(before, "hour"))
+            .order_by(rollups.c.bucket_start)
+            .limit(batch_size)
+        ).fetchall()
+        if not rows:
+            db.session.rollback()
+            return 0
+
+        hours = defaultdict(lambda: [0, 0])
+        for row in rows:
+            claimed = db.session.execute(
+                rollups.delete()
+                .where(rollups.c.event_id == row.event_id)
+                .where(rollups.c.granularity == "minute")
+                .where(rollups.c.bucket_start == row.bucket_start)
+                .where(rollups.c.sold == row.sold)
+                .where(rollups.c.redeemed == row.redeemed)
+            ).rowcount
+            if claimed != 1:
+                continue
+            bucket = hours[(row.event_id, truncate(row.bucket_start, "hour"))]
+            bucket[0] += row.sold
+            bucket[1] += row.redeemed
+        for (event_id, bucket_start), (sold, redeemed) in hours.items():
+            SalesRollupService._add(event_id, "hour", bucket_start, sold, redeemed)
+
+        db.session.commit()
+        return len(rows)
+
+    @staticmethod
+    def _add(event_id, granularity, bucket_start, sold, redeemed):
+        """
+        Upserts a bucket, adding to its counts when it already exists.
+
+        MySQL does it in one INSERT ... ON DUPLICATE KEY UPDATE. Other databases
+        update first and insert on a miss, which is safe on SQLite because it
+        serializes writers.
+        """
+        rollups = SalesRollupModel.__table__
+        values = {
+            "event_id": event_id,
+            "granularity": granularity,
+            "bucket_start": bucket_start,
+            "sold": sold,
+            "redeemed": redeemed,
+        }
+
+        if db.session.get_bind().dialect.name == "mysql":
+            statement = mysql_insert(rollups).values(values)
+            db.session.execute(
+                statement.on_duplicate_key_update(
+                    sold=rollups.c.sold + statement.inserted.sold,
+                    redeemed=rollups.c.redeemed + statement.inserted.redeemed,
+                )
+            )
+            return
+
+        result = db.session.execute(
+            rollups.update()
+            .where(rollups.c.event_id == event_id)
+            .where(rollups.c.granularity == granularity)
+            .where(rollups.c.bucket_start == bucket_start)
+            .values(
+                sold=rollups.c.sold + sold, redeemed=rollups.c.redeemed + redeemed
+            )
+        )
+        if result.rowcount == 0:
+            db.session.execute(rollups.insert().values(values))
@@ -1,8 +1,22 @@
-from datetime import datetime
+from collections import Counter, namedtuple
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import func, select
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app import db
+from app.db_routing import read_replica, reads_from_replica
 from app.events.models.event_model import Event as EventModel
+from app.events.services.event_service import EventService, event_cache
+from app.tickets.models.ticket_hold_model import TicketHold as TicketHoldModel
 from app.tickets.models.ticket_model import Ticket as TicketModel
+from app.tickets.services.hold_sweeper import hold_sweeper
+from app.tickets.services.inventory_allocator import inventory_allocator
+from app.tickets.services.sales_rollup_service import SalesRollupService
+
+# Outcome of redeeming a single ticket inside a batch; error is None on success
+RedemptionResult = namedtuple("RedemptionResult", ["ticket_id", "ticket", "error"])
 
 
 class TicketService:
@@ -14,23 +28,179 @@ class TicketService:
     def sell_ticket(event_id):
         """
         Sells a ticket for the specified event if tickets are available.
+
+        The seat is reserved with a single conditional UPDATE on the event counter,
+        which only matches while capacity remains, so concurrent sales can neither
+        oversell nor race on a Python-side read-modify-write. The ticket is inserted
+        in the same transaction and both are committed together.
+
+        When block allocation is enabled the seat comes from this worker's leased
+        block instead, and only the ticket row is written.
         """
-        event = EventModel.query.get(event_id)
-        if not event:
-            raise ValueError("Event not found", 404)
+        if inventory_allocator.enabled:
+            return TicketService._sell_leased_ticket(event_id)
 
-        if event.sold_tickets >= event.total_tickets:
-            raise ValueError("No tickets available", 409)
+        TicketService._reserve_inventory(event_id, 1)
 
-        # Create a ticket without the redeemed flag initially set
         ticket = TicketModel(event_id=event_id)
-        ticket.redeemed = False  # Set 'redeemed' after creation
-
-        event.sold_tickets += 1
         db.session.add(ticket)
+        SalesRollupService.record(event_id, datetime.now(), sold=1)
         db.session.commit()
         return ticket
 
+    @staticmethod
+    def _sell_leased_ticket(event_id):
+        """
+        Issues a ticket for a seat taken from the worker's leased block.
+        """
+        inventory_allocator.acquire(event_id)
+        try:
+            ticket = TicketModel(event_id=event_id)
+            db.session.add(ticket)
+            SalesRollupService.record(event_id, datetime.now(), sold=1)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            inventory_allocator.release(event_id)
+            raise
+        return ticket
+
+    @staticmethod
+    def sell_tickets(event_id, quantity):
+        """
+        Sells several tickets for the specified event in a single transaction.
+
+        All seats are reserved with one conditional counter update, the tickets are
+        inserted in the same transaction and everything is committed once.
+        """
+        if quantity is None or quantity < 1:
+            raise ValueError("Quantity must be at least 1.", 400)
+
+        TicketService._reserve_inventory(event_id, quantity)
+        tickets = TicketService._issue_tickets(event_id, quantity)
+        SalesRollupService.record(event_id, datetime.now(), sold=quantity)
+        db.session.commit()
+        return tickets
+
+    @staticmethod
+    def reserve_tickets(event_id, quantity):
+        """
+        Holds seats of an event for a buyer until they confirm the purchase or the hold expires.
+
+        Held seats count against total_tickets through the event's held counter,
+        which is reserved with the same conditional update as sales.
+        """
+        if quantity is None or quantity < 1:
+            raise ValueError("Quantity must be at least 1.", 400)
+
+        TicketService._reserve_inventory(event_id, quantity, counter="held_tickets")
+
+        ttl = current_app.config["TICKET_HOLD_TTL"]
+        hold = TicketHoldModel(
+            event_id=event_id,
+            quantity=quantity,
+            expires_at=datetime.now() + timedelta(seconds=ttl),
+        )
+        db.session.add(hold)
+        db.session.commit()
+        hold_sweeper.schedule(hold.expires_at)
+        return hold
+
+    @staticmethod
+    def confirm_reservation(hold_id):
+        """
+        Turns an unexpired hold into sold tickets in a single transaction.
+
+        The hold is claimed with a conditional update, so it can be confirmed only
+        once and never after the sweeper has released it.
+        """
+        hold = TicketHoldModel.query.get(hold_id)
+        if not hold:
+            raise ValueError("Reservation not found", 404)
+
+        holds = TicketHoldModel.__table__
+        result = db.session.execute(
+            holds.update()
+            .where(holds.c.id == hold_id)
+            .where(holds.c.status == "held")
+            .where(holds.c.expires_at > datetime.now())
+            .values(status="confirmed")
+        )
+        if result.rowcount != 1:
+            db.session.rollback()
+            if hold.status == "confirmed":
+                raise ValueError("The reservation has already been confirmed", 409)
+            raise ValueError("The reservation has expired", 409)
+
+        events = EventModel.__table__
+        db.session.execute(
+            events.update()
+            .where(events.c.id == hold.event_id)
+            .values(
+                held_tickets=events.c.held_tickets - hold.quantity,
+                sold_tickets=events.c.sold_tickets + hold.quantity,
+            )
+        )
+        tickets = TicketService._issue_tickets(hold.event_id, hold.quantity)
+        SalesRollupService.record(hold.event_id, datetime.now(), sold=hold.quantity)
+        db.session.commit()
+        return tickets
+
+    @staticmethod
+    def release_expired_holds(now, batch_size):
+        """
+        Releases up to batch_size holds expired at the given time, oldest first.
+
+        Returns how many expired holds were read, so callers can keep sweeping
+        while full batches come back.
+        """
+        holds = TicketHoldModel.__table__
+        due = db.session.execute(
+            select([holds.c.id, holds.c.event_id, holds.c.quantity])
+            .where(holds.c.status == "held")
+            .where(holds.c.expires_at <= now)
+            .order_by(holds.c.expires_at)
+            .limit(batch_size)
+        ).fetchall()
+        if not due:
+            db.session.rollback()
+            return 0
+
+        result = db.session.execute(
+            holds.update()
+            .where(holds.c.id.in_([row.id for row in due]))
+            .where(holds.c.status == "held")
+            .values(status="released")
+        )
+        released = due
+        if result.rowcount != len(due):
+            # Some holds changed state since they were read; claim them one by one
+            db.session.rollback()
+            released = [
+                row
+                for row in due
+                if db.session.execute(
+                    holds.update()
+                    .where(holds.c.id == row.id)
+                    .where(holds.c.status == "held")
+                    .values(status="released")
+                ).rowcount
+                == 1
+            ]
+
+        seats = Counter()
+        for row in released:
+            seats[row.event_id] += row.quantity
+        events = EventModel.__table__
+        for event_id, quantity in seats.items():
+            db.session.execute(
+                events.update()
+                .where(events.c.id == event_id)
+                .values(held_tickets=events.c.held_tickets - quantity)
+            )
+        db.session.commit()
+        return len(due)
+
     @staticmethod
     def redeem_ticket(ticket_id):
         """
@@ -40,46 +210,247 @@ class TicketService:
         if not ticket:
             raise ValueError("Ticket not found", 404)
 
-        event = EventModel.query.get(ticket.event_id)
+        event = EventService.get_event_snapshot(ticket.event_id)
         if not event:
             raise ValueError("Associated event not found", 404)
 
-        # Check if the ticket has already been redeemed
-        if ticket.redeemed:
+        now = datetime.now()
+        TicketService._validate_redemption(ticket, event, now.date())
+
+        if not TicketService._mark_redeemed([ticket], now):
+            db.session.rollback()
             raise ValueError("The ticket has already been redeemed", 409)
+        db.session.commit()
+        return ticket
 
-        # Check if the event is within the valid date range
-        current_date = datetime.now().date()
-        if not (event.start_date <= current_date <= event.end_date):
-            raise ValueError("The event is not within the valid period", 409)
+    @staticmethod
+    def redeem_tickets(ticket_ids):
+        """
+        Redeems a batch of tickets in a single transaction.
 
-        # Redeem the ticket
-        ticket.redeemed = True
+        Tickets are loaded with one IN query and their events come from the event
+        cache, with all misses loaded together. Every ticket is validated on its
+        own and only the valid ones are redeemed, so a bad scan is reported in its
+        result without rolling back the rest of the batch.
+        """
+        unique_ids = set(ticket_ids)
+        tickets = {}
+        if unique_ids:
+            tickets = {
+                ticket.id: ticket
+                for ticket in TicketModel.query.filter(
+                    TicketModel.id.in_(unique_ids)
+                ).all()
+            }
+        events = EventService.get_event_snapshots(
+            ticket.event_id for ticket in tickets.values()
+        )
+
+        now = datetime.now()
+        results = []
+        valid = {}
+        for ticket_id in ticket_ids:
+            ticket = tickets.get(ticket_id)
+            try:
+                if not ticket:
+                    raise ValueError("Ticket not found", 404)
+                event = events.get(ticket.event_id)
+                if not event:
+                    raise ValueError("Associated event not found", 404)
+                if ticket_id in valid:
+                    raise ValueError("The ticket has already been redeemed", 409)
+                TicketService._validate_redemption(ticket, event, now.date())
+            except ValueError as e:
+                results.append(RedemptionResult(ticket_id, None, e.args[0]))
+                continue
+
+            valid[ticket_id] = ticket
+            results.append(RedemptionResult(ticket_id, ticket, None))
+
+        redeemed = TicketService._mark_redeemed(list(valid.values()), now)
         db.session.commit()
-        return ticket
+        # Tickets redeemed by a concurrent scan after they were read
+        return [
+            result._replace(ticket=None, error="The ticket has already been redeemed")
+            if result.ticket is not None and result.ticket_id not in redeemed
+            else result
+            for result in results
+        ]
 
     @staticmethod
-    def get_all_tickets():
+    @reads_from_replica
+    def get_all_tickets(after_id=None, limit=None):
         """
-        Returns all registered tickets.
+        Returns registered tickets ordered by ID, optionally one keyset page at a time.
         """
-        return TicketModel.query.all()
+        query = TicketModel.query.order_by(TicketModel.id)
+        if after_id is not None:
+            query = query.filter(TicketModel.id > after_id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
 
     @staticmethod
+    @reads_from_replica
     def get_ticket_by_id(ticket_id):
         """
         Returns a specific ticket by its ID.
         """
         return TicketModel.query.get(ticket_id)
 
+    @staticmethod
+    def iter_event_tickets(event_id, after_id=None, chunk_size=1000):
+        """
+        Yields the tickets of an event in ID order, optionally resuming after a ticket ID.
+
+        Rows are plain column tuples streamed from a server-side cursor
+        chunk_size at a time, so memory stays constant however many tickets
+        the event has.
+        """
+        with read_replica():
+            query = db.session.query(
+                TicketModel.id,
+                TicketModel.event_id,
+                TicketModel.status,
+                TicketModel.created_at,
+                TicketModel.redeemed_at,
+            ).filter(TicketModel.event_id == event_id)
+            if after_id is not None:
+                query = query.filter(TicketModel.id > after_id)
+            yield from query.order_by(TicketModel.id).yield_per(chunk_size)
+
     @staticmethod
     def delete_ticket(ticket_id):
         """
         Deletes a specific ticket by its ID.
+
+        The event's sold and redeemed counters are decremented in the same
+        transaction, so they keep matching the tickets that exist.
         """
         ticket = TicketModel.query.get(ticket_id)
         if not ticket:
             raise ValueError("Ticket not found", 404)
+
+        events = EventModel.__table__
+        values = {"sold_tickets": events.c.sold_tickets - 1}
+        if ticket.redeemed_at is not None:
+            values["redeemed_tickets"] = events.c.redeemed_tickets - 1
+        db.session.execute(
+            events.update().where(events.c.id == ticket.event_id).values(values)
+        )
         db.session.delete(ticket)
         db.session.commit()
         return True
+
+    @staticmethod
+    def _validate_redemption(ticket, event, current_date):
+        """
+        Validates that a ticket can be redeemed on the given date.
+        """
+        if ticket.redeemed_at is not None:
+            raise ValueError("The ticket has already been redeemed", 409)
+
+        if not (event.start_date <= current_date <= event.end_date):
+            raise ValueError("The event is not within the valid period", 409)
+
+    @staticmethod
+    def _mark_redeemed(tickets, now):
+        """
+        Marks tickets as redeemed and adds them to their events' redeemed counters
+        and sales rollups.
+
+        Each ticket is claimed with a conditional update on redeemed_at, so a
+        ticket scanned twice concurrently is redeemed and counted only once.
+        Returns the IDs of the tickets redeemed here; the caller commits. Must
+        run before anything else is written in the transaction, since losing a
+        race rolls it back.
+        """
+        if not tickets:
+            return set()
+
+        table = TicketModel.__table__
+        claimed = tickets
+        result = db.session.execute(
+            table.update()
+            .where(table.c.id.in_([ticket.id for ticket in tickets]))
+            .where(table.c.redeemed_at.is_(None))
+            .values(redeemed_at=now)
+        )
+        if result.rowcount != len(tickets):
+            # Some tickets were redeemed since they were read; claim them one by one
+            db.session.rollback()
+            claimed = [
+                ticket
+                for ticket in tickets
+                if db.session.execute(
+                    table.update()
+                    .where(table.c.id == ticket.id)
+                    .where(table.c.redeemed_at.is_(None))
+                    .values(redeemed_at=now)
+                ).rowcount
+                == 1
+            ]
+
+        redeemed_per_event = Counter()
+        for ticket in claimed:
+            set_committed_value(ticket, "redeemed_at", now)
+            redeemed_per_event[ticket.event_id] += 1
+        events = EventModel.__table__
+        for event_id, count in redeemed_per_event.items():
+            db.session.execute(
+                events.update()
+                .where(events.c.id == event_id)
+                .values(
+                    redeemed_tickets=func.coalesce(events.c.redeemed_tickets, 0) + count
+                )
+            )
+            SalesRollupService.record(event_id, now, redeemed=count)
+        return {ticket.id for ticket in claimed}
+
+    @staticmethod
+    def _issue_tickets(event_id, quantity):
+        """
+        Inserts sold tickets for seats already reserved on the event counter.
+
+        Each ticket gets its ID from its own INSERT. Reading back the newest
+        rows of the event is not safe, since sales from leased blocks insert
+        tickets without locking the event row.
+        """
+        tickets = [
+            TicketModel(event_id=event_id, status="sold") for _ in range(quantity)
+        ]
+        db.session.add_all(tickets)
+        db.session.flush()
+        return tickets
+
+    @staticmethod
+    def _reserve_inventory(event_id, quantity, counter="sold_tickets"):
+        """
+        Atomically increments the sold (or held) counter of an event by the given quantity.
+
+        The capacity check lives in the WHERE clause and counts both sold and held
+        seats, so the database serializes competing reservations on the event row
+        and never lets them exceed total_tickets. Raises a ValueError when the
+        event does not exist or does not have enough tickets left; the open
+        transaction is rolled back.
+        """
+        events = EventModel.__table__
+        column = events.c[counter]
+        result = db.session.execute(
+            events.update()
+            .where(events.c.id == event_id)
+            .where(
+                events.c.sold_tickets + events.c.held_tickets + quantity
+                <= events.c.total_tickets
+            )
+            .values({column: column + quantity})
+        )
+        if result.rowcount == 1:
+            return
+
+        db.session.rollback()
+        if not db.session.query(EventModel.id).filter(EventModel.id == event_id).first():
+            # Never keep serving metadata of an event the counter no longer finds
+            event_cache.invalidate(event_id)
+            raise ValueError("Event not found", 404)
+        raise ValueError("No tickets available", 409)
@@ -0,0 +1,88 @@
+import csv
+import io
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from app import db
+from app.events.models.event_model import Event
+from app.sql_profiler import profile
+from app.tickets.export import export_tickets
+from app.tickets.services.ticket_service import TicketService
+
+
+def create_event_with_tickets(quantity):
+    event = Event(
+        name="Festival",
+        start_date=date.today(),
+        end_date=date.today() + timedelta(days=1),
+        total_tickets=quantity,
+        sold_tickets=0,
+    )
+    db.session.add(event)
+    db.session.commit()
+    tickets = TicketService.sell_tickets(event.id, quantity)
+    return event.id, [ticket.id for ticket in tickets]
+
+
+# Cliente HTTP con la ruta de exportación registrada sobre la aplicación SQLite
+@pytest.fixture
+def export_client(sqlite_app):
+    sqlite_app.config["TICKET_EXPORT_CHUNK_SIZE"] = 4
+    sqlite_app.add_url_rule(
+        "/events/<int:event_id>/tickets/export", view_func=export_tickets
+    )
+    return sqlite_app.test_client()
+
+
+# Pruebas de la exportación en streaming de los boletos de un evento
+class TestTicketExport:
+    def test_ndjson_streams_every_ticket(self, export_client):
+        event_id, ticket_ids = create_event_with_tickets(10)
+        TicketService.redeem_ticket(ticket_ids[0])
+
+        response = export_client.get(f"/events/{event_id}/tickets/export")
+
+        assert response.is_streamed
+        assert response.mimetype == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.data.decode().splitlines()]
+        assert [row["id"] for row in rows] == ticket_ids
+        assert rows[0]["redeemed_at"] is not None
+        assert rows[1]["redeemed_at"] is None
+
+    def test_csv_resumes_after_ticket(self, export_client):
+        event_id, ticket_ids = create_event_with_tickets(10)
+
+        full = export_client.get(f"/events/{event_id}/tickets/export?format=csv")
+        header, *rows = list(csv.reader(io.StringIO(full.data.decode())))
+        resumed = export_client.get(
+            f"/events/{event_id}/tickets/export?format=csv&after={ticket_ids[5]}"
+        )
+        resumed_rows = list(csv.reader(io.StringIO(resumed.data.decode())))
+
+        assert header == ["id", "event_id", "status", "created_at", "redeemed_at"]
+        assert [int(row[0]) for row in rows] == ticket_ids
+        assert [int(row[0]) for row in resumed_rows] == ticket_ids[6:]
+
+    def test_rows_are_fetched_in_one_streamed_query(self, sqlite_app, export_client):
+        event_id, _ = create_event_with_tickets(10)
+        db.session.remove()
+
+        with profile() as sql:
+            export_client.get(f"/events/{event_id}/tickets/export").data
+
+        ticket_queries = [
+            statement for statement in sql.statements if "FROM tickets" in statement
+        ]
+        assert len(ticket_queries) == 1
+        assert "ORDER BY tickets.id" in ticket_queries[0]
+
+    def test_unknown_event_and_format(self, export_client):
+        event_id, _ = create_event_with_tickets(1)
+
+        assert export_client.get("/events/999/tickets/export").status_code == 404
+        response = export_client.get(f"/events/{event_id}/tickets/export?format=xml")
+        assert response.status_code == 400
+        response = export_client.get(f"/events/{event_id}/tickets/export?after=x")
+        assert response.status_code == 400
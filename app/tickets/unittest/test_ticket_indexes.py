@@ -0,0 +1,90 @@
+import os
+
+import pytest
+from flask import Flask
+from flask_migrate import upgrade
+
+from app import db, migrate
+
+MIGRATIONS_DIR = os.path.join(
+    os.path.dirname(__file__), os.pardir, os.pardir, os.pardir, "migrations"
+)
+
+
+# Aplicación con el esquema construido únicamente por las migraciones
+@pytest.fixture
+def migrated_app(tmp_path):
+    test_app = Flask(__name__)
+    test_app.config.from_object("config.Config")
+    test_app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'migrated.db'}"
+    db.init_app(test_app)
+    migrate.init_app(test_app, db, directory=MIGRATIONS_DIR)
+
+    with test_app.app_context():
+        upgrade(directory=MIGRATIONS_DIR)
+        yield test_app
+        db.session.remove()
+        db.get_engine().dispose()
+
+
+def query_plan(sql, **params):
+    rows = db.session.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return " ".join(row[-1] for row in rows)
+
+
+# Pruebas de los índices creados por las migraciones (EXPLAIN QUERY PLAN)
+class TestHotQueryIndexes:
+    def test_tickets_by_event_and_status(self, migrated_app):
+        plan = query_plan(
+            "SELECT id FROM tickets WHERE event_id = :event_id AND status = :status",
+            event_id=1,
+            status="sold",
+        )
+        assert "ix_tickets_event_id_status" in plan
+
+    def test_redeemed_tickets_by_event(self, migrated_app):
+        plan = query_plan(
+            "SELECT COUNT(id) FROM tickets "
+            "WHERE event_id = :event_id AND redeemed_at IS NOT NULL",
+            event_id=1,
+        )
+        assert "ix_tickets_event_id_redeemed_at" in plan
+
+    def test_events_listed_by_date(self, migrated_app):
+        plan = query_plan(
+            "SELECT id, name FROM events WHERE start_date >= :start_date "
+            "ORDER BY start_date, end_date",
+            start_date="2026-01-01",
+        )
+        assert "ix_events_start_date_end_date" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_expired_holds_swept_by_deadline(self, migrated_app):
+        plan = query_plan(
+            "SELECT id, event_id, quantity FROM ticket_holds "
+            "WHERE status = :status AND expires_at <= :now "
+            "ORDER BY expires_at LIMIT 1000",
+            status="held",
+            now="2026-01-01 00:00:00",
+        )
+        assert "ix_ticket_holds_status_expires_at" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_sales_timeseries_by_event(self, migrated_app):
+        plan = query_plan(
+            "SELECT sold, redeemed FROM sales_rollups WHERE event_id = :event_id "
+            "AND granularity = 'minute' AND bucket_start >= :start",
+            event_id=1,
+            start="2026-01-01 00:00:00",
+        )
+        assert "sqlite_autoindex_sales_rollups_1" in plan
+
+    def test_tickets_by_event_in_id_order(self, migrated_app):
+        plan = query_plan(
+            "SELECT id, status FROM tickets WHERE event_id = :event_id "
+            "AND id > :after_id ORDER BY id",
+            event_id=1,
+            after_id=0,
+        )
+        assert "ix_tickets_event_id_id" in plan
+        assert "TEMP B-TREE" not in plan
@@ -44,6 +44,48 @@ class TestSellTicket:
             TicketController.sell_ticket(event_id=1)
 
 
+# Pruebas para el método sell_tickets
+class TestSellTickets:
+    @patch.object(TicketService, "sell_tickets")
+    def test_sell_tickets_success(self, mock_sell_tickets):
+        # Configurar el mock para devolver varios boletos vendidos
+        mock_sell_tickets.return_value = [{"id": 1}, {"id": 2}, {"id": 3}]
+
+        result = TicketController.sell_tickets(event_id=1, quantity=3)
+
+        assert len(result) == 3
+        mock_sell_tickets.assert_called_once_with(1, 3)
+
+    @patch.object(TicketService, "sell_tickets")
+    def test_sell_tickets_no_availability(self, mock_sell_tickets):
+        # Configurar el mock para simular que no hay suficientes boletos
+        mock_sell_tickets.side_effect = Exception("No tickets available")
+
+        with pytest.raises(Exception, match="No tickets available"):
+            TicketController.sell_tickets(event_id=1, quantity=50)
+
+
+# Pruebas para los métodos reserve_tickets y confirm_reservation
+class TestReservations:
+    @patch.object(TicketService, "reserve_tickets")
+    def test_reserve_tickets_success(self, mock_reserve_tickets):
+        # Configurar el mock para devolver un apartado vigente
+        mock_reserve_tickets.return_value = {"id": 7, "quantity": 2, "status": "held"}
+
+        result = TicketController.reserve_tickets(event_id=1, quantity=2)
+
+        assert result["status"] == "held"
+        mock_reserve_tickets.assert_called_once_with(1, 2)
+
+    @patch.object(TicketService, "confirm_reservation")
+    def test_confirm_reservation_expired(self, mock_confirm_reservation):
+        # Configurar el mock para simular un apartado vencido
+        mock_confirm_reservation.side_effect = Exception("The reservation has expired")
+
+        with pytest.raises(Exception, match="The reservation has expired"):
+            TicketController.confirm_reservation(hold_id=7)
+
+
 # Pruebas para el método redeem_ticket
 class TestRedeemTicket:
     @patch.object(TicketService, "redeem_ticket")
@@ -76,3 +118,17 @@ class TestRedeemTicket:
         # Ejecutar y verificar que se lanza una excepción en caso de que esté fuera de fecha
         with pytest.raises(Exception, match="Ticket redemption period expired"):
             TicketController.redeem_ticket(ticket_id=3)
+
+    @patch.object(TicketService, "redeem_tickets")
+    def test_redeem_tickets_batch(self, mock_redeem_tickets):
+        # Configurar el mock para devolver el resultado de cada boleto del lote
+        mock_redeem_tickets.return_value = [
+            {"ticket_id": 3, "error": None},
+            {"ticket_id": 4, "error": "Ticket not found"},
+        ]
+
+        result = TicketController.redeem_tickets([3, 4])
+
+        assert result[0]["error"] is None
+        assert result[1]["error"] == "Ticket not found"
+        mock_redeem_tickets.assert_called_once_with([3, 4])
@@ -0,0 +1,127 @@
+import asyncio
+import json
+from datetime import date, timedelta
+
+from app import db
+from app.asgi import ASGIApplication
+from app.events.models.event_model import Event
+from app.tickets.export import export_tickets
+from app.tickets.services.ticket_service import TicketService
+
+EVENTS_QUERY = "{ events { edges { node { id name } } } }"
+
+
+def create_event(total_tickets=10):
+    event = Event(
+        name="Festival de Jazz",
+        start_date=date.today(),
+        end_date=date.today() + timedelta(days=1),
+        total_tickets=total_tickets,
+        sold_tickets=0,
+    )
+    db.session.add(event)
+    db.session.commit()
+    return event.id
+
+
+def asgi_messages(asgi_app, method, path, body=b"", query_string=b"", headers=None):
+    if headers is None:
+        headers = [(b"content-type", b"application/json")] if body else []
+    chunks = body if isinstance(body, list) else [body]
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": index < len(chunks) - 1}
+        for index, chunk in enumerate(chunks)
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "query_string": query_string,
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    asyncio.run(asgi_app(scope, receive, send))
+    return sent
+
+
+def asgi_request(asgi_app, method, path, body=b"", query_string=b""):
+    sent = asgi_messages(asgi_app, method, path, body, query_string)
+    content = b"".join(message["body"] for message in sent[1:])
+    return sent[0]["status"], dict(sent[0]["headers"]), content
+
+
+# Pruebas del punto de entrada ASGI sobre la misma aplicación Flask
+class TestASGIApplication:
+    def test_graphql_query_over_asgi(self, graphql_client, sqlite_app):
+        create_event()
+        asgi_app = ASGIApplication(sqlite_app)
+
+        status, headers, body = asgi_request(
+            asgi_app, "POST", "/graphql/v1", json.dumps({"query": EVENTS_QUERY}).encode()
+        )
+
+        assert status == 200
+        assert headers[b"content-type"] == b"application/json"
+        edges = json.loads(body)["data"]["events"]["edges"]
+        assert [edge["node"]["name"] for edge in edges] == ["Festival de Jazz"]
+
+    def test_errors_keep_their_status(self, graphql_client, sqlite_app):
+        asgi_app = ASGIApplication(sqlite_app)
+
+        status, _, body = asgi_request(
+            asgi_app, "GET", "/graphql/v1", query_string=b"query=%7B%20unknownField%20%7D"
+        )
+
+        assert status == 400
+        assert "unknownField" in json.loads(body)["errors"][0]["message"]
+
+    def test_streamed_response_is_sent_in_chunks(self, sqlite_app):
+        sqlite_app.config["TICKET_EXPORT_CHUNK_SIZE"] = 4
+        sqlite_app.add_url_rule(
+            "/events/<int:event_id>/tickets/export", view_func=export_tickets
+        )
+        event_id = create_event(total_tickets=10)
+        TicketService.sell_tickets(event_id, 10)
+
+        sent = asgi_messages(
+            ASGIApplication(sqlite_app), "GET", f"/events/{event_id}/tickets/export"
+        )
+
+        bodies = sent[1:]
+        assert sent[0]["status"] == 200
+        assert [message["more_body"] for message in bodies] == [True] * 3 + [False]
+        lines = b"".join(message["body"] for message in bodies).splitlines()
+        assert len(lines) == 10
+
+    def test_chunked_request_body_is_read_to_the_end(self, graphql_client, sqlite_app):
+        create_event()
+        payload = json.dumps({"query": EVENTS_QUERY}).encode()
+
+        sent = asgi_messages(
+            ASGIApplication(sqlite_app),
+            "POST",
+            "/graphql/v1",
+            [payload[:10], payload[10:30], payload[30:]],
+            headers=[
+                (b"content-type", b"application/json"),
+                (b"transfer-encoding", b"chunked"),
+            ],
+        )
+
+        assert sent[0]["status"] == 200
+        body = b"".join(message["body"] for message in sent[1:])
+        assert json.loads(body)["data"]["events"]["edges"][0]["node"]["name"] == (
+            "Festival de Jazz"
+        )
@@ -0,0 +1,131 @@
+from graphql import parse
+
+from app.custom_graphql_view import document_cache
+from app.document_cache import DocumentCache, hash_query
+from app.query_cost import QueryCost, QueryCostAnalyzer
+from app.schema import schema
+from app.sql_profiler import query_budget
+
+EVENTS_QUERY = "{ events { edges { node { id name } } } }"
+
+
+def post(client, payload):
+    return client.post("/graphql/v1", json=payload)
+
+
+# Pruebas de la caché de documentos GraphQL
+class TestDocumentCache:
+    def test_repeated_query_is_parsed_once(self, graphql_client):
+        for _ in range(3):
+            response = post(graphql_client, {"query": EVENTS_QUERY})
+            assert response.status_code == 200
+
+        assert document_cache.stats()["misses"] == 1
+        assert document_cache.stats()["hits"] == 2
+
+    def test_cache_is_bounded(self):
+        cache = DocumentCache(max_size=2)
+        for field in ("events", "tickets", "__typename"):
+            cache.document_from_string(schema, f"{{ {field} {{ __typename }} }}")
+
+        assert cache.stats()["size"] == 2
+        assert cache.get_query(schema, hash_query("{ events { __typename } }")) is None
+
+    def test_invalid_query_keeps_returning_errors(self, graphql_client):
+        for _ in range(2):
+            response = post(graphql_client, {"query": "{ unknownField }"})
+            assert response.status_code == 400
+            assert "unknownField" in response.get_json()["errors"][0]["message"]
+
+
+# Pruebas de consultas persistidas (sólo el hash de la consulta)
+class TestPersistedQueries:
+    def persisted(self, query_hash):
+        return {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+    def test_unknown_hash_is_rejected(self, graphql_client):
+        response = post(graphql_client, {"extensions": self.persisted("0" * 64)})
+
+        assert response.status_code == 400
+        assert response.get_json()["errors"][0]["message"] == "PersistedQueryNotFound"
+
+    def test_registered_hash_executes_query(self, graphql_client):
+        query_hash = hash_query(EVENTS_QUERY)
+        post(
+            graphql_client,
+            {"query": EVENTS_QUERY, "extensions": self.persisted(query_hash)},
+        )
+
+        response = post(graphql_client, {"extensions": self.persisted(query_hash)})
+
+        assert response.status_code == 200
+        assert response.get_json()["data"] == {"events": {"edges": []}}
+
+    def test_hash_mismatch_is_rejected(self, graphql_client):
+        response = post(
+            graphql_client,
+            {"query": EVENTS_QUERY, "extensions": self.persisted("0" * 64)},
+        )
+
+        assert response.status_code == 400
+
+
+# Pruebas de los límites de profundidad y costo de las consultas
+class TestQueryCostLimits:
+    def test_cost_is_reported_in_extensions(self, graphql_client):
+        response = post(
+            graphql_client,
+            {"query": "{ events(first: 10) { edges { node { tickets(first: 5) { edges { node { id } } } } } } }"},
+        )
+
+        assert response.status_code == 200
+        assert response.get_json()["extensions"]["cost"]["requested"] == 1 + 10 * (1 + (1 + 5))
+
+    def test_page_size_multiplies_nested_cost(self):
+        analyzer = QueryCostAnalyzer(
+            schema, default_page_size=50, max_page_size=100, default_list_size=20
+        )
+        document = parse(
+            "query ($n: Int) { events(first: $n) { edges { node { "
+            "tickets(first: 3) { edges { node { event { name } } } } } } } }"
+        )
+
+        cost = analyzer.analyze(document, variables={"n": 4})
+
+        assert cost == QueryCost(cost=1 + 4 * (1 + (1 + 3)), depth=4)
+
+    def test_list_arguments_are_charged_per_element(self):
+        analyzer = QueryCostAnalyzer(
+            schema, default_page_size=50, max_page_size=100, default_list_size=20
+        )
+        stats = parse("{ eventStats(ids: [1, 2, 3]) { eventId soldTickets } }")
+        redeem = parse(
+            "mutation ($ids: [Int!]!) { redeemTickets(ticketIds: $ids) { __typename } }"
+        )
+
+        assert analyzer.analyze(stats) == QueryCost(cost=1 + 3, depth=2)
+        assert analyzer.analyze(redeem, variables={"ids": list(range(40))}).cost == 40
+
+    def test_over_budget_query_is_rejected_before_sql(self, graphql_client, sqlite_app):
+        sqlite_app.config["GRAPHQL_MAX_QUERY_COST"] = 100
+        with query_budget(0):
+            response = post(
+                graphql_client,
+                {"query": "{ events(first: 100) { edges { node { tickets(first: 100) { edges { node { event { name } } } } } } } }"},
+            )
+
+        assert response.status_code == 400
+        assert response.get_json()["errors"][0]["message"] == (
+            "Query cost 10201 exceeds the maximum of 100."
+        )
+
+    def test_too_deep_query_is_rejected(self, graphql_client, sqlite_app):
+        sqlite_app.config["GRAPHQL_MAX_QUERY_DEPTH"] = 2
+
+        response = post(
+            graphql_client,
+            {"query": "{ events { edges { node { tickets { edges { node { id } } } } } } }"},
+        )
+
+        assert response.status_code == 400
+        assert "Query depth 3" in response.get_json()["errors"][0]["message"]
@@ -0,0 +1,127 @@
+from datetime import date, timedelta
+
+import pytest
+from flask import Flask
+
+from app import db, db_routing
+from app.custom_graphql_view import CustomGraphQLView, document_cache
+from app.events.models.event_model import Event
+from app.events.services.event_service import EventService, event_cache
+from app.schema import schema
+
+EVENTS_QUERY = "{ events { edges { node { name } } } }"
+CREATE_EVENT = (
+    'mutation { createEvent(input: { name: "Ópera", startDate: "%s", endDate: "%s", '
+    "totalTickets: 10 }) { event { id } } }"
+)
+
+
+# Aplicación con dos archivos SQLite: uno como primaria y otro como réplica
+@pytest.fixture
+def replica_app(tmp_path):
+    test_app = Flask(__name__)
+    test_app.config.from_object("config.Config")
+    test_app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'primary.db'}"
+    test_app.config["SQLALCHEMY_BINDS"] = {
+        "replica_0": f"sqlite:///{tmp_path / 'replica.db'}"
+    }
+    test_app.config["DATABASE_REPLICA_BINDS"] = ["replica_0"]
+    db.init_app(test_app)
+    db_routing.init_app(test_app)
+    event_cache.init_app(test_app)
+    test_app.add_url_rule(
+        "/graphql/v1", view_func=CustomGraphQLView.as_view("graphql", schema=schema)
+    )
+    document_cache.clear()
+
+    with test_app.app_context():
+        for bind in (None, "replica_0"):
+            db.Model.metadata.create_all(bind=db.get_engine(test_app, bind=bind))
+        yield test_app
+        db.session.remove()
+        for bind in (None, "replica_0"):
+            engine = db.get_engine(test_app, bind=bind)
+            db.Model.metadata.drop_all(bind=engine)
+            engine.dispose()
+
+
+def insert_event(app, bind, name):
+    engine = db.get_engine(app, bind=bind)
+    engine.execute(
+        Event.__table__.insert().values(
+            name=name,
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=1),
+            total_tickets=10,
+            sold_tickets=0,
+        )
+    )
+
+
+def event_names(response):
+    return [edge["node"]["name"] for edge in response.get_json()["data"]["events"]["edges"]]
+
+
+# Pruebas del enrutamiento de lecturas a réplicas
+class TestReplicaRouting:
+    def test_get_methods_read_from_replica(self, replica_app):
+        insert_event(replica_app, None, "Primaria")
+        insert_event(replica_app, "replica_0", "Réplica")
+
+        with replica_app.test_request_context():
+            assert [event.name for event in EventService.get_all_events()] == ["Réplica"]
+            db.session.remove()
+
+        # Fuera de una petición todo se lee de la primaria
+        assert [event.name for event in EventService.get_all_events()] == ["Primaria"]
+
+    def test_writes_go_to_primary_and_pin_the_request(self, replica_app):
+        insert_event(replica_app, "replica_0", "Réplica")
+
+        with replica_app.test_request_context():
+            EventService.create_event(
+                "Nuevo", date.today(), date.today() + timedelta(days=1), 10
+            )
+            assert [event.name for event in EventService.get_all_events()] == ["Nuevo"]
+            db.session.remove()
+
+        primary = db.get_engine(replica_app).execute("SELECT name FROM events").fetchall()
+        assert [row[0] for row in primary] == ["Nuevo"]
+
+    def test_bulk_created_events_pin_the_request(self, replica_app):
+        insert_event(replica_app, "replica_0", "Réplica")
+        event = {
+            "name": "Importado",
+            "start_date": date.today(),
+            "end_date": date.today() + timedelta(days=1),
+            "total_tickets": 10,
+        }
+
+        with replica_app.test_request_context():
+            assert EventService.create_events([event]).created == 1
+            names = [event.name for event in EventService.get_all_events()]
+            db.session.remove()
+
+        assert names == ["Importado"]
+
+    def test_graphql_queries_use_replica_until_client_writes(self, replica_app):
+        insert_event(replica_app, "replica_0", "Réplica")
+        client = replica_app.test_client()
+
+        response = client.post("/graphql/v1", json={"query": EVENTS_QUERY})
+        assert event_names(response) == ["Réplica"]
+        assert db_routing.STICKY_COOKIE not in response.headers.get("Set-Cookie", "")
+
+        start = date.today() + timedelta(days=1)
+        mutation = CREATE_EVENT % (start, start + timedelta(days=1))
+        response = client.post("/graphql/v1", json={"query": mutation})
+        assert response.get_json().get("errors") is None
+        assert db_routing.STICKY_COOKIE in response.headers["Set-Cookie"]
+
+        # La cookie mantiene al cliente en la primaria y ve el evento recién creado
+        response = client.post("/graphql/v1", json={"query": EVENTS_QUERY})
+        assert event_names(response) == ["Ópera"]
+
+        other_client = replica_app.test_client()
+        response = other_client.post("/graphql/v1", json={"query": EVENTS_QUERY})
+        assert event_names(response) == ["Réplica"]
@@ -0,0 +1,62 @@
+from prometheus_client import REGISTRY
+
+from app import graphql_metrics
+from app.graphql_metrics import operation_label
+
+EVENTS_QUERY = "query ListEvents { events { edges { node { id name } } } }"
+SELL_MISSING = "mutation SellMissing { sellTicket(input: { eventId: 999 }) { ticket { id } } }"
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def post(client, query):
+    return client.post("/graphql/v1", json={"query": query})
+
+
+# Pruebas de las métricas de latencia por operación y por resolver
+class TestGraphQLMetrics:
+    def test_records_operation_and_resolver_latency(self, graphql_client, sqlite_app):
+        sqlite_app.config["GRAPHQL_METRICS_SCALAR_SAMPLE_RATE"] = 0
+        operation = {"operation": "ListEvents", "type": "query"}
+        operations = sample("graphql_operation_duration_seconds_count", **operation)
+        events = sample("graphql_resolver_duration_seconds_count", field="Query.events")
+        names = sample("graphql_resolver_duration_seconds_count", field="EventObject.name")
+
+        assert post(graphql_client, EVENTS_QUERY).status_code == 200
+
+        assert sample("graphql_operation_duration_seconds_count", **operation) == operations + 1
+        assert sample("graphql_resolver_duration_seconds_count", field="Query.events") == events + 1
+        # Los escalares triviales no se miden con una tasa de muestreo de 0
+        assert sample("graphql_resolver_duration_seconds_count", field="EventObject.name") == names
+
+    def test_scalar_fields_are_sampled(self, graphql_client, sqlite_app):
+        sqlite_app.config["GRAPHQL_METRICS_SCALAR_SAMPLE_RATE"] = 1
+        field = "PageInfo.hasNextPage"
+        names = sample("graphql_resolver_duration_seconds_count", field=field)
+
+        post(graphql_client, "{ events { pageInfo { hasNextPage } } }")
+
+        assert sample("graphql_resolver_duration_seconds_count", field=field) == names + 1
+
+    def test_counts_resolver_and_operation_errors(self, graphql_client):
+        operation = {"operation": "SellMissing", "type": "mutation"}
+        resolver_errors = sample("graphql_resolver_errors_total", field="Mutation.sellTicket")
+        operation_errors = sample("graphql_operation_errors_total", **operation)
+
+        post(graphql_client, SELL_MISSING)
+
+        assert (
+            sample("graphql_resolver_errors_total", field="Mutation.sellTicket")
+            == resolver_errors + 1
+        )
+        assert sample("graphql_operation_errors_total", **operation) == operation_errors + 1
+
+    def test_operation_names_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(graphql_metrics, "MAX_OPERATION_NAMES", 1)
+        monkeypatch.setattr(graphql_metrics, "_operation_names", set())
+
+        assert operation_label("Primera") == "Primera"
+        assert operation_label("Segunda") == "other"
+        assert operation_label(None) == "anonymous"
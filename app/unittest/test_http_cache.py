@@ -0,0 +1,159 @@
+import time
+from datetime import date, timedelta
+
+from app import db, db_routing
+from app.db_routing import STICKY_COOKIE
+from app.events.models.event_model import Event
+from app.events.services.event_service import EventService
+from app.sql_profiler import query_budget
+from app.tickets.services.ticket_service import TicketService
+
+LISTING = "query Storefront { events { edges { node { id name soldTickets } } } }"
+
+
+def create_event():
+    event = Event(
+        name="Obra",
+        start_date=date.today(),
+        end_date=date.today() + timedelta(days=1),
+        total_tickets=10,
+        sold_tickets=0,
+    )
+    db.session.add(event)
+    db.session.commit()
+    return event.id
+
+
+def get(client, query, etag=None):
+    headers = {"If-None-Match": etag} if etag else {}
+    return client.get("/graphql/v1", query_string={"query": query}, headers=headers)
+
+
+# Pruebas de peticiones condicionales (ETag / If-None-Match) en consultas GET
+class TestConditionalRequests:
+    def test_unchanged_data_is_not_modified(self, graphql_client):
+        create_event()
+        first = get(graphql_client, LISTING)
+        etag = first.headers["ETag"]
+
+        with query_budget(1):
+            second = get(graphql_client, LISTING, etag)
+
+        assert first.status_code == 200
+        assert first.headers["Cache-Control"] == "no-cache"
+        assert second.status_code == 304
+        assert second.data == b""
+        assert second.headers["ETag"] == etag
+
+    def test_sales_and_new_events_change_the_etag(self, graphql_client):
+        event_id = create_event()
+        etags = [get(graphql_client, LISTING).headers["ETag"]]
+
+        TicketService.sell_ticket(event_id)
+        etags.append(get(graphql_client, LISTING).headers["ETag"])
+        create_event()
+        response = get(graphql_client, LISTING, etags[-1])
+
+        assert response.status_code == 200
+        assert len(set(etags + [response.headers["ETag"]])) == 3
+
+    def test_cache_control_per_operation(self, graphql_client, sqlite_app):
+        sqlite_app.config["GRAPHQL_CACHE_CONTROL"] = {"Storefront": "public, max-age=10"}
+
+        assert get(graphql_client, LISTING).headers["Cache-Control"] == "public, max-age=10"
+        anonymous = get(graphql_client, "{ events { edges { node { id } } } }")
+        assert anonymous.headers["Cache-Control"] == "no-cache"
+
+    def test_only_tracked_get_queries_are_tagged(self, graphql_client):
+        post = graphql_client.post("/graphql/v1", json={"query": LISTING})
+        timeseries = get(
+            graphql_client,
+            '{ salesTimeseries(eventId: 1, from: "2026-01-01T00:00:00", '
+            'to: "2026-01-02T00:00:00") { sold } }',
+        )
+
+        assert "ETag" not in post.headers
+        assert "ETag" not in timeseries.headers
+
+    def test_pretty_and_compact_bodies_have_different_etags(self, graphql_client):
+        create_event()
+        compact = get(graphql_client, LISTING)
+        pretty = graphql_client.get(
+            "/graphql/v1",
+            query_string={"query": LISTING, "pretty": "1"},
+            headers={"If-None-Match": compact.headers["ETag"]},
+        )
+
+        assert pretty.status_code == 200
+        assert pretty.data != compact.data
+        assert pretty.headers["ETag"] != compact.headers["ETag"]
+
+    def test_counter_updates_bump_the_event_version(self, sqlite_app):
+        event_id = create_event()
+
+        TicketService.sell_tickets(event_id, 2)
+
+        assert Event.query.get(event_id).version == 2
+
+    def test_create_events_changes_the_etag(self, graphql_client):
+        create_event()
+        etag = get(graphql_client, LISTING).headers["ETag"]
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+
+        created = graphql_client.post(
+            "/graphql/v1",
+            json={
+                "query": "mutation Import($events: [EventInput!]!) "
+                "{ createEvents(input: $events) { created } }",
+                "variables": {
+                    "events": [
+                        {
+                            "name": f"Importado {index}",
+                            "startDate": tomorrow,
+                            "endDate": tomorrow,
+                            "totalTickets": 10,
+                        }
+                        for index in range(3)
+                    ]
+                },
+            },
+        )
+        response = get(graphql_client, LISTING, etag)
+
+        assert created.get_json()["data"]["createEvents"]["created"] == 3
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+
+# Pruebas de la caché por worker de la versión de los datos
+class TestDataVersionCache:
+    def test_version_is_cached_until_a_local_write(self, sqlite_app):
+        event_id = create_event()
+        version = EventService.get_data_version()
+        # Escritura hecha por otro worker: no pasa por la sesión de este
+        events = Event.__table__
+        db.get_engine().execute(
+            events.update().where(events.c.id == event_id).values(name="Otra obra")
+        )
+
+        assert EventService.get_data_version() == version
+        TicketService.sell_ticket(event_id)
+        assert EventService.get_data_version() != version
+
+    def test_clients_pinned_to_the_primary_skip_the_cache(
+        self, graphql_client, sqlite_app
+    ):
+        db_routing.init_app(sqlite_app)
+        event_id = create_event()
+        etag = get(graphql_client, LISTING).headers["ETag"]
+        events = Event.__table__
+        db.get_engine().execute(
+            events.update().where(events.c.id == event_id).values(name="Otra obra")
+        )
+
+        cached = get(graphql_client, LISTING, etag)
+        graphql_client.set_cookie("localhost", STICKY_COOKIE, str(time.time() + 5))
+        pinned = get(graphql_client, LISTING, etag)
+
+        assert cached.status_code == 304
+        assert pinned.status_code == 200
@@ -0,0 +1,96 @@
+import os
+
+import pytest
+from prometheus_client import REGISTRY, Counter, Gauge, values
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app import metrics
+from app.db_pool import InstrumentedQueuePool
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+# Pruebas de la agregación de métricas entre workers (modo multiproceso)
+class TestMultiprocessMetrics:
+    @pytest.fixture
+    def multiproc_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+        return tmp_path
+
+    def record_worker(self, monkeypatch, pid, sales, in_use):
+        # Cada worker escribe sus propios archivos, identificados por su PID
+        monkeypatch.setattr(values, "ValueClass", values.MultiProcessValue(lambda: pid))
+        Counter("sales_total", "Tickets sold.", registry=None).inc(sales)
+        Gauge(
+            "pool_in_use",
+            "In use.",
+            ["pool"],
+            registry=None,
+            multiprocess_mode="liveall",
+        ).labels("default").set(in_use)
+
+    def test_counters_are_summed_and_gauges_kept_per_worker(
+        self, multiproc_dir, monkeypatch
+    ):
+        self.record_worker(monkeypatch, 101, sales=3, in_use=2)
+        self.record_worker(monkeypatch, 102, sales=4, in_use=5)
+
+        text = metrics.render().decode()
+
+        assert "sales_total 7.0" in text
+        assert 'pool_in_use{pid="101",pool="default"} 2.0' in text
+        assert 'pool_in_use{pid="102",pool="default"} 5.0' in text
+
+    def test_exited_workers_keep_their_counts_but_not_their_gauges(
+        self, multiproc_dir, monkeypatch
+    ):
+        self.record_worker(monkeypatch, 101, sales=10, in_use=9)
+        self.record_worker(monkeypatch, 102, sales=1, in_use=1)
+
+        metrics.mark_process_dead(101)
+        text = metrics.render().decode()
+
+        assert "sales_total 11.0" in text
+        assert 'pid="101"' not in text
+        assert 'pool_in_use{pid="102",pool="default"} 1.0' in text
+
+    def test_clear_removes_previous_runs(self, multiproc_dir, monkeypatch):
+        self.record_worker(monkeypatch, 101, sales=1, in_use=1)
+
+        metrics.clear()
+
+        assert os.listdir(multiproc_dir) == []
+
+    def test_single_process_renders_this_worker(self, monkeypatch):
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+
+        assert b"# TYPE graphql_operation_duration_seconds histogram" in metrics.render()
+
+
+# Pruebas del pool de conexiones instrumentado
+class TestInstrumentedQueuePool:
+    def test_publishes_checkout_wait_in_use_and_timeouts(self, tmp_path):
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+            pool_logging_name="test_pool",
+        )
+        waits = sample("db_pool_checkout_wait_seconds_count", pool="test_pool")
+        timeouts = sample("db_pool_checkout_timeouts_total", pool="test_pool")
+
+        connection = engine.connect()
+        assert sample("db_pool_connections_in_use", pool="test_pool") == 1
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+        connection.close()
+
+        assert sample("db_pool_connections_in_use", pool="test_pool") == 0
+        assert sample("db_pool_checkout_wait_seconds_count", pool="test_pool") == waits + 2
+        assert sample("db_pool_checkout_timeouts_total", pool="test_pool") == timeouts + 1
+        engine.dispose()
@@ -0,0 +1,114 @@
+import gzip
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from app import db
+from app.events.models.event_model import Event
+from app.response_encoding import encode, json_encoder
+
+LISTING = "{ events { edges { node { id name startDate endDate totalTickets } } } }"
+
+
+def create_events(count):
+    for index in range(count):
+        db.session.add(
+            Event(
+                name=f"Evento número {index}",
+                start_date=date.today(),
+                end_date=date.today() + timedelta(days=1),
+                total_tickets=10,
+                sold_tickets=0,
+            )
+        )
+    db.session.commit()
+
+
+# Pruebas de los codificadores JSON de las respuestas
+class TestJsonEncoders:
+    @pytest.mark.parametrize("name", ["json", "orjson", "auto"])
+    def test_encoders_produce_equivalent_json(self, name):
+        pytest.importorskip("orjson")
+        data = {"data": {"events": [{"name": "Ópera", "id": 1}], "empty": None}}
+
+        assert json.loads(encode(data, name)) == data
+
+    def test_pretty_output_uses_the_standard_library(self):
+        assert encode({"data": 1}, "orjson", pretty=True) == '{\n  "data": 1\n}'
+
+    def test_stdlib_fallback(self):
+        assert json_encoder("json")({"a": 1}) == '{"a":1}'
+
+
+# Pruebas de la compresión negociada de las respuestas GraphQL
+class TestResponseCompression:
+    def test_large_responses_are_gzipped(self, graphql_client):
+        create_events(30)
+
+        response = graphql_client.post(
+            "/graphql/v1",
+            json={"query": LISTING},
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        body = json.loads(gzip.decompress(response.data))
+        assert len(body["data"]["events"]["edges"]) == 30
+
+    def test_small_or_unaccepted_responses_are_not_compressed(self, graphql_client):
+        create_events(30)
+        small = graphql_client.post(
+            "/graphql/v1",
+            json={"query": "{ events(first: 1) { edges { node { id } } } }"},
+            headers={"Accept-Encoding": "gzip"},
+        )
+        plain = graphql_client.post("/graphql/v1", json={"query": LISTING})
+
+        assert "Content-Encoding" not in small.headers
+        assert "Content-Encoding" not in plain.headers
+        assert len(json.loads(plain.data)["data"]["events"]["edges"]) == 30
+
+    def test_small_responses_skip_negotiation(self, graphql_client, monkeypatch):
+        def negotiate(accept_encodings):
+            raise AssertionError("negotiated a body below the minimum size")
+
+        monkeypatch.setattr("app.custom_graphql_view.negotiate", negotiate)
+        response = graphql_client.post(
+            "/graphql/v1",
+            json={"query": "{ events(first: 1) { edges { node { id } } } }"},
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert "Content-Encoding" not in response.headers
+
+    def test_compressed_copy_has_its_own_etag(self, graphql_client):
+        create_events(30)
+        headers = {"Accept-Encoding": "gzip"}
+        first = graphql_client.get(
+            "/graphql/v1", query_string={"query": LISTING}, headers=headers
+        )
+        etag = first.headers["ETag"]
+
+        second = graphql_client.get(
+            "/graphql/v1",
+            query_string={"query": LISTING},
+            headers=dict(headers, **{"If-None-Match": etag}),
+        )
+
+        assert etag.endswith('-gzip"')
+        assert second.status_code == 304
+        assert second.headers["ETag"] == etag
+
+    def test_bad_request_uses_the_configured_encoder(self, graphql_client, sqlite_app):
+        sqlite_app.config["GRAPHQL_MAX_QUERY_DEPTH"] = 1
+
+        response = graphql_client.post("/graphql/v1", json={"query": LISTING})
+
+        assert response.status_code == 400
+        assert response.get_json() == {
+            "errors": [{"message": "Query depth 2 exceeds the maximum of 1."}],
+            "data": None,
+        }
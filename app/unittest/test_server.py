@@ -0,0 +1,39 @@
+from app.server import build_gunicorn_app, gunicorn_options
+
+
+# Pruebas de la configuración del servidor Gunicorn (manage.py serve)
+class TestServe:
+    def test_options_come_from_config(self, sqlite_app):
+        sqlite_app.config.update(SERVER_WORKERS=3, SERVER_THREADS=8)
+
+        options = gunicorn_options(sqlite_app.config, "0.0.0.0", 5000)
+
+        assert options["bind"] == "0.0.0.0:5000"
+        assert (options["workers"], options["threads"]) == (3, 8)
+        assert options["preload_app"] is True
+        assert options["pidfile"] is None
+
+    def test_pidfile_for_code_upgrades(self, sqlite_app):
+        sqlite_app.config["SERVER_PIDFILE"] = "/tmp/gunicorn.pid"
+
+        options = gunicorn_options(sqlite_app.config, "0.0.0.0", 5000)
+        server = build_gunicorn_app(sqlite_app, options)
+
+        assert server.cfg.pidfile == "/tmp/gunicorn.pid"
+
+    def test_command_line_overrides_config(self, sqlite_app):
+        options = gunicorn_options(sqlite_app.config, "127.0.0.1", 8000, workers=2)
+
+        assert options["workers"] == 2
+        assert options["threads"] == sqlite_app.config["SERVER_THREADS"]
+
+    def test_gunicorn_app_preloads_flask_app(self, sqlite_app):
+        options = gunicorn_options(sqlite_app.config, "127.0.0.1", 8000, threads=2)
+
+        server = build_gunicorn_app(sqlite_app, options)
+
+        assert server.cfg.preload_app is True
+        assert server.cfg.worker_class_str == "gthread"
+        assert server.load() is sqlite_app
+        # Each worker starts with its own pool, built after the fork
+        server.cfg.post_fork(None, None)
@@ -0,0 +1,80 @@
+from datetime import date, timedelta
+
+import pytest
+
+from app import db
+from app.events.models.event_model import Event
+from app.sql_profiler import profile, query_budget, statement_shape
+
+
+def create_events(count):
+    for index in range(count):
+        db.session.add(
+            Event(
+                name=f"Evento {index}",
+                start_date=date.today(),
+                end_date=date.today() + timedelta(days=1),
+                total_tickets=10,
+                sold_tickets=0,
+            )
+        )
+    db.session.commit()
+
+
+# Pruebas de la contabilidad de sentencias SQL por bloque
+class TestQueryProfile:
+    def test_counts_statements_and_rows(self, sqlite_app):
+        create_events(4)
+
+        with profile() as sql:
+            events = Event.query.all()
+
+        assert len(sql) == 1
+        assert sql.rows == len(events) == 4
+        assert sql.duration > 0
+
+    def test_repeated_shapes_are_flagged(self, sqlite_app):
+        create_events(6)
+        db.session.expunge_all()
+
+        with profile() as sql:
+            for event_id in range(1, 7):
+                Event.query.get(event_id)
+            Event.query.filter(Event.id.in_([1, 2, 3])).all()
+
+        repeated = sql.repeated(threshold=5)
+        assert len(repeated) == 1
+        assert repeated[0]["count"] == 6
+        assert "FROM events" in repeated[0]["statement"]
+
+    def test_in_lists_of_any_length_share_a_shape(self):
+        assert statement_shape("SELECT * FROM t WHERE id IN (?, ?) LIMIT 10") == (
+            statement_shape("SELECT * FROM t\nWHERE id IN (?,?,?) LIMIT 20")
+        )
+
+    def test_budget_fails_when_exceeded(self, sqlite_app):
+        with pytest.raises(AssertionError, match="at most 1 SQL statements, got 2"):
+            with query_budget(1):
+                Event.query.all()
+                Event.query.count()
+
+
+# Pruebas del reporte SQL en las extensiones de la respuesta GraphQL
+class TestSqlExtensions:
+    QUERY = "{ events { edges { node { id tickets { edges { node { id } } } } } } }"
+
+    def test_disabled_by_default(self, graphql_client):
+        response = graphql_client.post("/graphql/v1", json={"query": self.QUERY})
+
+        assert "sql" not in response.get_json()["extensions"]
+
+    def test_profile_is_reported(self, graphql_client, sqlite_app):
+        sqlite_app.config["GRAPHQL_SQL_PROFILING"] = True
+        create_events(3)
+
+        response = graphql_client.post("/graphql/v1", json={"query": self.QUERY})
+
+        sql = response.get_json()["extensions"]["sql"]
+        assert sql["statements"] == 2
+        assert sql["rows"] == 3
+        assert sql["repeated"] == []
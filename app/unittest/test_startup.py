@@ -0,0 +1,102 @@
+import time
+from datetime import date, timedelta
+
+from prometheus_client import REGISTRY
+
+from app import db
+from app.custom_graphql_view import document_cache
+from app.events.models.event_model import Event
+from app.events.services.event_service import event_cache
+from app.startup import WARMUP_MUTATIONS, WARMUP_QUERIES, Startup, readiness
+
+
+def create_event(name, end_date):
+    event = Event(
+        name=name,
+        start_date=end_date - timedelta(days=1),
+        end_date=end_date,
+        total_tickets=10,
+        sold_tickets=0,
+    )
+    db.session.add(event)
+    db.session.commit()
+    return event.id
+
+
+# Pruebas de la fase de arranque (warm-up) de cada worker
+class TestWarmUp:
+    def test_warm_up_primes_caches(self, graphql_client, sqlite_app):
+        upcoming_id = create_event("Próximo", date.today() + timedelta(days=3))
+        past_id = create_event("Pasado", date.today() - timedelta(days=3))
+        event_cache.clear()
+        startup = Startup()
+
+        assert startup.warm_up(sqlite_app) is True
+
+        assert startup.ready is True
+        assert set(startup.steps) == {
+            "open_pools",
+            "compile_schema",
+            "prime_document_cache",
+            "run_warmup_queries",
+            "prime_event_cache",
+        }
+        assert document_cache.stats()["size"] == len(WARMUP_QUERIES + WARMUP_MUTATIONS)
+        hits = event_cache.hits
+        event_cache.get_or_load(upcoming_id, lambda key: None)
+        assert event_cache.hits == hits + 1
+        assert event_cache.get_or_load(past_id, lambda key: "cargado") == "cargado"
+
+    def test_failed_step_keeps_worker_unready(self, sqlite_app):
+        db.drop_all()
+        startup = Startup()
+
+        assert startup.warm_up(sqlite_app) is False
+
+        assert startup.ready is False
+        assert startup.error.startswith("prime_event_cache")
+        db.create_all()
+
+    def test_failed_warm_up_is_retried_with_backoff(self, sqlite_app, monkeypatch):
+        from app import startup as startup_module
+
+        monkeypatch.setattr(startup_module, "RETRY_DELAY", 0.01)
+        db.drop_all()
+        startup = Startup()
+
+        assert startup.start(sqlite_app, wait=0.05) is False
+        assert startup.error.startswith("prime_event_cache")
+        db.create_all()
+        for _ in range(100):
+            if startup.ready:
+                break
+            time.sleep(0.01)
+
+        assert startup.ready is True
+        assert startup.error is None
+
+    def test_warm_up_queries_are_not_recorded(self, graphql_client, sqlite_app):
+        operation = {"operation": "anonymous", "type": "query"}
+        before = REGISTRY.get_sample_value(
+            "graphql_operation_duration_seconds_count", operation
+        )
+
+        assert Startup().warm_up(sqlite_app) is True
+
+        after = REGISTRY.get_sample_value(
+            "graphql_operation_duration_seconds_count", operation
+        )
+        assert after == before
+
+    def test_readiness_endpoint(self, sqlite_app, monkeypatch):
+        from app import startup as startup_module
+
+        sqlite_app.add_url_rule("/ready", view_func=readiness)
+        client = sqlite_app.test_client()
+        monkeypatch.setattr(startup_module, "startup", Startup())
+
+        assert client.get("/ready").status_code == 503
+        startup_module.startup.warm_up(sqlite_app)
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.get_json()["ready"] is True
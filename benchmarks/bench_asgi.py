@@ -0,0 +1,133 @@
+"""
+Compares requests/s and latency of the WSGI and ASGI entry points under many concurrent clients.
+
+Both paths run in-process against the same application: the WSGI path through
+a pool of server threads, the ASGI path through the event loop and the
+AsyncExecutor pool of the same size. --db-latency-ms adds a sleep to every SQL
+statement to stand in for the network round trip to MySQL.
+
+Usage: python -m benchmarks.bench_asgi [--clients N] [--threads N] [--db-latency-ms N]
+"""
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import event as sa_event
+
+from app import db
+from app.asgi import ASGIApplication
+from app.async_executor import async_executor
+from app.custom_graphql_view import CustomGraphQLView
+from app.schema import schema
+from benchmarks.common import create_benchmark_app, create_event
+
+QUERY = json.dumps(
+    {"query": "{ events(first: 20) { edges { node { id name totalTickets } } } }"}
+).encode()
+
+
+def summarize(label, latencies, elapsed):
+    latencies = sorted(latencies)
+    return {
+        "mode": label,
+        "requests": len(latencies),
+        "requests_per_s": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+    }
+
+
+def run_wsgi(bench_app, clients, threads):
+    client = bench_app.test_client()
+
+    def request(submitted):
+        response = client.post(
+            "/graphql/v1", data=QUERY, content_type="application/json"
+        )
+        assert response.status_code == 200, response.data
+        return time.perf_counter() - submitted
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as server:
+        futures = [server.submit(request, time.perf_counter()) for _ in range(clients)]
+        latencies = [future.result() for future in futures]
+    return summarize("wsgi", latencies, time.perf_counter() - started)
+
+
+def run_asgi(bench_app, clients, threads):
+    asgi_app = ASGIApplication(bench_app)
+    async_executor.max_workers = threads
+    async_executor.shutdown()
+
+    async def request():
+        submitted = time.perf_counter()
+        messages = [{"type": "http.request", "body": QUERY, "more_body": False}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/graphql/v1",
+            "query_string": b"",
+            "headers": [(b"content-type", b"application/json")],
+        }
+        await asgi_app(scope, receive, send)
+        assert sent[0]["status"] == 200, sent[1]["body"]
+        return time.perf_counter() - submitted
+
+    async def main():
+        return await asyncio.gather(*(request() for _ in range(clients)))
+
+    started = time.perf_counter()
+    latencies = asyncio.run(main())
+    elapsed = time.perf_counter() - started
+    async_executor.shutdown()
+    return summarize("asgi", latencies, elapsed)
+
+
+def run(clients, threads, db_latency_ms=0, database_uri=None):
+    bench_app = create_benchmark_app(database_uri)
+    bench_app.add_url_rule(
+        "/graphql/v1", view_func=CustomGraphQLView.as_view("graphql", schema=schema)
+    )
+    with bench_app.app_context():
+        for index in range(20):
+            create_event(total_tickets=100, name=f"Benchmark Event {index}")
+        engine = db.get_engine()
+
+    if db_latency_ms:
+
+        @sa_event.listens_for(engine, "before_cursor_execute")
+        def network_round_trip(*args):
+            time.sleep(db_latency_ms / 1000)
+
+    results = [
+        run_wsgi(bench_app, clients, threads),
+        run_asgi(bench_app, clients, threads),
+    ]
+    engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--db-latency-ms", type=float, default=0)
+    parser.add_argument("--database-uri", default=None)
+    args = parser.parse_args()
+
+    for result in run(args.clients, args.threads, args.db_latency_ms, args.database_uri):
+        print(" ".join(f"{key}={value}" for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Measures the time to serve an events { tickets } query as the tickets table grows.
+
+Each dataset spreads its tickets over the same number of events, and the query
+asks for the default page of events with the default page of their tickets.
+
+Usage: python -m benchmarks.bench_events_query [--sizes N,N,...] [--events N] [--iterations N]
+"""
+import argparse
+import json
+import time
+
+from app import db
+from app.custom_graphql_view import CustomGraphQLView
+from app.schema import schema
+from benchmarks.common import (
+    create_benchmark_app,
+    create_event,
+    percentile,
+    seed_sold_tickets,
+)
+
+QUERY = json.dumps(
+    {"query": "{ events { edges { node { id name tickets { edges { node { id status } } } } } } }"}
+).encode()
+
+
+def measure(total_tickets, events, iterations, database_uri=None):
+    bench_app = create_benchmark_app(database_uri)
+    bench_app.add_url_rule(
+        "/graphql/v1", view_func=CustomGraphQLView.as_view("graphql", schema=schema)
+    )
+    with bench_app.app_context():
+        per_event = total_tickets // events
+        for index in range(events):
+            event_id = create_event(total_tickets=per_event, name=f"Benchmark Event {index}")
+            seed_sold_tickets(event_id, per_event)
+
+    client = bench_app.test_client()
+    latencies = []
+    for _ in range(iterations + 1):
+        started = time.perf_counter()
+        response = client.post(
+            "/graphql/v1", data=QUERY, content_type="application/json"
+        )
+        latencies.append(time.perf_counter() - started)
+        assert response.status_code == 200, response.data
+    # The first request parses the document and opens the connection
+    latencies = latencies[1:]
+
+    with bench_app.app_context():
+        db.get_engine().dispose()
+
+    return {
+        "tickets": per_event * events,
+        "events": events,
+        "response_bytes": len(response.data),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def run(sizes, events, iterations, database_uri=None):
+    return {
+        f"{size}_tickets": measure(size, events, iterations, database_uri)
+        for size in sizes
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--database-uri", default=None)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    for label, result in run(sizes, args.events, args.iterations, args.database_uri).items():
+        print(label, " ".join(f"{key}={value}" for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
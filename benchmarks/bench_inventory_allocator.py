@@ -0,0 +1,52 @@
+"""
+Compares single-ticket sale throughput with and without per-worker block allocation.
+
+Usage: python -m benchmarks.bench_inventory_allocator [--threads N] [--attempts N]
+       [--capacity N] [--block-size N]
+"""
+import argparse
+
+from app import db
+from app.tickets.services.inventory_allocator import inventory_allocator
+from benchmarks import bench_sell_ticket
+
+
+def run(threads, attempts, capacity, block_size, database_uri=None):
+    results = {}
+    for label, size in (("counter", 0), ("block", block_size)):
+        inventory_allocator.block_size = size
+        try:
+            results[label] = bench_sell_ticket.run(
+                threads, attempts, capacity, database_uri, release=release_leases
+            )
+        finally:
+            inventory_allocator.block_size = 0
+    return results
+
+
+def release_leases(bench_app):
+    with bench_app.app_context():
+        inventory_allocator.release_all()
+        db.session.remove()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--attempts", type=int, default=250)
+    parser.add_argument("--capacity", type=int, default=1500)
+    parser.add_argument("--block-size", type=int, default=50)
+    parser.add_argument("--database-uri", default=None)
+    args = parser.parse_args()
+
+    results = run(
+        args.threads, args.attempts, args.capacity, args.block_size, args.database_uri
+    )
+    for label, result in results.items():
+        print(f"[{label}]")
+        for key, value in result.items():
+            print(f"{key:>15}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Measures the latency of TicketService.redeem_ticket for single gate scans.
+
+Usage: python -m benchmarks.bench_redeem_ticket [--tickets N]
+"""
+import argparse
+import time
+
+from app import db
+from app.tickets.services.ticket_service import TicketService
+from benchmarks.common import create_benchmark_app, create_event, percentile
+
+
+def run(tickets, database_uri=None):
+    bench_app = create_benchmark_app(database_uri)
+    with bench_app.app_context():
+        event_id = create_event(total_tickets=tickets)
+        ticket_ids = [ticket.id for ticket in TicketService.sell_tickets(event_id, tickets)]
+
+    latencies = []
+    for ticket_id in ticket_ids:
+        with bench_app.app_context():
+            started = time.perf_counter()
+            TicketService.redeem_ticket(ticket_id)
+            latencies.append(time.perf_counter() - started)
+
+    with bench_app.app_context():
+        db.get_engine().dispose()
+
+    return {
+        "tickets": tickets,
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "redemptions_per_s": round(len(latencies) / sum(latencies), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tickets", type=int, default=1000)
+    parser.add_argument("--database-uri", default=None)
+    args = parser.parse_args()
+
+    for key, value in run(args.tickets, args.database_uri).items():
+        print(f"{key:>18}: {value}")
+
+
+if __name__ == "__main__":
+    main()
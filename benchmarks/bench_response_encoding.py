@@ -0,0 +1,97 @@
+"""
+Measures JSON encoding and compression of large GraphQL responses.
+
+Builds real events { tickets } results through the view, then times the
+standard library and orjson encoders on them and reports the size and cost of
+each content coding the process can produce.
+
+Usage: python -m benchmarks.bench_response_encoding [--sizes N,N,...] [--iterations N]
+"""
+import argparse
+import json
+import time
+
+from app import db
+from app.custom_graphql_view import CustomGraphQLView
+from app.response_encoding import available_encodings, compress, json_encoder
+from app.schema import schema
+from benchmarks.common import (
+    create_benchmark_app,
+    create_event,
+    percentile,
+    seed_sold_tickets,
+)
+
+TICKETS_PER_EVENT = 100
+QUERY = (
+    "{ events(first: %d) { edges { node { id name startDate endDate "
+    "tickets(first: %d) { edges { node { id status createdAt redeemedAt } } } } } } }"
+)
+
+
+def timed(function, iterations):
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        function()
+        latencies.append(time.perf_counter() - started)
+    return round(percentile(latencies, 50) * 1000, 3)
+
+
+def measure(rows, iterations, database_uri=None):
+    bench_app = create_benchmark_app(database_uri)
+    bench_app.config["GRAPHQL_MAX_QUERY_COST"] = rows * 10
+    bench_app.add_url_rule(
+        "/graphql/v1", view_func=CustomGraphQLView.as_view("graphql", schema=schema)
+    )
+    events = rows // TICKETS_PER_EVENT
+    with bench_app.app_context():
+        for index in range(events):
+            event_id = create_event(TICKETS_PER_EVENT, name=f"Benchmark Event {index}")
+            seed_sold_tickets(event_id, TICKETS_PER_EVENT)
+
+    response = bench_app.test_client().post(
+        "/graphql/v1",
+        data=json.dumps({"query": QUERY % (events, TICKETS_PER_EVENT)}),
+        content_type="application/json",
+    )
+    assert response.status_code == 200, response.data
+    result = json.loads(response.data)
+    assert "errors" not in result, result["errors"]
+
+    with bench_app.app_context():
+        db.get_engine().dispose()
+
+    stdlib, fast = json_encoder("json"), json_encoder("auto")
+    body = fast(result)
+    body = body if isinstance(body, bytes) else body.encode()
+    measurements = {
+        "rows": rows,
+        "raw_bytes": len(body),
+        "encode_json_p50_ms": timed(lambda: stdlib(result), iterations),
+        "encode_fast_p50_ms": timed(lambda: fast(result), iterations),
+    }
+    for coding in available_encodings():
+        measurements[f"{coding}_bytes"] = len(compress(body, coding))
+        measurements[f"{coding}_p50_ms"] = timed(lambda: compress(body, coding), iterations)
+    return measurements
+
+
+def run(sizes, iterations, database_uri=None):
+    return {f"{size}_rows": measure(size, iterations, database_uri) for size in sizes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--database-uri", default=None)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    for label, result in run(sizes, args.iterations, args.database_uri).items():
+        print(label, " ".join(f"{key}={value}" for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Measures TicketService.sell_ticket throughput against a single hot event.
+
+Usage: python -m benchmarks.bench_sell_ticket [--threads N] [--attempts N] [--capacity N]
+"""
+import argparse
+import threading
+import time
+
+from app import db
+from app.events.models.event_model import Event
+from app.tickets.models.ticket_model import Ticket
+from app.tickets.services.ticket_service import TicketService
+from benchmarks.common import create_benchmark_app, create_event
+
+
+def run(threads, attempts, capacity, database_uri=None, release=None):
+    bench_app = create_benchmark_app(database_uri)
+    with bench_app.app_context():
+        event_id = create_event(total_tickets=capacity)
+
+    counts = {"sold": 0, "rejected": 0}
+    lock = threading.Lock()
+
+    def buyer():
+        sold = rejected = 0
+        for _ in range(attempts):
+            with bench_app.app_context():
+                try:
+                    TicketService.sell_ticket(event_id)
+                    sold += 1
+                except ValueError:
+                    rejected += 1
+        with lock:
+            counts["sold"] += sold
+            counts["rejected"] += rejected
+
+    workers = [threading.Thread(target=buyer) for _ in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    # Seats still leased by the worker go back to the event before counting
+    if release is not None:
+        release(bench_app)
+
+    with bench_app.app_context():
+        issued = Ticket.query.filter_by(event_id=event_id).count()
+        counter = Event.query.get(event_id).sold_tickets
+        db.get_engine().dispose()
+
+    return {
+        "threads": threads,
+        "attempts": threads * attempts,
+        "capacity": capacity,
+        "sold": counts["sold"],
+        "rejected": counts["rejected"],
+        "issued_tickets": issued,
+        "sold_counter": counter,
+        "oversold": max(issued - capacity, 0),
+        "elapsed_s": round(elapsed, 4),
+        "sales_per_s": round(counts["sold"] / elapsed, 1) if elapsed else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--attempts", type=int, default=250)
+    parser.add_argument("--capacity", type=int, default=1500)
+    parser.add_argument("--database-uri", default=None)
+    args = parser.parse_args()
+
+    result = run(args.threads, args.attempts, args.capacity, args.database_uri)
+    for key, value in result.items():
+        print(f"{key:>15}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import os
+import tempfile
+from datetime import date, timedelta
+
+from flask import Flask
+
+from app import db
+from app.events.models.event_model import Event
+from app.tickets.models.ticket_model import Ticket
+
+
+def create_benchmark_app(database_uri=None):
+    """
+    Creates a standalone Flask application bound to an embedded SQLite database.
+
+    A file-backed database is used by default so that worker threads share the
+    same data through separate connections, as they would against MySQL.
+    """
+    if database_uri is None:
+        fd, path = tempfile.mkstemp(prefix="tickets-bench-", suffix=".db")
+        os.close(fd)
+        database_uri = f"sqlite:///{path}"
+
+    bench_app = Flask(__name__)
+    bench_app.config.from_object("config.Config")
+    bench_app.config["SQLALCHEMY_DATABASE_URI"] = database_uri
+    db.init_app(bench_app)
+
+    with bench_app.app_context():
+        db.drop_all()
+        db.create_all()
+    return bench_app
+
+
+def create_event(total_tickets, name="Benchmark Event"):
+    """
+    Inserts an event that is currently within its valid period and returns its ID.
+    """
+    event = Event(
+        name=name,
+        start_date=date.today(),
+        end_date=date.today() + timedelta(days=1),
+        total_tickets=total_tickets,
+        sold_tickets=0,
+    )
+    db.session.add(event)
+    db.session.commit()
+    return event.id
+
+
+def seed_sold_tickets(event_id, count, chunk_size=10000):
+    """
+    Inserts sold tickets for an event in large executemany batches and updates its counter.
+
+    Meant for building large datasets quickly; it bypasses the sale path.
+    """
+    tickets = Ticket.__table__
+    for offset in range(0, count, chunk_size):
+        rows = min(chunk_size, count - offset)
+        db.session.execute(
+            tickets.insert(), [{"event_id": event_id, "status": "sold"}] * rows
+        )
+    events = Event.__table__
+    db.session.execute(
+        events.update()
+        .where(events.c.id == event_id)
+        .values(sold_tickets=events.c.sold_tickets + count)
+    )
+    db.session.commit()
+
+
+def percentile(samples, percent):
+    """
+    Returns the nearest-rank percentile of a list of samples.
+    """
+    ordered = sorted(samples)
+    rank = max(int(round(percent / 100 * len(ordered))) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
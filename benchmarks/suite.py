@@ -0,0 +1,152 @@
+"""
+Runs the benchmark suite on an embedded SQLite database and stores the results as JSON.
+
+Every run is written to --output-dir with the commit it measured, so runs can
+be compared over time; --compare prints the change of every metric against a
+previous result file.
+
+Usage: python -m benchmarks.suite [--quick] [--output-dir DIR] [--compare FILE]
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+from benchmarks import (
+    bench_document_cache,
+    bench_events_query,
+    bench_redeem_ticket,
+    bench_response_encoding,
+    bench_sell_ticket,
+)
+
+# Benchmark parameters of a full run and of a --quick smoke run
+PROFILES = {
+    "full": {
+        "sell_attempts": 250,
+        "sell_threads": 8,
+        "redeem_tickets": 1000,
+        "query_sizes": [1000, 10000, 100000],
+        "query_iterations": 50,
+        "parse_iterations": 200,
+        "encoding_sizes": [1000, 10000],
+        "encoding_iterations": 50,
+    },
+    "quick": {
+        "sell_attempts": 50,
+        "sell_threads": 4,
+        "redeem_tickets": 100,
+        "query_sizes": [1000],
+        "query_iterations": 5,
+        "parse_iterations": 20,
+        "encoding_sizes": [1000],
+        "encoding_iterations": 5,
+    },
+}
+
+
+def run(profile):
+    """
+    Runs every benchmark with the given profile and returns their results by name.
+    """
+    params = PROFILES[profile]
+    attempts = params["sell_attempts"]
+    threads = params["sell_threads"]
+    return {
+        "sell_ticket_single": bench_sell_ticket.run(1, attempts, attempts),
+        "sell_ticket_contended": bench_sell_ticket.run(
+            threads, attempts, threads * attempts
+        ),
+        "redeem_ticket": bench_redeem_ticket.run(params["redeem_tickets"]),
+        "events_query": bench_events_query.run(
+            params["query_sizes"], events=100, iterations=params["query_iterations"]
+        ),
+        "parse_validate": bench_document_cache.run(params["parse_iterations"]),
+        "response_encoding": bench_response_encoding.run(
+            params["encoding_sizes"], params["encoding_iterations"]
+        ),
+    }
+
+
+def metadata(profile):
+    """
+    Describes the environment a run was measured in.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "profile": profile,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def flatten(results, prefix=""):
+    """
+    Flattens nested results into {"benchmark.metric": value} for numeric metrics.
+    """
+    metrics = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            metrics.update(flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            metrics[name] = value
+    return metrics
+
+
+def compare(previous, current):
+    """
+    Returns (metric, previous, current, percent change) for metrics present in both runs.
+    """
+    before = flatten(previous["results"])
+    after = flatten(current["results"])
+    rows = []
+    for name in sorted(before.keys() & after.keys()):
+        change = (after[name] - before[name]) / before[name] * 100 if before[name] else None
+        rows.append((name, before[name], after[name], change))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="small smoke-test sizes")
+    parser.add_argument("--output-dir", default="benchmarks/results")
+    parser.add_argument("--compare", metavar="FILE", help="previous result file")
+    args = parser.parse_args()
+
+    profile = "quick" if args.quick else "full"
+    report = {"meta": metadata(profile), "results": run(profile)}
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    path = os.path.join(args.output_dir, f"{stamp}-{report['meta']['commit'] or 'unknown'}.json")
+    with open(path, "w") as output:
+        json.dump(report, output, indent=2, sort_keys=True)
+    print(f"Results written to {path}")
+
+    if args.compare:
+        with open(args.compare) as previous_file:
+            previous = json.load(previous_file)
+        for name, before, after, change in compare(previous, report):
+            delta = f"{change:+.1f}%" if change is not None else "n/a"
+            print(f"{name:<50} {before:>12} {after:>12} {delta:>9}")
+    else:
+        json.dump(report["results"], sys.stdout, indent=2, sort_keys=True)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import json
 import logging
 import os
 
@@ -12,16 +13,152 @@ class Config:
     SECRET_KEY = "this_is_a_secret_key"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Read replicas as SQLALCHEMY_BINDS keys; none routes every query to the primary
+    DATABASE_REPLICA_BINDS = []
+    # Seconds a client keeps reading from the primary after a write
+    DB_PRIMARY_STICKY_SECONDS = int(os.getenv("DB_PRIMARY_STICKY_SECONDS", 5))
+
+    # Gunicorn settings for `manage.py serve`
+    SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", 4))
+    SERVER_THREADS = int(os.getenv("SERVER_THREADS", 4))
+    SERVER_TIMEOUT = int(os.getenv("SERVER_TIMEOUT", 30))
+    SERVER_GRACEFUL_TIMEOUT = int(os.getenv("SERVER_GRACEFUL_TIMEOUT", 30))
+    # Requests after which a worker is recycled (0 disables recycling)
+    SERVER_MAX_REQUESTS = int(os.getenv("SERVER_MAX_REQUESTS", 0))
+    # PID file of the master, needed to follow a USR2 code upgrade (empty disables it)
+    SERVER_PIDFILE = os.getenv("SERVER_PIDFILE", "")
+
+    # Page sizes for cursor-paginated GraphQL connections
+    GRAPHQL_DEFAULT_PAGE_SIZE = int(os.getenv("GRAPHQL_DEFAULT_PAGE_SIZE", 50))
+    GRAPHQL_MAX_PAGE_SIZE = int(os.getenv("GRAPHQL_MAX_PAGE_SIZE", 100))
+
+    # Static limits checked before a GraphQL operation is executed. The cost estimates
+    # the rows loaded; the depth counts logical levels, without Relay edges/node wrappers
+    GRAPHQL_MAX_QUERY_COST = int(os.getenv("GRAPHQL_MAX_QUERY_COST", 5000))
+    GRAPHQL_MAX_QUERY_DEPTH = int(os.getenv("GRAPHQL_MAX_QUERY_DEPTH", 10))
+    # Items assumed for list fields without a page size when estimating cost
+    GRAPHQL_DEFAULT_LIST_SIZE = int(os.getenv("GRAPHQL_DEFAULT_LIST_SIZE", 20))
+
+    # Read-through cache of event metadata; set a Redis URL to share it between workers
+    EVENT_CACHE_TTL = int(os.getenv("EVENT_CACHE_TTL", 60))
+    EVENT_CACHE_MAX_SIZE = int(os.getenv("EVENT_CACHE_MAX_SIZE", 10000))
+    EVENT_CACHE_REDIS_URL = os.getenv("EVENT_CACHE_REDIS_URL")
+
+    # Seats each worker leases at once for single-ticket sales (0 disables block allocation)
+    TICKET_INVENTORY_BLOCK_SIZE = int(os.getenv("TICKET_INVENTORY_BLOCK_SIZE", 0))
+    # Seconds an unused lease is kept before its seats are returned to the event
+    TICKET_INVENTORY_LEASE_TTL = int(os.getenv("TICKET_INVENTORY_LEASE_TTL", 30))
+
+    # Seconds seats stay on hold before the sweeper releases them
+    TICKET_HOLD_TTL = int(os.getenv("TICKET_HOLD_TTL", 600))
+    # Seconds between sweeps for holds created by other workers
+    TICKET_HOLD_SWEEP_INTERVAL = int(os.getenv("TICKET_HOLD_SWEEP_INTERVAL", 30))
+    # Maximum number of lapsed holds released per transaction
+    TICKET_HOLD_SWEEP_BATCH_SIZE = int(os.getenv("TICKET_HOLD_SWEEP_BATCH_SIZE", 1000))
+
+    # Events inserted per transaction by createEvents and `manage.py import-events`
+    EVENT_IMPORT_CHUNK_SIZE = int(os.getenv("EVENT_IMPORT_CHUNK_SIZE", 500))
+
+    # Tickets fetched from the server-side cursor and written per chunk by the export route
+    TICKET_EXPORT_CHUNK_SIZE = int(os.getenv("TICKET_EXPORT_CHUNK_SIZE", 1000))
+
+    # Seconds between writes of the sales rollups each worker buffers in memory
+    SALES_ROLLUP_FLUSH_INTERVAL = int(os.getenv("SALES_ROLLUP_FLUSH_INTERVAL", 5))
+    # Seconds per-minute sales rollups are kept before being merged into hour buckets
+    SALES_ROLLUP_MINUTE_RETENTION = int(os.getenv("SALES_ROLLUP_MINUTE_RETENTION", 86400))
+    # Seconds between compactions, and minute buckets merged per transaction
+    SALES_ROLLUP_COMPACT_INTERVAL = int(os.getenv("SALES_ROLLUP_COMPACT_INTERVAL", 300))
+    SALES_ROLLUP_COMPACT_BATCH_SIZE = int(
+        os.getenv("SALES_ROLLUP_COMPACT_BATCH_SIZE", 5000)
+    )
+
+    # Threads running the blocking WSGI requests of the ASGI entry point
+    ASYNC_THREAD_POOL_SIZE = int(os.getenv("ASYNC_THREAD_POOL_SIZE", 32))
+
+    # Current and upcoming events whose metadata is loaded into the cache at startup
+    STARTUP_WARMUP_EVENTS = int(os.getenv("STARTUP_WARMUP_EVENTS", 1000))
+
+    # Share of scalar field resolutions timed by the resolver metrics middleware
+    GRAPHQL_METRICS_SCALAR_SAMPLE_RATE = float(
+        os.getenv("GRAPHQL_METRICS_SCALAR_SAMPLE_RATE", 0.01)
+    )
+
+    # Report per-request SQL statements, time and rows in GraphQL extensions (debugging aid)
+    GRAPHQL_SQL_PROFILING = os.getenv("GRAPHQL_SQL_PROFILING", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    # Times one statement shape may run in a request before it is flagged as N+1
+    GRAPHQL_SQL_REPEAT_THRESHOLD = int(os.getenv("GRAPHQL_SQL_REPEAT_THRESHOLD", 5))
+
+    # Tag read-only GET operations with an ETag and answer If-None-Match with 304
+    GRAPHQL_HTTP_CACHE = os.getenv("GRAPHQL_HTTP_CACHE", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    # Cache-Control of those responses by operation name, e.g. {"Storefront": "public, max-age=10"};
+    # no-cache lets browsers and proxies keep the body but revalidate it every time
+    GRAPHQL_CACHE_CONTROL = json.loads(os.getenv("GRAPHQL_CACHE_CONTROL", "{}"))
+    GRAPHQL_DEFAULT_CACHE_CONTROL = os.getenv("GRAPHQL_DEFAULT_CACHE_CONTROL", "no-cache")
+    # Seconds each worker reuses the data version behind those ETags; writes made
+    # through another worker can go unnoticed for that long
+    GRAPHQL_DATA_VERSION_TTL = int(os.getenv("GRAPHQL_DATA_VERSION_TTL", 1))
+
+    # JSON encoder of GraphQL responses: auto (orjson when installed), orjson or json
+    GRAPHQL_JSON_ENCODER = os.getenv("GRAPHQL_JSON_ENCODER", "auto")
+    # Smallest GraphQL response compressed with gzip, or brotli when installed (0 disables)
+    GRAPHQL_COMPRESSION_MIN_SIZE = int(os.getenv("GRAPHQL_COMPRESSION_MIN_SIZE", 1024))
+
+    # Maximum number of parsed and validated GraphQL documents kept per process
+    GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.getenv("GRAPHQL_DOCUMENT_CACHE_SIZE", 500))
+
+    @staticmethod
+    def get_engine_options(
+        pool_size, max_overflow, pool_timeout=30, pool_recycle=1800, pool_pre_ping=True
+    ):
+        """
+        Builds the SQLAlchemy engine options of an environment.
+        Each default can be overridden with the matching DB_* environment variable.
+        """
+        return {
+            # Persistent connections per worker, plus temporary ones under spikes
+            "pool_size": int(os.getenv("DB_POOL_SIZE", pool_size)),
+            "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", max_overflow)),
+            # Seconds a request waits for a free connection before failing
+            "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", pool_timeout)),
+            # Reconnect before MySQL's wait_timeout closes idle connections
+            "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", pool_recycle)),
+            # Test each connection on checkout and replace it if the server dropped it
+            "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", str(pool_pre_ping)).lower()
+            in ("1", "true", "yes"),
+        }
+
     @staticmethod
-    def get_database_uri():
+    def get_database_uri(host=None, port=None):
         """
         Constructs the SQLAlchemy database URI from environment variables.
         """
+        host = host or os.getenv("DB_HOST")
+        port = port or os.getenv("DB_PORT")
         return (
             f"mysql+pymysql://{os.getenv('DB_USERNAME')}:{os.getenv('DB_PASSWORD')}@"
-            f"{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_DATABASE')}"
+            f"{host}:{port}/{os.getenv('DB_DATABASE')}"
         )
 
+    @staticmethod
+    def get_replica_binds():
+        """
+        Builds one bind per read replica listed in DB_REPLICA_HOSTS ("host[:port],...").
+        """
+        binds = {}
+        hosts = [host.strip() for host in os.getenv("DB_REPLICA_HOSTS", "").split(",")]
+        for index, address in enumerate(host for host in hosts if host):
+            host, _, port = address.partition(":")
+            binds[f"replica_{index}"] = Config.get_database_uri(host, port or None)
+        return binds
+
 
 class DevelopmentConfig(Config):
     """
@@ -30,6 +167,9 @@ class DevelopmentConfig(Config):
 
     DEBUG = True
     SQLALCHEMY_DATABASE_URI = Config.get_database_uri()
+    SQLALCHEMY_ENGINE_OPTIONS = Config.get_engine_options(pool_size=5, max_overflow=10)
+    SQLALCHEMY_BINDS = Config.get_replica_binds()
+    DATABASE_REPLICA_BINDS = list(SQLALCHEMY_BINDS)
 
     # Optionally log the database URI for debugging; remove in production
     logging.debug(SQLALCHEMY_DATABASE_URI)
@@ -42,3 +182,8 @@ class TestingConfig(Config):
 
     DEBUG = False
     SQLALCHEMY_DATABASE_URI = Config.get_database_uri()
+    SQLALCHEMY_ENGINE_OPTIONS = Config.get_engine_options(
+        pool_size=2, max_overflow=2, pool_timeout=10
+    )
+    SQLALCHEMY_BINDS = Config.get_replica_binds()
+    DATABASE_REPLICA_BINDS = list(SQLALCHEMY_BINDS)
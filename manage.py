@@ -1,6 +1,9 @@
-from flask_script import Manager, Server
+from flask_migrate import MigrateCommand
+from flask_script import Manager
 
 from app import create_app
+from app.events.event_import import ImportEvents
+from app.server import DevelopmentServer, Serve
 
 # Initialize the Flask application
 app = create_app()
@@ -8,9 +11,19 @@ manager = Manager(app)
 
 # Add the runserver command with environment-based debugging
 manager.add_command(
-    "runserver", Server(host="0.0.0.0", port=5000, use_debugger=app.config["DEBUG"])
+    "runserver",
+    DevelopmentServer(host="0.0.0.0", port=5000, use_debugger=app.config["DEBUG"]),
 )
 
+# Add the production server command (Gunicorn, pre-forked workers)
+manager.add_command("serve", Serve(host="0.0.0.0", port=5000))
+
+# Add the bulk event import command (import-events <file.csv|file.json>)
+manager.add_command("import-events", ImportEvents())
+
+# Add the database migration commands (db upgrade, db migrate, db downgrade...)
+manager.add_command("db", MigrateCommand)
+
 if __name__ == "__main__":
     """
     Entry point for running the application with Flask-Script.
@@ -0,0 +1,52 @@
+"""initial schema
+
+Revision ID: 3f1c2a9d4b7e
+Revises:
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9d4b7e'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases created by the former db.create_all() call already have these
+    # tables; only create what is missing so they can adopt migrations in place.
+    existing_tables = sa.inspect(op.get_bind()).get_table_names()
+
+    if 'events' not in existing_tables:
+        op.create_table(
+            'events',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=256), nullable=False),
+            sa.Column('start_date', sa.Date(), nullable=False),
+            sa.Column('end_date', sa.Date(), nullable=False),
+            sa.Column('total_tickets', sa.Integer(), nullable=False),
+            sa.Column('sold_tickets', sa.Integer(), nullable=True),
+            sa.Column('redeemed_tickets', sa.Integer(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+        )
+
+    if 'tickets' not in existing_tables:
+        op.create_table(
+            'tickets',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('redeemed_at', sa.DateTime(), nullable=True),
+            sa.Column('status', sa.String(length=50), nullable=True),
+            sa.Column('event_id', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['event_id'], ['events.id']),
+            sa.PrimaryKeyConstraint('id'),
+        )
+
+
+def downgrade():
+    op.drop_table('tickets')
+    op.drop_table('events')
@@ -0,0 +1,42 @@
+"""add ticket and event indexes
+
+Revision ID: 8d5e0b6a1c42
+Revises: 3f1c2a9d4b7e
+Create Date: 2026-10-18 10:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d5e0b6a1c42'
+down_revision = '3f1c2a9d4b7e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_tickets_event_id_status', 'tickets', ['event_id', 'status'], unique=False
+    )
+    op.create_index(
+        'ix_tickets_event_id_redeemed_at',
+        'tickets',
+        ['event_id', 'redeemed_at'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_events_start_date_end_date',
+        'events',
+        ['start_date', 'end_date'],
+        unique=False,
+    )
+
+
+def downgrade():
+    # MySQL needs an index on tickets.event_id to keep enforcing the foreign key
+    op.create_index('ix_tickets_event_id', 'tickets', ['event_id'], unique=False)
+    op.drop_index('ix_events_start_date_end_date', table_name='events')
+    op.drop_index('ix_tickets_event_id_redeemed_at', table_name='tickets')
+    op.drop_index('ix_tickets_event_id_status', table_name='tickets')
@@ -0,0 +1,25 @@
+"""add tickets (event_id, id) index
+
+Revision ID: a8d2f5b7c3e9
+Revises: f7c9a2e4d6b1
+Create Date: 2026-10-18 12:40:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8d2f5b7c3e9'
+down_revision = 'f7c9a2e4d6b1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_tickets_event_id_id', 'tickets', ['event_id', 'id'], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_tickets_event_id_id', table_name='tickets')
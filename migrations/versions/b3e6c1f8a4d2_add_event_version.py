@@ -0,0 +1,28 @@
+"""add event version
+
+Revision ID: b3e6c1f8a4d2
+Revises: a8d2f5b7c3e9
+Create Date: 2026-10-18 13:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e6c1f8a4d2'
+down_revision = 'a8d2f5b7c3e9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'events',
+        sa.Column('version', sa.Integer(), nullable=False, server_default='1'),
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('events') as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,47 @@
+"""add ticket holds
+
+Revision ID: c2b7e4f19a30
+Revises: 8d5e0b6a1c42
+Create Date: 2026-10-18 10:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2b7e4f19a30'
+down_revision = '8d5e0b6a1c42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'events',
+        sa.Column('held_tickets', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.create_table(
+        'ticket_holds',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=50), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['event_id'], ['events.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_ticket_holds_status_expires_at',
+        'ticket_holds',
+        ['status', 'expires_at'],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_ticket_holds_status_expires_at', table_name='ticket_holds')
+    op.drop_table('ticket_holds')
+    with op.batch_alter_table('events') as batch_op:
+        batch_op.drop_column('held_tickets')
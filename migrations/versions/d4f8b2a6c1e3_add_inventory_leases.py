@@ -0,0 +1,39 @@
+"""add inventory leases
+
+Revision ID: d4f8b2a6c1e3
+Revises: b3e6c1f8a4d2
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4f8b2a6c1e3'
+down_revision = 'b3e6c1f8a4d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'inventory_leases',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.Column('remaining', sa.Integer(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['event_id'], ['events.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_inventory_leases_expires_at',
+        'inventory_leases',
+        ['expires_at'],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_inventory_leases_expires_at', table_name='inventory_leases')
+    op.drop_table('inventory_leases')
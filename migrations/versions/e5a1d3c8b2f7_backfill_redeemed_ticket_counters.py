@@ -0,0 +1,28 @@
+"""backfill redeemed ticket counters
+
+Revision ID: e5a1d3c8b2f7
+Revises: c2b7e4f19a30
+Create Date: 2026-10-18 11:20:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a1d3c8b2f7'
+down_revision = 'c2b7e4f19a30'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Redemptions were not counted until now; recount them from the tickets
+    op.execute(
+        "UPDATE events SET redeemed_tickets = ("
+        "SELECT COUNT(*) FROM tickets "
+        "WHERE tickets.event_id = events.id AND tickets.redeemed_at IS NOT NULL)"
+    )
+
+
+def downgrade():
+    pass
@@ -0,0 +1,33 @@
+"""add sales rollups
+
+Revision ID: f7c9a2e4d6b1
+Revises: e5a1d3c8b2f7
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7c9a2e4d6b1'
+down_revision = 'e5a1d3c8b2f7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'sales_rollups',
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.Column('granularity', sa.String(length=10), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(), nullable=False),
+        sa.Column('sold', sa.Integer(), nullable=False),
+        sa.Column('redeemed', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['event_id'], ['events.id'], ),
+        sa.PrimaryKeyConstraint('event_id', 'granularity', 'bucket_start')
+    )
+
+
+def downgrade():
+    op.drop_table('sales_rollups')